@@ -1,13 +1,15 @@
 from .datetime_pomes import (
-    TZ_LOCAL, DateFormat, DatetimeFormat,
+    TZ_LOCAL, DATETIME_PARSE_CACHE_SIZE, DateFormat, DatetimeFormat,
     date_reformat, date_weekday,
-    date_parse, datetime_parse,
+    date_parse, datetime_parse, datetime_parse_many, datetime_parse_stats,
+    datetime_cache_stats, datetime_cache_clear,
     timestamp_interval, timestamp_duration
 )
 from .dict_pomes import (
+    KeyPath, TransformPlan, dict_key_path, dict_compile_transform,
     dict_has_key, dict_has_value, dict_get_value, dict_set_value,
     dict_reduce, dict_listify, dict_transform, dict_merge, dict_coalesce,
-    dict_clone, dict_get_key, dict_get_keys, dict_from_object, dict_from_list,
+    dict_clone, dict_clone_many, dict_get_key, dict_get_keys, dict_from_object, dict_from_list,
     dict_replace_value, dict_pop, dict_pop_all, dict_unique_values,
     dict_jsonify, dict_hexify, dict_stringify
 )
@@ -15,28 +17,32 @@ from .email_pomes import (
     EmailParam, email_setup, email_send, email_codify,
 )
 from .encoding_pomes import (
-    encode_ascii_hex, decode_ascii_hex
+    AsciiHexEncoder, AsciiHexDecoder,
+    encode_ascii_hex, decode_ascii_hex, encode_ascii_hex_file, decode_ascii_hex_file
 )
 from .env_pomes import (
-    APP_PREFIX,
+    APP_PREFIX, EnvConfig,
     env_get_str, env_get_strs,
     env_get_int, env_get_ints,
     env_get_float, env_get_floats,
     env_get_enum, env_get_enums,
     env_get_bool, env_get_bytes,
-    env_get_date, env_get_path, env_get_obj, env_is_docker
+    env_get_date, env_get_path, env_get_obj, env_is_docker,
+    env_add_source, env_clear_sources
 )
 from .file_pomes import (
-    TEMP_FOLDER, Mimetype,
-    file_get_data, file_get_extension,
-    file_get_mimetype, file_is_binary
+    TEMP_FOLDER, FILE_SNIFF_HEAD, FILE_SNIFF_TAIL,
+    FILE_MIMETYPE_CACHE_SIZE, FILE_MIMETYPE_CACHE_PERSIST, Mimetype,
+    file_get_data, file_iter_chunks, file_get_extension,
+    file_get_mimetype, file_is_binary, file_classify_tree,
+    file_mimetype_cache_stats, file_mimetype_cache_clear, file_mimetype_cache_save
 )
 from .func_pomes import (
     func_capture_args, func_defaulted_args, func_specified_args,
     func_capture_params, func_defaulted_params, func_specified_params
 )
 from .list_pomes import (
-    list_compare, list_correlate, list_bin_search,
+    list_compare, list_correlate, list_correlate_sorted, list_bin_search,
     list_flatten, list_unflatten, list_get_coupled,
     list_elem_starting_with, list_elem_with_attr, list_transform,
     list_prune_duplicates, list_prune_in, list_prune_not_in,
@@ -58,10 +64,12 @@ from .validation_msgs import (
     validate_set_msgs, validate_update_msgs
 )
 from .validation_pomes import (
-    VALIDATION_MSG_LANGUAGE, VALIDATION_MSG_PREFIX, MsgLang, IntStrEnum,
+    VALIDATION_MSG_LANGUAGE, VALIDATION_MSG_PREFIX, VALIDATION_LAZY_ERRORS,
+    MsgLang, IntStrEnum, ValidationError, ValidationSchema,
     validate_value, validate_bool, validate_int, validate_decimal,
     validate_str, validate_date, validate_datetime, validate_enum,
     validate_email, validate_pwd, validate_cron, validate_ints, validate_strs,
+    validate_bool_column, validate_int_column, validate_decimal_column, validate_str_column,
     validate_format_error, validate_format_errors, validate_unformat_errors
 )
 from .xml_pomes import (
@@ -73,37 +81,43 @@ __all__ = [
     # __init__
     "pypomes_versions",
     # datetime_pomes
-    "TZ_LOCAL", "DateFormat", "DatetimeFormat",
+    "TZ_LOCAL", "DATETIME_PARSE_CACHE_SIZE", "DateFormat", "DatetimeFormat",
     "date_reformat", "date_weekday",
-    "date_parse", "datetime_parse",
+    "date_parse", "datetime_parse", "datetime_parse_many", "datetime_parse_stats",
+    "datetime_cache_stats", "datetime_cache_clear",
     "timestamp_interval", "timestamp_duration",
     # dict_pomes
+    "KeyPath", "TransformPlan", "dict_key_path", "dict_compile_transform",
     "dict_has_key", "dict_has_value", "dict_get_value", "dict_set_value",
     "dict_reduce", "dict_listify", "dict_transform", "dict_merge", "dict_coalesce",
-    "dict_clone", "dict_get_key", "dict_get_keys", "dict_from_object", "dict_from_list",
+    "dict_clone", "dict_clone_many", "dict_get_key", "dict_get_keys", "dict_from_object", "dict_from_list",
     "dict_replace_value", "dict_pop", "dict_pop_all", "dict_unique_values",
     "dict_jsonify", "dict_hexify", "dict_stringify",
     # email_pomes
     "EmailParam", "email_setup", "email_send", "email_codify",
     # encoding_pomes
-    "encode_ascii_hex", "decode_ascii_hex",
+    "AsciiHexEncoder", "AsciiHexDecoder",
+    "encode_ascii_hex", "decode_ascii_hex", "encode_ascii_hex_file", "decode_ascii_hex_file",
     # env_pomes
-    "APP_PREFIX",
+    "APP_PREFIX", "EnvConfig",
     "env_get_str", "env_get_strs",
     "env_get_int", "env_get_ints",
     "env_get_float", "env_get_floats",
     "env_get_enum",  "env_get_enums",
     "env_get_bool", "env_get_bytes",
     "env_get_date", "env_get_path", "env_get_obj", "env_is_docker",
+    "env_add_source", "env_clear_sources",
     # file_pomes
-    "TEMP_FOLDER", "Mimetype",
-    "file_get_data", "file_get_extension",
-    "file_get_mimetype", "file_is_binary",
+    "TEMP_FOLDER", "FILE_SNIFF_HEAD", "FILE_SNIFF_TAIL",
+    "FILE_MIMETYPE_CACHE_SIZE", "FILE_MIMETYPE_CACHE_PERSIST", "Mimetype",
+    "file_get_data", "file_iter_chunks", "file_get_extension",
+    "file_get_mimetype", "file_is_binary", "file_classify_tree",
+    "file_mimetype_cache_stats", "file_mimetype_cache_clear", "file_mimetype_cache_save",
     # func_pomes
     "func_capture_args", "func_defaulted_args", "func_specified_args",
     "func_capture_params", "func_defaulted_params", "func_specified_params",
     # list_pomes
-    "list_compare", "list_correlate", "list_bin_search",
+    "list_compare", "list_correlate", "list_correlate_sorted", "list_bin_search",
     "list_flatten", "list_unflatten", "list_get_coupled",
     "list_elem_starting_with", "list_elem_with_attr", "list_transform",
     "list_prune_duplicates", "list_prune_in", "list_prune_not_in",
@@ -121,10 +135,12 @@ __all__ = [
     # validation_msgs
     "validate_set_msgs", "validate_update_msgs",
     # validation_pomes
-    "VALIDATION_MSG_LANGUAGE", "VALIDATION_MSG_PREFIX", "MsgLang", "IntStrEnum",
+    "VALIDATION_MSG_LANGUAGE", "VALIDATION_MSG_PREFIX", "VALIDATION_LAZY_ERRORS",
+    "MsgLang", "IntStrEnum", "ValidationError", "ValidationSchema",
     "validate_value", "validate_bool", "validate_int", "validate_decimal",
     "validate_str", "validate_date", "validate_datetime", "validate_enum",
     "validate_email", "validate_pwd", "validate_cron", "validate_ints", "validate_strs",
+    "validate_bool_column", "validate_int_column", "validate_decimal_column", "validate_str_column",
     "validate_format_error", "validate_format_errors", "validate_unformat_errors",
     # xml_pomes
     "XML_FILE_HEADER",
@@ -1,16 +1,23 @@
+import re
+import threading
+from collections import OrderedDict
+from contextlib import suppress
 from datetime import date, datetime, timedelta
 from dateutil import parser
-from dateutil.parser import ParserError
 from enum import StrEnum
 from typing import Any, Final
 from zoneinfo import ZoneInfo
 
-from .env_pomes import APP_PREFIX, env_get_str
+from .env_pomes import APP_PREFIX, env_get_int, env_get_str
 
 # HAZARD: requires 'tzdata' package installed to work
 TZ_LOCAL: Final[ZoneInfo] = ZoneInfo(key=env_get_str(key=f"{APP_PREFIX}_TZ_LOCAL",
                                                      def_value="America/Sao_Paulo"))
 
+# the maximum number of entries in the parse cache (the cache is disabled, unless this is positive)
+DATETIME_PARSE_CACHE_SIZE: Final[int] = env_get_int(key=f"{APP_PREFIX}_DATETIME_PARSE_CACHE_SIZE",
+                                                    def_value=0)
+
 
 class DateFormat(StrEnum):
     """
@@ -30,6 +37,82 @@ class DatetimeFormat(StrEnum):
     INV = "%Y-%m-%d %H:%M:%S"
 
 
+# the ISO-8601 representations handled by 'datetime.fromisoformat()' exactly as by 'dateutil'
+# (representations with timezone information are left for 'dateutil')
+_ISO_REGEX: Final[re.Pattern] = re.compile(r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?)?")
+
+# the layouts attempted with 'datetime.strptime()', by whether the day comes before the month:
+#   - each layout lists its formats in the order 'dateutil' would interpret an ambiguous date
+#   - the layouts are reordered as they are used, the most recently successful coming first
+_DT_LAYOUTS: Final[dict[bool, list[tuple[str, ...]]]] = {
+    False: [
+        (DateFormat.STD.value, "%d/%m/%Y"),
+        (DatetimeFormat.STD.value, "%d/%m/%Y %H:%M:%S"),
+        (DateFormat.COMPACT.value,),
+        (DatetimeFormat.COMPACT.value,),
+        (DateFormat.INV.value,),
+        (DatetimeFormat.INV.value,)
+    ],
+    True: [
+        ("%d/%m/%Y", DateFormat.STD.value),
+        ("%d/%m/%Y %H:%M:%S", DatetimeFormat.STD.value),
+        ("%Y%d%m", DateFormat.COMPACT.value),
+        ("%Y%d%m%H%M%S", DatetimeFormat.COMPACT.value),
+        ("%Y-%d-%m", DateFormat.INV.value),
+        ("%Y-%d-%m %H:%M:%S", DatetimeFormat.INV.value)
+    ]
+}
+
+# the parser arguments supported by the fast tiers
+_FAST_KWARGS: Final[frozenset[str]] = frozenset(["dayfirst", "yearfirst"])
+
+# the number of parsings resolved by each tier
+_PARSE_STATS: Final[dict[str, int]] = {
+    "iso": 0,
+    "strptime": 0,
+    "dateutil": 0,
+    "failed": 0
+}
+_PARSE_LOCK: Final[threading.Lock] = threading.Lock()
+
+# the parse cache, keyed by date string and parser arguments, the most recently used entries coming last
+_PARSE_CACHE: Final[OrderedDict[tuple[str, tuple], datetime]] = OrderedDict()
+_CACHE_STATS: Final[dict[str, int]] = {
+    "hits": 0,
+    "misses": 0,
+    "evictions": 0
+}
+_CACHE_LOCK: Final[threading.Lock] = threading.Lock()
+
+# the date orders attempted in inferring the format of a column of dates,
+# by preference for each combination of 'dayfirst' and 'yearfirst'
+_INFER_ORDERS: Final[dict[tuple[bool, bool], tuple[str, ...]]] = {
+    (False, False): ("mdY", "dmY", "Ymd", "Ydm"),
+    (True, False): ("dmY", "mdY", "Ydm", "Ymd"),
+    (False, True): ("Ymd", "Ydm", "mdY", "dmY"),
+    (True, True): ("Ydm", "Ymd", "dmY", "mdY")
+}
+
+# the time-of-day layouts attempted in inferring the format of a column of dates, by date separator
+__TIMES: Final[tuple[str, ...]] = ("", " %H:%M", " %H:%M:%S", " %H:%M:%S.%f", "T%H:%M", "T%H:%M:%S", "T%H:%M:%S.%f")
+_INFER_TIMES: Final[dict[str, tuple[str, ...]]] = {
+    "/": __TIMES,
+    "-": __TIMES,
+    ".": __TIMES,
+    "": ("", "%H%M%S")
+}
+
+# the candidate formats in inferring the format of a column of dates, by shape of the date strings
+# (built as needed, for each combination of 'dayfirst' and 'yearfirst')
+_INFER_FORMATS: Final[dict[tuple[bool, bool], dict[str, list[str]]]] = {}
+
+# the shape of a date string is obtained by replacing each of its runs of digits with '0'
+_SHAPE_REGEX: Final[re.Pattern] = re.compile(r"\d+")
+
+# the default number of values sampled in inferring the format of a column of dates
+_INFER_SAMPLE_SIZE: Final[int] = 64
+
+
 def date_reformat(dt_str: str,
                   to_format: str,
                   **kwargs: Any) -> str | None:
@@ -55,8 +138,8 @@ def date_reformat(dt_str: str,
     :return: the converted date, or *None* if the convertion was not possible
     """
     result: str | None = None
-    ts: datetime = parser.parse(timestr=dt_str,
-                                **kwargs)
+    ts: datetime = _datetime_parse(dt_str=dt_str,
+                                   **kwargs)
     if ts:
         result = ts.strftime(to_format)
 
@@ -113,9 +196,9 @@ def date_parse(dt_str: str,
     result: date | None
 
     try:
-        result = parser.parse(timestr=dt_str,
-                              **kwargs).date()
-    except (TypeError, ParserError, OverflowError):
+        result = _datetime_parse(dt_str=dt_str,
+                                 **kwargs).date()
+    except (TypeError, ValueError, OverflowError):
         result = None
 
     return result
@@ -144,14 +227,353 @@ def datetime_parse(dt_str: str,
     result: datetime | None
 
     try:
-        result = parser.parse(timestr=dt_str,
-                              **kwargs)
-    except (TypeError, ParserError, OverflowError):
+        result = _datetime_parse(dt_str=dt_str,
+                                 **kwargs)
+    except (TypeError, ValueError, OverflowError):
         result = None
 
     return result
 
 
+def datetime_parse_many(values: list[str],
+                        dayfirst: bool = False,
+                        yearfirst: bool = False,
+                        sample_size: int = None) -> tuple[list[datetime | None], list[int]]:
+    """
+    Obtain and return the *datetime* objects corresponding to the date strings in *values*.
+
+    This is intended for columns of dates, as found in imported files. A single format consistent
+    with *values* is inferred from a sample of up to *sample_size* of its elements, evenly spread,
+    among the formats combining:
+        - the date orders *month-day-year*, *day-month-year*, *year-month-day*, and *year-day-month*,
+          preferred as indicated by *dayfirst* and *yearfirst*
+        - the date separators '/', '-', '.', or none
+        - the time-of-day as *HH:MM*, *HH:MM:SS*, or *HH:MM:SS.ffffff*, following a space or a 'T', or none
+    The format fitting most of the sample is then used to parse all of *values* with *datetime.strptime()*,
+    and the elements not fitting it are parsed individually, as done by *datetime_parse()*.
+
+    Note that an ambiguous date string (e.g., '05/01/2024') is interpreted as the inferred format dictates,
+    regardless of *dayfirst* (e.g., as *day-month-year*, if '13/01/2024' is found in the sample).
+
+    :param values: the date strings, in a supported format
+    :param dayfirst: whether *day* comes before *month* in an ambiguous date (defaults to *False*)
+    :param yearfirst: whether *year* comes before *month* in an ambiguous date (defaults to *False*)
+    :param sample_size: optional number of elements to sample in inferring the format, defaults to 64
+    :return: the corresponding *datetime* objects (*None* for failures), and the positions of the failures
+    """
+    # initialize the return variables
+    result: list[datetime | None] = []
+    failures: list[int] = []
+
+    # normalize the sample size
+    if isinstance(sample_size, bool) or \
+       not isinstance(sample_size, int) or sample_size <= 0:
+        sample_size = _INFER_SAMPLE_SIZE
+
+    # infer the format
+    fmt: str | None = _infer_format(values=values,
+                                    sample_size=sample_size,
+                                    dayfirst=bool(dayfirst),
+                                    yearfirst=bool(yearfirst))
+    layout: tuple[str, ...] = (fmt,) if fmt else ()
+    # ISO-8601 formats are better handled by 'datetime.fromisoformat()'
+    iso: bool = bool(fmt) and fmt.startswith(DateFormat.INV.value)
+    hits: int = 0
+    for pos, value in enumerate(values):
+        ts: datetime | None = None
+        if iso and isinstance(value, str):
+            with suppress(ValueError):
+                ts = datetime.fromisoformat(value)
+        elif isinstance(value, str):
+            ts = _strptime_layout(dt_str=value,
+                                  layout=layout)
+        if ts:
+            hits += 1
+        else:
+            # the element does not fit the inferred format
+            ts = datetime_parse(dt_str=value,
+                                dayfirst=dayfirst,
+                                yearfirst=yearfirst)
+            if not ts:
+                failures.append(pos)
+        result.append(ts)
+
+    # register the parsings resolved by the inferred format
+    if hits:
+        with _PARSE_LOCK:
+            _PARSE_STATS["iso" if iso else "strptime"] += hits
+
+    return result, failures
+
+
+def datetime_parse_stats(reset: bool = False) -> dict[str, int]:
+    """
+    Retrieve the number of parsings resolved by each tier of the date and datetime parser.
+
+    The parsing of a date or datetime string is attempted, in order, by:
+        - *iso*: *datetime.fromisoformat()*, for ISO-8601 representations without timezone information
+        - *strptime*: *datetime.strptime()*, for the layouts in *DateFormat* and *DatetimeFormat*,
+          and for their day-first counterparts
+        - *dateutil*: the parser in *python-dateutil*, as the last resort
+    The parsings not resolved by any tier are counted as *failed*.
+
+    :param reset: whether to reset the counters, after retrieving them
+    :return: the number of parsings resolved by each tier
+    """
+    with _PARSE_LOCK:
+        result: dict[str, int] = dict(_PARSE_STATS)
+        if reset:
+            for key in _PARSE_STATS:
+                _PARSE_STATS[key] = 0
+
+    return result
+
+
+def datetime_cache_stats(reset: bool = False) -> dict[str, int]:
+    """
+    Retrieve the statistics of the parse cache for dates and datetimes.
+
+    The parse cache is enabled by setting the environment variable *<APP_PREFIX>_DATETIME_PARSE_CACHE_SIZE*
+    to the maximum number of entries it may hold. The statistics returned are:
+        - *size*: the maximum number of entries
+        - *entries*: the current number of entries
+        - *hits*: the number of parsings resolved by the cache
+        - *misses*: the number of parsings not resolved by the cache
+        - *evictions*: the number of least recently used entries discarded to make room for new ones
+
+    :param reset: whether to reset the *hits*, *misses*, and *evictions* counters, after retrieving them
+    :return: the statistics of the parse cache
+    """
+    with _CACHE_LOCK:
+        result: dict[str, int] = {"size": DATETIME_PARSE_CACHE_SIZE,
+                                  "entries": len(_PARSE_CACHE)} | _CACHE_STATS
+        if reset:
+            for key in _CACHE_STATS:
+                _CACHE_STATS[key] = 0
+
+    return result
+
+
+def datetime_cache_clear() -> None:
+    """
+    Discard all entries in the parse cache for dates and datetimes.
+    """
+    with _CACHE_LOCK:
+        _PARSE_CACHE.clear()
+
+
+def _datetime_parse(dt_str: str,
+                    **kwargs: Any) -> datetime:
+    """
+    Parse *dt_str* into a *datetime* object, through the parse cache, if it is enabled.
+
+    The parse cache is keyed by *dt_str* and *kwargs*, and parsings with unhashable arguments are not cached.
+    As *datetime* objects are immutable, the cached objects are returned as is.
+
+    :param dt_str: the date, in a supported format
+    :param kwargs: optional arguments for the parser in python-dateutil
+    :return: the corresponding *datetime* object
+    :raises TypeError: *dt_str* is not a string
+    :raises ValueError: *dt_str* does not contain a valid date
+    :raises OverflowError: the date in *dt_str* is out of range
+    """
+    # declare the return variable
+    result: datetime | None = None
+
+    key: tuple[str, tuple] | None = None
+    if DATETIME_PARSE_CACHE_SIZE > 0:
+        key = (dt_str, tuple(sorted(kwargs.items())))
+        try:
+            with _CACHE_LOCK:
+                result = _PARSE_CACHE.get(key)
+                if result is None:
+                    _CACHE_STATS["misses"] += 1
+                else:
+                    _CACHE_STATS["hits"] += 1
+                    _PARSE_CACHE.move_to_end(key)
+        except TypeError:
+            # unhashable arguments
+            key = None
+
+    if result is None:
+        result = _datetime_parse_tiers(dt_str=dt_str,
+                                       **kwargs)
+        if key:
+            with _CACHE_LOCK:
+                _PARSE_CACHE[key] = result
+                _PARSE_CACHE.move_to_end(key)
+                if len(_PARSE_CACHE) > DATETIME_PARSE_CACHE_SIZE:
+                    # discard the least recently used entry
+                    _PARSE_CACHE.popitem(last=False)
+                    _CACHE_STATS["evictions"] += 1
+
+    return result
+
+
+def _datetime_parse_tiers(dt_str: str,
+                          **kwargs: Any) -> datetime:
+    """
+    Parse *dt_str*, in tiers, into a *datetime* object.
+
+    Each tier is attempted only if the previous ones fail, and the fast tiers (*datetime.fromisoformat()*
+    and *datetime.strptime()*) are attempted only if they would yield the same result as *dateutil*.
+    A format given in *kwargs* as *fmt* is used directly with *datetime.strptime()*.
+
+    :param dt_str: the date, in a supported format
+    :param kwargs: optional arguments for the parser in python-dateutil
+    :return: the corresponding *datetime* object
+    :raises TypeError: *dt_str* is not a string
+    :raises ValueError: *dt_str* does not contain a valid date
+    :raises OverflowError: the date in *dt_str* is out of range
+    """
+    # declare the return variable
+    result: datetime | None = None
+
+    tier: str = "dateutil"
+    if isinstance(dt_str, str) and kwargs.keys() <= _FAST_KWARGS:
+        dayfirst: bool = bool(kwargs.get("dayfirst"))
+        # attempt 'datetime.fromisoformat()'
+        if not dayfirst and _ISO_REGEX.fullmatch(dt_str):
+            tier = "iso"
+            with suppress(ValueError):
+                result = datetime.fromisoformat(dt_str)
+        else:
+            # attempt 'datetime.strptime()' with the known layouts
+            layouts: list[tuple[str, ...]] = _DT_LAYOUTS[dayfirst]
+            for layout in list(layouts):
+                result = _strptime_layout(dt_str=dt_str,
+                                          layout=layout)
+                if result:
+                    tier = "strptime"
+                    if layout is not layouts[0]:
+                        # move the successful layout to the front
+                        with _PARSE_LOCK, suppress(ValueError):
+                            layouts.remove(layout)
+                            layouts.insert(0, layout)
+                    break
+    elif "fmt" in kwargs:
+        tier = "strptime"
+        with suppress(TypeError, ValueError):
+            result = datetime.strptime(dt_str, kwargs["fmt"])  # noqa: DTZ007
+
+    if not result:
+        tier = "failed"
+        try:
+            result = parser.parse(timestr=dt_str,
+                                  **kwargs)
+            tier = "dateutil"
+        finally:
+            with _PARSE_LOCK:
+                _PARSE_STATS[tier] += 1
+    else:
+        with _PARSE_LOCK:
+            _PARSE_STATS[tier] += 1
+
+    return result
+
+
+def _strptime_layout(dt_str: str,
+                     layout: tuple[str, ...]) -> datetime | None:
+    """
+    Parse *dt_str* with the formats in *layout*, in order.
+
+    A format with no separators must reproduce *dt_str* exactly, as *datetime.strptime()* accepts
+    single-digit months and days, and thus would interpret compact representations ambiguously.
+
+    :param dt_str: the date string
+    :param layout: the formats to attempt
+    :return: the corresponding *datetime* object, or *None* if no format applies
+    """
+    # initialize the return variable
+    result: datetime | None = None
+
+    for fmt in layout:
+        with suppress(ValueError):
+            ts: datetime = datetime.strptime(dt_str, fmt)  # noqa: DTZ007
+            if not fmt.replace("%", "").isalpha() or ts.strftime(fmt) == dt_str:
+                result = ts
+                break
+
+    return result
+
+
+def _infer_format(values: list[str],
+                  sample_size: int,
+                  dayfirst: bool,
+                  yearfirst: bool) -> str | None:
+    """
+    Infer the format of the date strings in *values*, from a sample of up to *sample_size* of its elements.
+
+    The shapes of the sampled date strings are considered from the most common, and the candidate format
+    for a shape fitting most of the sampled date strings with that shape is chosen. Ties are resolved
+    by the preference indicated by *dayfirst* and *yearfirst*.
+
+    :param values: the date strings
+    :param sample_size: the number of elements to sample
+    :param dayfirst: whether *day* comes before *month* in an ambiguous date
+    :param yearfirst: whether *year* comes before *month* in an ambiguous date
+    :return: the inferred format, or *None* if no candidate format fits the sample
+    """
+    # initialize the return variable
+    result: str | None = None
+
+    # sample the values, evenly spread
+    step: int = max(1, len(values) // sample_size)
+    sample: list[str] = [value for value in values[::step][:sample_size]
+                         if isinstance(value, str)]
+
+    # group the sampled values by shape
+    shapes: dict[str, list[str]] = {}
+    for value in sample:
+        shapes.setdefault(_SHAPE_REGEX.sub("0", value), []).append(value)
+
+    candidates: dict[str, list[str]] = _infer_candidates(dayfirst=dayfirst,
+                                                         yearfirst=yearfirst)
+    for shape, group in sorted(shapes.items(),
+                               key=lambda item: len(item[1]),
+                               reverse=True):
+        best: int = 0
+        for fmt in candidates.get(shape, []):
+            layout: tuple[str, ...] = (fmt,)
+            count: int = sum(1 for value in group
+                             if _strptime_layout(dt_str=value,
+                                                 layout=layout))
+            if count > best:
+                best = count
+                result = fmt
+        if result:
+            break
+
+    return result
+
+
+def _infer_candidates(dayfirst: bool,
+                      yearfirst: bool) -> dict[str, list[str]]:
+    """
+    Obtain the candidate formats in inferring the format of a column of dates, by shape of the date strings.
+
+    Within each shape, the candidate formats are listed in the order of preference indicated
+    by *dayfirst* and *yearfirst*.
+
+    :param dayfirst: whether *day* comes before *month* in an ambiguous date
+    :param yearfirst: whether *year* comes before *month* in an ambiguous date
+    :return: the candidate formats, by shape of the date strings
+    """
+    result: dict[str, list[str]] | None = _INFER_FORMATS.get((dayfirst, yearfirst))
+    if result is None:
+        result = {}
+        # the shape of a format is the shape of any datetime formatted with it
+        sample: datetime = datetime(2000, 11, 22, 13, 14, 15, 123456, tzinfo=TZ_LOCAL)
+        for order in _INFER_ORDERS[(dayfirst, yearfirst)]:
+            for sep, times in _INFER_TIMES.items():
+                for time_fmt in times:
+                    fmt: str = sep.join(f"%{part}" for part in order) + time_fmt
+                    result.setdefault(_SHAPE_REGEX.sub("0", sample.strftime(fmt)), []).append(fmt)
+        _INFER_FORMATS[(dayfirst, yearfirst)] = result
+
+    return result
+
+
 def timestamp_interval(start: date | datetime | float,
                        finish: date | datetime | float) -> tuple[int, int, int, int] | None:
     """
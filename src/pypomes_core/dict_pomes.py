@@ -1,17 +1,194 @@
 import inspect
 import types
+from collections.abc import Iterable, Iterator
 from datetime import date
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 
+class KeyPath:
+    """
+    A nested key chain, parsed once into its typed steps.
+
+    The key chain may be provided in flat (*key1.key2...keyN*) or list (*[key1, key2, ..., keyN]*) format.
+    Each step holds the *dict* key and, if the key indicates the element's position within a *list*
+    (using the format *<key>[<pos>]*), that position. Otherwise, the position is *None*.
+
+    Instances are immutable, and may be passed in lieu of the key chain to *dict_has_key()*,
+    *dict_get_value()*, *dict_set_value()*, and *dict_pop()*, thus sparing the repeated parsing
+    of chains which are resolved very often.
+    """
+    __slots__ = ("chain", "steps")
+    chain: tuple[Any, ...]
+    steps: tuple[tuple[Any, int | None], ...]
+
+    def __init__(self,
+                 key_chain: str | list[Any]) -> None:
+        """
+        Parse *key_chain* into its typed steps.
+
+        :param key_chain: the nested key chain
+        """
+        # unflatten the key chain
+        if isinstance(key_chain, str):
+            from .list_pomes import list_unflatten
+            key_chain = list_unflatten(source=key_chain)
+
+        steps: list[tuple[Any, int | None]] = []
+        for key in key_chain:
+            # does 'key' refer to a list element ?
+            if isinstance(key, str) and key[-1:] == "]":
+                # yes, separate the key from the element's position
+                pos: int = key.find("[")
+                steps.append((key[:pos], int(key[pos+1:-1])))
+            else:
+                # no, 'key' refers to a dict element
+                steps.append((key, None))
+
+        # the attributes are set past the guard against modifications
+        object.__setattr__(self, "chain", tuple(key_chain))
+        object.__setattr__(self, "steps", tuple(steps))
+
+    def __setattr__(self,
+                    name: str,
+                    value: Any) -> None:
+        """
+        Prevent the attributes of the key path from being set, as instances are immutable.
+
+        :param name: the name of the attribute
+        :param value: the value of the attribute
+        :raises AttributeError: always
+        """
+        err_msg: str = f"'KeyPath' object attribute '{name}' is read-only"
+        raise AttributeError(err_msg)
+
+    def __delattr__(self,
+                    name: str) -> None:
+        """
+        Prevent the attributes of the key path from being deleted, as instances are immutable.
+
+        :param name: the name of the attribute
+        :raises AttributeError: always
+        """
+        err_msg: str = f"'KeyPath' object attribute '{name}' is read-only"
+        raise AttributeError(err_msg)
+
+    def __reduce__(self) -> tuple[type, tuple[list[Any]]]:
+        """
+        Support copying and pickling, by building the key path again from its key chain.
+
+        :return: the class and the arguments to build the key path with
+        """
+        return KeyPath, (list(self.chain),)
+
+    def __len__(self) -> int:
+        """
+        Return the number of steps in the key chain.
+
+        :return: the number of steps
+        """
+        return len(self.steps)
+
+    def __eq__(self,
+               other: object) -> bool:
+        """
+        Indicate whether *other* is a *KeyPath* with the same steps.
+
+        :param other: the object to compare with
+        :return: *True* if the key paths are equal, *False* otherwise
+        """
+        return isinstance(other, KeyPath) and other.steps == self.steps
+
+    def __hash__(self) -> int:
+        """
+        Return the hash of the key path's steps.
+
+        :return: the hash value
+        """
+        return hash(self.steps)
+
+    def __repr__(self) -> str:
+        """
+        Return the flat representation of the key chain.
+
+        :return: the key chain as *KeyPath('key1.key2...keyN')*
+        """
+        return f"KeyPath('{'.'.join(str(key) for key in self.chain)}')"
+
+
+@lru_cache(maxsize=1024)
+def _key_path_parse(key_chain: str) -> KeyPath:
+    """
+    Parse the flat key chain *key_chain*, caching the result for the most recently used chains.
+
+    :param key_chain: the flat key chain
+    :return: the corresponding *KeyPath*
+    """
+    return KeyPath(key_chain=key_chain)
+
+
+def dict_key_path(key_chain: str | list[Any] | KeyPath) -> KeyPath:
+    """
+    Obtain the *KeyPath* corresponding to *key_chain*.
+
+    A *KeyPath* is returned as is. Flat key chains are parsed through a bounded *LRU* cache,
+    whereas key chains in list format are parsed on every invocation.
+
+    :param key_chain: the nested key chain, or its *KeyPath*
+    :return: the corresponding *KeyPath*
+    """
+    # declare the return variable
+    result: KeyPath
+
+    if isinstance(key_chain, KeyPath):
+        result = key_chain
+    elif isinstance(key_chain, str):
+        result = _key_path_parse(key_chain)
+    else:
+        result = KeyPath(key_chain=key_chain)
+
+    return result
+
+
+def _key_path_parent(source: dict,
+                     steps: tuple[tuple[Any, int | None], ...]) -> Any:
+    """
+    Obtain the parent element of the last step in *steps*, by traversing *source*.
+
+    :param source: the reference *dict*
+    :param steps: the steps in the key chain
+    :return: the parent element, or *None* if it could not be reached
+    """
+    # initialize the return variable
+    result: Any = source
+
+    # traverse the steps, up to and including the penultimate one
+    for key, inx in steps[:-1]:
+
+        # is it possible to proceed ?
+        if not isinstance(result, dict):
+            # no, terminate the operation
+            result = None
+            break
+
+        result = result.get(key)
+        # does the step refer to a list element ?
+        if inx is not None:
+            # yes, retrieve it
+            result = result[inx] if isinstance(result, list) and len(result) > inx else None
+
+    return result
+
+
 def dict_has_key(source: dict,
-                 key_chain: str | list[Any]) -> bool:
+                 key_chain: str | list[Any] | KeyPath) -> bool:
     """
     Indicate the existence of an element in *source*, pointed to by the nested key chain *[keys[0]: ... :keys[n]*.
 
-    The key chain may be provided in flat (*key1.key2...keyN*) or list (*[key1, key2, ..., keyN]*) format.
+    The key chain may be provided in flat (*key1.key2...keyN*) or list (*[key1, key2, ..., keyN]*) format,
+    or as a previously built *KeyPath*.
     The path up to he last key in the chain must point to an existing element.
     A given key may indicate the element's position within a *list*, using the format *<key>[<pos>]*.
 
@@ -22,38 +199,22 @@ def dict_has_key(source: dict,
     # initialize the return variable
     result: bool = False
 
-    # unflatten the key chain
-    if isinstance(key_chain, str):
-        from .list_pomes import list_unflatten
-        key_chain = list_unflatten(source=key_chain)
-
-    # define the parent element
-    parent: dict | None = None
-
-    # does the key chain contain just 1 element ?
-    if len(key_chain) == 1:
-        # yes, use the provided dict
-        parent = source
+    # obtain the parsed key chain
+    steps: tuple[tuple[Any, int | None], ...] = dict_key_path(key_chain=key_chain).steps
 
-    # does the key chain contain more than 1 element ?
-    elif len(key_chain) > 1:
-        # yes, obtain the parent element of the last key in the chain
-        parent = dict_get_value(source=source,
-                                key_chain=key_chain[:-1])
+    # obtain the parent element of the last key in the chain
+    parent: Any = _key_path_parent(source=source,
+                                   steps=steps) if steps else None
 
     # is the parent element a dict ?
     if isinstance(parent, dict):
         # yes, proceed
-        key = key_chain[-1]
+        key, inx = steps[-1]
 
         # is the element denoted by the last key in the chain a list ?
-        if key[-1] == "]":
-            # yes, recover it
-            pos: int = key.find("[")
-            inx: int = int(key[pos+1:-1])
-            key = key[:pos]
-            child = parent.get(key)
-            # success, if the element in question is a list with more than 'inx' elements
+        if inx is not None:
+            # yes, success if the element in question is a list with more than 'inx' elements
+            child: Any = parent.get(key)
             result = isinstance(child, list) and len(child) > inx
 
         # success, if the parent element contains the last key in the chain
@@ -86,11 +247,12 @@ def dict_has_value(source: dict,
 
 
 def dict_get_value(source: dict,
-                   key_chain: str | list[Any]) -> Any:
+                   key_chain: str | list[Any] | KeyPath) -> Any:
     """
     Obtain the value of the element in *source*, pointed to by the nested key chain *[keys[0]: ... :keys[n]*.
 
-    The key chain may be provided in flat (*key1.key2...keyN*) or list (*[key1, key2, ..., keyN]*) format.
+    The key chain may be provided in flat (*key1.key2...keyN*) or list (*[key1, key2, ..., keyN]*) format,
+    or as a previously built *KeyPath*.
     The path up to the last key in the chain must point to an existing element.
     A given key may indicate the element's position within a *list*, using the format *<key>[<pos>]*.
     Return *None* if the sought after value is not found.
@@ -105,13 +267,8 @@ def dict_get_value(source: dict,
     # initialize the return variable
     result: Any = source
 
-    # unflatten the key chain
-    if isinstance(key_chain, str):
-        from .list_pomes import list_unflatten
-        key_chain = list_unflatten(source=key_chain)
-
-    # traverse the keys in the chain
-    for key in key_chain:
+    # traverse the steps in the parsed key chain
+    for key, inx in dict_key_path(key_chain=key_chain).steps:
 
         # is it possible to proceed ?
         if not isinstance(result, dict):
@@ -119,35 +276,23 @@ def dict_get_value(source: dict,
             result = None
             break
 
-        if key[-1] == "]":
-            # the key refers to an element in a list, retrieve it
-            pos: int = key.find("[")
-            inx: int = int(key[pos+1:-1])
-            result = result.get(key[:pos])
-
+        result = result.get(key)
+        # does the key refer to an element in a list ?
+        if inx is not None:
+            # yes, retrieve it, if possible
             result = result[inx] if isinstance(result, list) and len(result) > inx else None
 
-            # is it possible to proceed ?
-            if isinstance(result, list) and len(result) > inx:
-                # yes, proceed
-                result = result[inx]
-            else:
-                # no, abort the operation
-                result = None
-        else:
-            # proceeding is not possible, the element corresponding to 'key' in the dictionary
-            result = result.get(key)
-
     return result
 
 
 def dict_set_value(target: dict,
-                   key_chain: str | list[Any],
+                   key_chain: str | list[Any] | KeyPath,
                    value: Any) -> dict:
     """
     Assign to an element of *source* the value *value*.
 
-    The key chain may be provided in flat (*key1.key2...keyN*) or list (*[key1, key2, ..., keyN]*) format.
+    The key chain may be provided in flat (*key1.key2...keyN*) or list (*[key1, key2, ..., keyN]*) format,
+    or as a previously built *KeyPath*.
     The element in question is pointed to by the key chain *[keys[0]: ... :keys[n]*.
     If the element does not exist, it is created with the specified value.
     Any non-existing intermediate elements are created with the value of an empty *dict*.
@@ -160,14 +305,12 @@ def dict_set_value(target: dict,
     :param value: the value to be assigned
     :return: the modified input *dict*
     """
-    # unflatten the key chain
-    if isinstance(key_chain, str):
-        from .list_pomes import list_unflatten
-        key_chain = list_unflatten(source=key_chain)
+    # obtain the parsed key chain
+    steps: tuple[tuple[Any, int | None], ...] = dict_key_path(key_chain=key_chain).steps
 
     dict_item: Any = target
     # traverse the chain, up to end including its penultimate element
-    for key in (key_chain[:-1] or []):
+    for key, inx in steps[:-1]:
 
         # is it possible to proceed ?
         if not isinstance(dict_item, dict):
@@ -175,11 +318,9 @@ def dict_set_value(target: dict,
             break
 
         # does 'key' refer to a list element ?
-        if key[-1] == "]":
+        if inx is not None:
             # yes, retrieve it
-            pos: int = key.find("[")
-            inx: int = int(key[pos+1:-1])
-            dict_item = dict_item.get(key[:pos])
+            dict_item = dict_item.get(key)
             # is it possible to proceed ?
             if isinstance(dict_item, list) and len(dict_item) > inx:
                 # yes, proceed
@@ -195,15 +336,13 @@ def dict_set_value(target: dict,
             dict_item = dict_item.get(key)
 
     # does a key exist and is 'dict_item'a dict ?
-    if len(key_chain) > 0 and isinstance(dict_item, dict):
+    if steps and isinstance(dict_item, dict):
         # yes, proceed
-        key: str = key_chain[-1]
+        key, inx = steps[-1]
         # does 'key' refer to a list element ?
-        if key[-1] == "]":
+        if inx is not None:
             # yes, retrieve it
-            pos: int = key.find("[")
-            inx: int = int(key[pos+1:-1])
-            dict_item = dict_item.get(key[:pos])
+            dict_item = dict_item.get(key)
             # is the assignment possible ?
             if isinstance(dict_item, list) and len(dict_item) > inx:
                 # yes, do it
@@ -216,11 +355,12 @@ def dict_set_value(target: dict,
 
 
 def dict_pop(target: dict,
-             key_chain: str | list[Any]) -> Any:
+             key_chain: str | list[Any] | KeyPath) -> Any:
     """
     Remove the element in *source* pointed to by *key_chain*, and return its value.
 
-    The key chain may be provided in flat (*key1.key2...keyN*) or list (*[key1, key2, ..., keyN]*) format.
+    The key chain may be provided in flat (*key1.key2...keyN*) or list (*[key1, key2, ..., keyN]*) format,
+    or as a previously built *KeyPath*.
     The path up to the last key in the chain must point to an existing element.
     A given key may indicate the element's position within a *list*, using the format *<key>[<pos>]*.
 
@@ -236,36 +376,21 @@ def dict_pop(target: dict,
     # initialize the return variable
     result: Any = None
 
-    # unflatten the key chain
-    if isinstance(key_chain, str):
-        from .list_pomes import list_unflatten
-        key_chain = list_unflatten(source=key_chain)
+    # obtain the parsed key chain
+    steps: tuple[tuple[Any, int | None], ...] = dict_key_path(key_chain=key_chain).steps
 
-    # obtain the element pointed to by the las key in the chain
-    parent: dict | None = None
-
-    # does the key chain contain just 1 element ?
-    if len(key_chain) == 1:
-        # yes, use the provided dict
-        parent = target
-
-    # does the key chain contain more than 1 element ?
-    elif len(key_chain) > 1:
-        # yes, retrieve the parent element of the last key in the chain
-        parent = dict_get_value(source=target,
-                                key_chain=key_chain[:-1])
+    # obtain the parent element of the last key in the chain
+    parent: Any = _key_path_parent(source=target,
+                                   steps=steps) if steps else None
 
     # is the parent element a dict ?
     if isinstance(parent, dict):
         # yes, proceed
-        key: str = key_chain[-1]
+        key, inx = steps[-1]
 
         # does the last key un the chain refer to a list element ?
-        if key[-1] == "]":
+        if inx is not None:
             # sim, retrieve the list
-            pos: int = key.find("[")
-            inx: int = int(key[pos+1:-1])
-            key = key[:pos]
             child: Any = parent.get(key)
 
             # is the element pointed to by the last key in the chain a list with more than 'inx' elements ?
@@ -627,12 +752,13 @@ def dict_reduce(target: dict,
 
 
 def dict_from_list(source: list[dict],
-                   key_chain: str | list[Any],
+                   key_chain: str | list[Any] | KeyPath,
                    value: Any) -> dict | None:
     """
     Locate in *source*, and return, the element of type *dict* having the attribute *key_chain* with value *value*.
 
-    The key chain may be provided in flat (*key1.key2...keyN*) or list (*[key1, key2, ..., keyN]*) format.
+    The key chain may be provided in flat (*key1.key2...keyN*) or list (*[key1, key2, ..., keyN]*) format,
+    or as a previously built *KeyPath*.
 
     :param source: the list to be inspected
     :param key_chain: the key chain used in the search process
@@ -642,10 +768,13 @@ def dict_from_list(source: list[dict],
     # initialize the return variable
     result: dict | None = None
 
+    # parse the key chain just once
+    key_path: KeyPath = dict_key_path(key_chain=key_chain)
+
     for item in source:
         if isinstance(item, dict) and \
            value == dict_get_value(source=item,
-                                   key_chain=key_chain):
+                                   key_chain=key_path):
             result = item
             break
 
@@ -699,8 +828,233 @@ def dict_from_object(source: object) -> dict:
     return result
 
 
+class _TransformNode:
+    """
+    A node in the mapping tree of a *TransformPlan*, standing for a key in the source key chains.
+    """
+    __slots__ = ("children", "is_coupled", "to_keys")
+
+    def __init__(self) -> None:
+        """
+        Initialize an uncoupled node, with no children.
+        """
+        self.children: dict[Any, _TransformNode] = {}
+        self.is_coupled: bool = False
+        self.to_keys: Any = None
+
+
+class TransformPlan:
+    """
+    A precompiled transformation plan for *dict_transform()* and *list_transform()*.
+
+    The pairs of source and destination key chains in *from_to_keys* are compiled, just once, into
+    a mapping tree indexed by the keys at each level of the source key chains. Transforming a *dict*
+    or a *list* then amounts to a single traversal of the source data, locating the destination of each
+    element with a dictionary lookup, rather than scanning *from_to_keys* for each key, at every level.
+
+    The plan is a reusable callable: *plan(source)* is equivalent to *dict_transform(source, from_to_keys,
+    add_missing=add_missing)*, if *source* is a *dict*, or to *list_transform(...)*, if it is a *list*.
+    The source keys are expected not to contain the chain separator (*.*).
+    """
+    __slots__ = ("add_missing", "root")
+
+    def __init__(self,
+                 from_to_keys: list[tuple[str, Any]],
+                 add_missing: bool = False) -> None:
+        """
+        Compile *from_to_keys* into the plan's mapping tree.
+
+        :param from_to_keys: the list of tuples containing the source and destination key sequences
+        :param add_missing: whether to add entries in *source* missing in *from_to_keys* (defaults to *False*)
+        """
+        from .list_pomes import list_unflatten
+
+        self.add_missing: bool = add_missing
+        self.root: dict[Any, _TransformNode] = {}
+        for from_to_key in from_to_keys:
+            nodes: dict[Any, _TransformNode] = self.root
+            node: _TransformNode | None = None
+            for key in list_unflatten(source=from_to_key[0]):
+                node = nodes.get(key)
+                if node is None:
+                    node = _TransformNode()
+                    nodes[key] = node
+                nodes = node.children
+            # as in 'list_get_coupled()', the first coupling of a source key chain prevails
+            if node and not node.is_coupled:
+                node.is_coupled = True
+                node.to_keys = from_to_key[1]
+
+    def __call__(self,
+                 source: dict | list) -> dict | list:
+        """
+        Transform *source* according to the plan.
+
+        :param source: the source *dict* or *list* for the transformation
+        :return: the new *dict* or *list*
+        """
+        return self.transform(source=source)
+
+    def transform(self,
+                  source: dict | list,
+                  prefix_from: str = None,
+                  prefix_to: str = None) -> dict | list:
+        """
+        Transform *source* according to the plan.
+
+        The prefixes *prefix_from* and *prefix_to* have the same meaning as in *dict_transform()*.
+
+        :param source: the source *dict* or *list* for the transformation
+        :param prefix_from: prefix to be added to source keys
+        :param prefix_to: prefix to be removed from target keys
+        :return: the new *dict* or *list*
+        """
+        # locate the nodes for the keys under 'prefix_from' (indications of list positions are disregarded)
+        nodes: dict[Any, _TransformNode] | None = self.root
+        path_from: str | None = None
+        if prefix_from:
+            from .list_pomes import list_get_coupled
+            # 'list_get_coupled()' removes the list position indications
+            path_from = list_get_coupled(coupled_elements=[],
+                                         primary_element=prefix_from,
+                                         couple_to_same=True)
+            for key in dict_key_path(key_chain=path_from).chain:
+                node: _TransformNode | None = nodes.get(key) if nodes else None
+                nodes = node.children if node else None
+
+        # declare the return variable
+        result: dict | list
+        if isinstance(source, dict):
+            result = self._transform_dict(source=source,
+                                          nodes=nodes,
+                                          path_from=path_from,
+                                          prefix_to=prefix_to)
+        else:
+            result = self._transform_list(source=source,
+                                          nodes=nodes,
+                                          path_from=path_from,
+                                          prefix_to=prefix_to)
+        return result
+
+    def _transform_dict(self,
+                        source: dict,
+                        nodes: dict[Any, _TransformNode] | None,
+                        path_from: str | None,
+                        prefix_to: str | None) -> dict:
+        """
+        Build a new *dict* from *source*, with *nodes* holding the mapping tree nodes for its keys.
+
+        :param source: the source *dict*
+        :param nodes: the mapping tree nodes for the keys in *source*, if any
+        :param path_from: the source key chain leading to *source*, without list position indications
+        :param prefix_to: prefix to be removed from target keys
+        :return: the new *dict*
+        """
+        # initialize the return variable
+        result: dict = {}
+
+        # traverse the source dictionary
+        for key, value in source.items():
+            node: _TransformNode | None = nodes.get(key) if nodes else None
+
+            # define the source key chain (needed only for coupling missing keys to themselves)
+            from_keys: str | None = None
+            if self.add_missing:
+                from_keys = f"{path_from}.{key}" if path_from else key
+
+            # get the target key chain
+            to_keys: Any = None
+            if node and node.is_coupled:
+                to_keys = node.to_keys
+            elif self.add_missing:
+                to_keys = from_keys
+
+            # has the destination been defined ?
+            if to_keys:
+                # yes, get the target value
+                children: dict[Any, _TransformNode] | None = node.children if node else None
+                if isinstance(value, dict):
+                    # 'value' is a dictionary, transform it
+                    to_value: dict = self._transform_dict(source=value,
+                                                          nodes=children,
+                                                          path_from=from_keys,
+                                                          prefix_to=to_keys)
+                elif isinstance(value, list):
+                    # 'value' is a list, transform it
+                    to_value: list = self._transform_list(source=value,
+                                                          nodes=children,
+                                                          path_from=from_keys,
+                                                          prefix_to=to_keys)
+                else:
+                    # 'value' is neither a dictionary nor a list
+                    to_value: Any = value
+
+                # has the target prefix been defined and does it occur in the target string ?
+                if prefix_to and to_keys.startswith(prefix_to):
+                    # yes, remove the prefix
+                    to_keys = to_keys[len(prefix_to)+1:]
+
+                # assign the transformed value to the result
+                dict_set_value(target=result,
+                               key_chain=dict_key_path(key_chain=to_keys),
+                               value=to_value)
+        return result
+
+    def _transform_list(self,
+                        source: list,
+                        nodes: dict[Any, _TransformNode] | None,
+                        path_from: str | None,
+                        prefix_to: str | None) -> list:
+        """
+        Build a new *list* from *source*, with *nodes* holding the mapping tree nodes for the keys in its *dicts*.
+
+        :param source: the source *list*
+        :param nodes: the mapping tree nodes for the keys in the *dicts* in *source*, if any
+        :param path_from: the source key chain leading to *source*, without list position indications
+        :param prefix_to: prefix to be removed from target keys
+        :return: the new *list*
+        """
+        # initialize the return variable
+        result: list = []
+
+        # traverse the source list
+        for value in source:
+            if isinstance(value, dict):
+                to_value: dict = self._transform_dict(source=value,
+                                                      nodes=nodes,
+                                                      path_from=path_from,
+                                                      prefix_to=prefix_to)
+            elif isinstance(value, list):
+                to_value: list = self._transform_list(source=value,
+                                                      nodes=nodes,
+                                                      path_from=path_from,
+                                                      prefix_to=prefix_to)
+            else:
+                to_value: Any = value
+            result.append(to_value)
+
+        return result
+
+
+def dict_compile_transform(from_to_keys: list[tuple[str, Any]],
+                           add_missing: bool = False) -> TransformPlan:
+    """
+    Compile *from_to_keys* into a reusable transformation plan.
+
+    The plan may be passed as *from_to_keys* to *dict_transform()* and *list_transform()*, or invoked directly
+    on the *dict* or *list* to be transformed. This is advantageous when the same set of key pairs is used to
+    transform a large number of *dicts*.
+
+    :param from_to_keys: the list of tuples containing the source and destination key sequences
+    :param add_missing: whether to add entries in *source* missing in *from_to_keys* (defaults to *False*)
+    :return: the compiled transformation plan
+    """
+    return TransformPlan(from_to_keys=from_to_keys,
+                         add_missing=add_missing)
+
+
 def dict_transform(source: dict,
-                   from_to_keys: list[tuple[str, Any]],
+                   from_to_keys: list[tuple[str, Any]] | TransformPlan,
                    prefix_from: str = None,
                    prefix_to: str = None,
                    add_missing: bool = False) -> dict:
@@ -721,8 +1075,11 @@ def dict_transform(source: dict,
     If *add_missing* is *True*, the entries in *source* whose keys are missing in *from_to_keys*
     are added to the new *dict*.
 
+    If *from_to_keys* is a *TransformPlan* (see *dict_compile_transform()*), it is used to carry out
+    the transformation, and *add_missing* is the one the plan was compiled with.
+
     :param source: the source *dict* for the transformation
-    :param from_to_keys: the list of tuples containing the source and destination key sequences
+    :param from_to_keys: the list of tuples containing the source and destination key sequences, or its compiled plan
     :param prefix_from: prefix to be added to source keys
     :param prefix_to: prefix to be removed from target keys
     :param add_missing: whether to add entries in *source* missing in *from_to_keys* (defaults to *False*)
@@ -732,53 +1089,62 @@ def dict_transform(source: dict,
     from .list_pomes import list_get_coupled, list_transform, list_unflatten
 
     # initialize the return variable
-    result: dict = {}
-
-    # traverse the source dictionary
-    for key, value in source.items():
-
-        # define the source key chain
-        if prefix_from:
-            from_keys: str = f"{prefix_from}.{key}"
-        else:
-            from_keys: str = key
-
-        # get the target key chain
-        to_keys: str = list_get_coupled(coupled_elements=from_to_keys,
-                                        primary_element=from_keys,
-                                        couple_to_same=add_missing)
+    result: dict
+
+    # has a compiled plan been provided ?
+    if isinstance(from_to_keys, TransformPlan):
+        # yes, use it
+        result = from_to_keys.transform(source=source,
+                                        prefix_from=prefix_from,
+                                        prefix_to=prefix_to)
+    else:
+        result = {}
+
+        # traverse the source dictionary
+        for key, value in source.items():
 
-        # has the destination been defined ?
-        if to_keys:
-            # yes, get the target value
-            if isinstance(value, dict):
-                # 'value' is a dictionary, transform it
-                to_value: dict = dict_transform(source=value,
-                                                from_to_keys=from_to_keys,
-                                                prefix_from=from_keys,
-                                                prefix_to=to_keys,
-                                                add_missing=add_missing)
-            elif isinstance(value, list):
-                # 'value' is a list, transform it
-                to_value: list = list_transform(source=value,
-                                                from_to_keys=from_to_keys,
-                                                prefix_from=from_keys,
-                                                prefix_to=to_keys,
-                                                add_missing=add_missing)
+            # define the source key chain
+            if prefix_from:
+                from_keys: str = f"{prefix_from}.{key}"
             else:
-                # 'value' is neither a dictionary nor a list
-                to_value: Any = value
-
-            # has the target prefix been defined and does it occur in the target string ?
-            if prefix_to and to_keys.startswith(prefix_to):
-                # yes, remove the prefix
-                to_keys = to_keys[len(prefix_to)+1:]
-            to_keys_deep: list[str] = list_unflatten(source=to_keys)
-
-            # assign the transformed value to the result
-            dict_set_value(target=result,
-                           key_chain=to_keys_deep,
-                           value=to_value)
+                from_keys: str = key
+
+            # get the target key chain
+            to_keys: str = list_get_coupled(coupled_elements=from_to_keys,
+                                            primary_element=from_keys,
+                                            couple_to_same=add_missing)
+
+            # has the destination been defined ?
+            if to_keys:
+                # yes, get the target value
+                if isinstance(value, dict):
+                    # 'value' is a dictionary, transform it
+                    to_value: dict = dict_transform(source=value,
+                                                    from_to_keys=from_to_keys,
+                                                    prefix_from=from_keys,
+                                                    prefix_to=to_keys,
+                                                    add_missing=add_missing)
+                elif isinstance(value, list):
+                    # 'value' is a list, transform it
+                    to_value: list = list_transform(source=value,
+                                                    from_to_keys=from_to_keys,
+                                                    prefix_from=from_keys,
+                                                    prefix_to=to_keys,
+                                                    add_missing=add_missing)
+                else:
+                    # 'value' is neither a dictionary nor a list
+                    to_value: Any = value
+
+                # has the target prefix been defined and does it occur in the target string ?
+                if prefix_to and to_keys.startswith(prefix_to):
+                    # yes, remove the prefix
+                    to_keys = to_keys[len(prefix_to)+1:]
+                to_keys_deep: list[str] = list_unflatten(source=to_keys)
+
+                # assign the transformed value to the result
+                dict_set_value(target=result,
+                               key_chain=to_keys_deep,
+                               value=to_value)
     return result
 
 
@@ -801,18 +1167,87 @@ def dict_clone(source: dict,
     :param omit_missing: omit the elements not found in the source *dict* (defaults to *True*)
     :return: the new *dict*
     """
+    return _dict_project(source=source,
+                         projection=_dict_projection(from_to_keys=from_to_keys),
+                         omit_missing=omit_missing)
+
+
+def dict_clone_many(records: Iterable[dict],
+                    from_to_keys: list[tuple[Any, Any] | Any],
+                    omit_missing: bool = True) -> Iterator[dict]:
+    """
+    Lazily build a new *dict* for each *dict* in *records*, as *dict_clone()* does for a single *dict*.
+
+    The projection defined by *from_to_keys* is resolved just once, and each of its key chains is traversed
+    a single time per record. The new *dicts* are yielded as they are built, thus allowing large sets of
+    records, such as database result sets or cursors, to be projected without materializing all of them.
+    Wrap the invocation in *list()* to obtain all the new *dicts* at once.
+
+    :param records: the source *dicts*
+    :param from_to_keys: list of elements indicative of the source and target keys
+    :param omit_missing: omit the elements not found in the source *dicts* (defaults to *True*)
+    :return: an iterator over the new *dicts*
+    """
+    projection: list[tuple[KeyPath, Any]] = _dict_projection(from_to_keys=from_to_keys)
+    for record in records:
+        yield _dict_project(source=record,
+                            projection=projection,
+                            omit_missing=omit_missing)
+
+
+def _dict_projection(from_to_keys: list[tuple[Any, Any] | Any]) -> list[tuple[KeyPath, Any]]:
+    """
+    Resolve the elements in *from_to_keys* into the parsed source key chains and their target keys.
+
+    :param from_to_keys: list of elements indicative of the source and target keys
+    :return: the list of tuples containing the parsed source key chains and their target keys
+    """
     # initialize the return variable
-    result: dict = {}
+    result: list[tuple[KeyPath, Any]] = []
 
-    # traverse the list of elements and add to the target dict
     for elem in from_to_keys:
         from_key: str = elem[0] if isinstance(elem, tuple) else elem
         to_key: str = (elem[1] if isinstance(elem, tuple) and len(elem) > 1 else None) or from_key
-        has_key: bool = dict_has_key(source=source,
-                                     key_chain=from_key)
+        result.append((dict_key_path(key_chain=from_key), to_key))
+
+    return result
+
+
+def _dict_project(source: dict,
+                  projection: list[tuple[KeyPath, Any]],
+                  omit_missing: bool) -> dict:
+    """
+    Build a new *dict* from *source*, according to *projection*.
+
+    :param source: the source *dict*
+    :param projection: the parsed source key chains and their target keys
+    :param omit_missing: omit the elements not found in the source *dict*
+    :return: the new *dict*
+    """
+    # initialize the return variable
+    result: dict = {}
+
+    # traverse the projection and add to the target dict
+    for key_path, to_key in projection:
+        steps: tuple[tuple[Any, int | None], ...] = key_path.steps
+        has_key: bool = False
+        value: Any = None if steps else source
+
+        # obtain the parent element of the last key in the chain
+        parent: Any = _key_path_parent(source=source,
+                                       steps=steps) if steps else None
+        if isinstance(parent, dict):
+            key, inx = steps[-1]
+            value = parent.get(key)
+            # does the last key in the chain refer to a list element ?
+            if inx is not None:
+                # yes, retrieve it
+                has_key = isinstance(value, list) and len(value) > inx
+                value = value[inx] if has_key else None
+            else:
+                has_key = key in parent
+
         if has_key or not omit_missing:
-            value: Any = dict_get_value(source=source,
-                                        key_chain=from_key)
             result[to_key] = value
 
     return result
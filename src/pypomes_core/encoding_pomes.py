@@ -1,3 +1,135 @@
+import codecs
+import re
+from pathlib import Path
+from typing import Final
+
+# the backslash-escaped representations of the special characters
+_SPECIAL_CHARS: Final[dict[int, bytes]] = {
+    0x5C: b"\\\\",                          # \,  \\ - backslash
+    0x0A: b"\\n",                           # LF, \n - line feed
+    0x0D: b"\\r",                           # CR, \r - carriage return
+    0x09: b"\\t",                           # HT, \t - horizontal tab
+    0x0B: b"\\v",                           # VT, \v - vertical tab
+    0x0C: b"\\f",                           # FF, \f - form feed
+    0x08: b"\\b"                            # BS, \b - backspace
+}
+
+# the encoded representation of each byte value:
+#   - ASCII chars, less the backslash, represent themselves
+#   - special chars are represented by their backslash-escaped representations
+#   - the others are represented as '\xNN'
+_ENCODE_TABLE: Final[tuple[bytes, ...]] = tuple(
+    bytes([byte]) if byte != 0x5C and 0x20 <= byte <= 0x7E
+    else _SPECIAL_CHARS.get(byte, f"\\x{byte:02x}".encode())
+    for byte in range(256)
+)
+
+# the encoding table, as applied by 'str.translate()' to the 'latin-1' view of the binary content
+_ENCODE_STR_TABLE: Final[tuple[str, ...]] = tuple(value.decode() for value in _ENCODE_TABLE)
+
+# the decoded value of each escape sequence:
+#   - '\xNN', for all combinations of lowercase and uppercase hexadecimal digits
+#   - the special chars
+#   - '\' followed by any other byte (but 'x') yields the byte itself
+#   - a trailing '\' is dropped
+_DECODE_TABLE: Final[dict[bytes, bytes]] = {
+    b"\\" + bytes([byte]): bytes([byte]) for byte in range(256) if byte != 0x78
+}
+_DECODE_TABLE.update({value: bytes([byte]) for byte, value in _SPECIAL_CHARS.items()})
+_DECODE_TABLE.update({
+    f"\\x{upper}{lower}".encode(): bytes([16 * int(upper, base=16) + int(lower, base=16)])
+    for upper in "0123456789abcdefABCDEF" for lower in "0123456789abcdefABCDEF"
+})
+_DECODE_TABLE[b"\\"] = b""
+
+# the escape sequences ('\x' takes up to two more bytes)
+_DECODE_REGEX: Final[re.Pattern] = re.compile(rb"\\(?:x[\s\S]{0,2}|[\s\S])?")
+
+# the text content whose escape sequences are all interpreted by 'codecs.escape_decode()' as above
+# (text content produced by means other than 'encode_ascii_hex()' might hold a trailing '\', octal
+# representations, or '\' followed by a byte not in the special chars)
+_DECODE_NATIVE_REGEX: Final[re.Pattern] = re.compile(rb"(?:[^\\]++|\\[\\nrtvfbx])*+")
+
+
+# the default size of the buffers used in streaming files (128 KB)
+_STREAM_CHUNK_SIZE: Final[int] = 128 * 1024
+
+
+class AsciiHexEncoder:
+    """
+    Incremental encoder of binary content into text, as done by *encode_ascii_hex()*.
+
+    Binary content is fed in chunks of arbitrary sizes, and the encoded text content is returned
+    for each chunk as it is fed. As every byte is encoded on its own, no state is carried across chunks,
+    and *finish()* is provided for symmetry with *AsciiHexDecoder*.
+    """
+    __slots__ = ()
+
+    def feed(self,
+             chunk: bytes) -> bytes:
+        """
+        Encode the binary content in *chunk*.
+
+        :param chunk: the next chunk of binary content
+        :return: the encoded text content
+        """
+        return encode_ascii_hex(source=chunk)
+
+    def finish(self) -> bytes:
+        """
+        Conclude the encoding.
+
+        :return: the remaining encoded text content (always empty)
+        """
+        return b""
+
+
+class AsciiHexDecoder:
+    r"""
+    Incremental decoder of text content into binary, as done by *decode_ascii_hex()*.
+
+    Text content is fed in chunks of arbitrary sizes, and the decoded binary content is returned
+    for each chunk as it is fed. An escape sequence split across chunks (e.g., *\x4* and *1*)
+    is held back until its completion, and *finish()* must be invoked once the text content is exhausted.
+    """
+    __slots__ = ("pending",)
+
+    def __init__(self) -> None:
+        """
+        Initialize the decoder.
+        """
+        self.pending: bytes = b""
+
+    def feed(self,
+             chunk: bytes) -> bytes:
+        r"""
+        Decode the text content in *chunk*, holding back a trailing incomplete escape sequence.
+
+        :param chunk: the next chunk of text content
+        :return: the decoded binary content
+        :raises ValueError: the text content contains an invalid *\xNN* representation
+        """
+        data: bytes = self.pending + chunk
+        pos: int = _ascii_hex_incomplete(source=data)
+        self.pending = data[pos:]
+
+        return decode_ascii_hex(source=data[:pos])
+
+    def finish(self) -> bytes:
+        r"""
+        Conclude the decoding, and reset the decoder.
+
+        A trailing *\* is dropped, as done by *decode_ascii_hex()*.
+
+        :return: the remaining decoded binary content
+        :raises ValueError: the text content ends with an incomplete *\xNN* representation
+        """
+        data: bytes = self.pending
+        self.pending = b""
+
+        return decode_ascii_hex(source=data)
+
+
 def encode_ascii_hex(source: bytes) -> bytes:
     r"""
     Encode binary content in *source* into text.
@@ -6,46 +138,13 @@ def encode_ascii_hex(source: bytes) -> bytes:
     *backslash-escaped* representation for the special characters *LF*, *HT*, *CR*, *VT*, *FF* and *BS*,
     and with the representation *\\xNN* for the others (where *N* is a hexadecimal digit in *[0-9a-f]*).
 
+    The encoding is carried out in a single pass, by translating the *latin-1* view of *source*
+    through a precomputed table.
+
     :param source: the binary content to be encoded
     :return: the encoded text content
     """
-    # initialize the return variable
-    result: bytes = b""
-
-    # traverse 'source', encoding the non-ASCII bytes
-    pos: int = 0
-    while pos < len(source):
-        char: bytes = source[pos:pos+1]
-        if char != b"\\" and b" " <= char <= b"~":
-            result += char                                  # char   - ASCII char, less the backslash
-        else:
-            byte_str: str
-            match char:
-                case b"\\":
-                    byte_str = "\\\\"                       # \,  \\ - backslash
-                case b"\x0A":
-                    byte_str = "\\n"                        # LF, \n - line feed
-                case b"\x0D":
-                    byte_str = "\\r"                        # CR, \r - carriage return
-                case b"\x09":
-                    byte_str = "\\t"                        # HT, \t - horizontal tab
-                case b"\x0B":
-                    byte_str = "\\v"                        # VT, \v - vertical tab
-                case b"\x0C":
-                    byte_str = "\\f"                        # FF, \f  - form feed
-                case b"\x08":
-                    byte_str = "\\b"                        # BS, \b - backspace
-                case _:
-                    int_char = int.from_bytes(char, "little")
-                    lower_char: int = int_char % 16             # \xNN
-                    upper_char: int = round((int_char - lower_char) / 16)
-                    byte_str = "\\x" + hex(upper_char)[2:] + hex(lower_char)[2:]
-
-            result += byte_str.encode(encoding="utf-8")
-
-        pos += 1
-
-    return result
+    return bytes(source).decode(encoding="latin-1").translate(_ENCODE_STR_TABLE).encode(encoding="ascii")
 
 
 def decode_ascii_hex(source: bytes) -> bytes:
@@ -56,50 +155,138 @@ def decode_ascii_hex(source: bytes) -> bytes:
     *backslash-escaped* representation for the special characters LF, HT, CR, VT, FF and BS,
     and with the representation *\\xNN* for the others (where *N* is a hexadecimal digit [0-9a-f]).
 
+    Unless *source* holds escape sequences not produced by *encode_ascii_hex()*, the decoding is carried
+    out by the native *codecs.escape_decode()*. Otherwise, the text between escape sequences is copied as is,
+    and the escape sequences are decoded through a precomputed table.
+
     :param source: the text content to be decoded
     :return: the decoded binary content
+    :raises ValueError: *source* contains an invalid *\\xNN* representation
+    """
+    result: bytes
+    if _DECODE_NATIVE_REGEX.fullmatch(source):
+        result = codecs.escape_decode(source)[0]
+    else:
+        result = _DECODE_REGEX.sub(_decode_escape, source)
+
+    return result
+
+
+def _decode_escape(match: re.Match) -> bytes:
+    r"""
+    Decode the escape sequence in *match*.
+
+    :param match: the escape sequence
+    :return: the decoded byte
+    :raises ValueError: the escape sequence is an invalid *\\xNN* representation
+    """
+    escape: bytes = match.group()
+    result: bytes | None = _DECODE_TABLE.get(escape)
+    if result is None:
+        # '\x' prefixes a character denoted by a hexadecimal string ('\x00' through '\xff')
+        # HAZARD: 'int()' raises 'ValueError' on invalid hexadecimal digits, as intended
+        result = bytes([16 * int(escape[2:3].decode(), base=16) + int(escape[3:4].decode(), base=16)])
+
+    return result
+
+
+def encode_ascii_hex_file(source_path: Path | str,
+                          target_path: Path | str,
+                          chunk_size: int = None) -> int:
+    """
+    Encode the binary content of the file at *source_path* into text, written to the file at *target_path*.
+
+    The content is streamed in buffers of *chunk_size* bytes, so that memory usage does not depend
+    on the size of the file.
+
+    :param source_path: path to the file holding the binary content
+    :param target_path: path to the file to write the encoded text content to
+    :param chunk_size: optional size of the buffers to use in reading the file, defaults to 128 KB
+    :return: the number of bytes written to *target_path*
+    """
+    return _ascii_hex_stream(source_path=source_path,
+                             target_path=target_path,
+                             chunk_size=chunk_size,
+                             codec=AsciiHexEncoder())
+
+
+def decode_ascii_hex_file(source_path: Path | str,
+                          target_path: Path | str,
+                          chunk_size: int = None) -> int:
+    r"""
+    Decode the text content of the file at *source_path* into binary, written to the file at *target_path*.
+
+    The content is streamed in buffers of *chunk_size* bytes, so that memory usage does not depend
+    on the size of the file.
+
+    :param source_path: path to the file holding the text content
+    :param target_path: path to the file to write the decoded binary content to
+    :param chunk_size: optional size of the buffers to use in reading the file, defaults to 128 KB
+    :return: the number of bytes written to *target_path*
+    :raises ValueError: the text content contains an invalid *\xNN* representation
+    """
+    return _ascii_hex_stream(source_path=source_path,
+                             target_path=target_path,
+                             chunk_size=chunk_size,
+                             codec=AsciiHexDecoder())
+
+
+def _ascii_hex_incomplete(source: bytes) -> int:
+    r"""
+    Locate the incomplete escape sequence at the end of *source*.
+
+    An escape sequence spans at most 4 bytes (*\\xNN*), and a *\\* starts an escape sequence
+    if it is preceded by an even number of consecutive *\\*.
+
+    :param source: the text content
+    :return: the position of the incomplete escape sequence, or the length of *source* if there is none
+    """
+    # initialize the return variable
+    result: int = len(source)
+
+    # locate the last '\' within the last 4 bytes
+    pos: int = source.rfind(b"\\", max(0, len(source) - 4))
+    if pos >= 0:
+        # count the consecutive '\' preceding it
+        start: int = pos
+        while start > 0 and source[start - 1] == 0x5C:
+            start -= 1
+        # does it start an incomplete escape sequence ?
+        if (pos - start) % 2 == 0 and \
+           pos + (4 if source[pos+1:pos+2] == b"x" else 2) > len(source):
+            # yes, hold it back
+            result = pos
+
+    return result
+
+
+def _ascii_hex_stream(source_path: Path | str,
+                      target_path: Path | str,
+                      chunk_size: int | None,
+                      codec: AsciiHexEncoder | AsciiHexDecoder) -> int:
+    """
+    Stream the content of the file at *source_path* through *codec*, into the file at *target_path*.
+
+    :param source_path: path to the source file
+    :param target_path: path to the target file
+    :param chunk_size: size of the buffers to use in reading the source file
+    :param codec: the incremental encoder or decoder
+    :return: the number of bytes written to *target_path*
     """
     # initialize the return variable
-    result: bytes = b""
-
-    # traverse 'source', decoding the occurrences of '\'
-    byte_val: bytes
-    pos1: int = 0
-    # locate the first '\'
-    pos2: int = source.find(b"\\")
-    while pos2 >= 0:
-        result += source[pos1:pos2]
-        next_byte: bytes = source[pos2+1:pos2+2]
-        shift: int = 2
-        match next_byte:
-            case b"x":
-                # '\x' prefixes a character denoted by a hexadecimal string ('\x00' through '\xff')
-                # HAZARD: intermediate chars are necessary - 'int(byte)' breaks for byte > '\x09'
-                upper_char: str = source[pos2+2:pos2+3].decode()
-                lower_char: str = source[pos2+3:pos2+4].decode()
-                int_val: int = 16 * int(upper_char, base=16) + int(lower_char, base=16)
-                byte_val = bytes([int_val])
-                shift = 4
-            case b"n":
-                byte_val = b"\x0A"                  # LF, \n - line feed
-            case b"r":
-                byte_val = b"\x0D"                  # CR, \r - carriage return
-            case b"t":
-                byte_val = b"\x09"                  # HT, \t - horizontal tab
-            case b"v":
-                byte_val = b"\x0B"                  # VT, \v - vertical tab
-            case b"f":
-                byte_val = b"\x0C"                  # FF, \f - form feed
-            case b"b":
-                byte_val = b"\x08"                  # BS, \b  - backspace
-            case _:
-                byte_val = source[pos2+1:pos2+2]    # byte following '\'
-
-        pos1 = pos2 + shift
-        result += byte_val
-        # locate the next '\'
-        pos2 = source.find(b"\\", pos1)
-
-    result += source[pos1:]
+    result: int = 0
+
+    # normalize the chunk size
+    if isinstance(chunk_size, bool) or \
+       not isinstance(chunk_size, int) or chunk_size <= 0:
+        chunk_size = _STREAM_CHUNK_SIZE
+
+    with Path(source_path).open(mode="rb") as f_in, \
+         Path(target_path).open(mode="wb") as f_out:
+        in_bytes: bytes = f_in.read(chunk_size)
+        while in_bytes:
+            result += f_out.write(codec.feed(chunk=in_bytes))
+            in_bytes = f_in.read(chunk_size)
+        result += f_out.write(codec.finish())
 
     return result
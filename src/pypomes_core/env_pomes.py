@@ -1,17 +1,240 @@
 import ast
 import os
+import threading
 from base64 import b64decode, urlsafe_b64decode
+from collections.abc import Callable
 from contextlib import suppress
 from datetime import date
 from dateutil import parser
 from dateutil.parser import ParserError
 from enum import IntEnum, StrEnum
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Final, Literal
 
-# the prefix for the names of the environment variables
-APP_PREFIX: Final[str] = os.getenv(key="PYPOMES_APP_PREFIX",
-                                   default="")
+
+class _DotenvSource:
+    """
+    A *dotenv* file, holding *KEY=value* lines, as a source of values for the environment.
+
+    The file is parsed again only if its modification time or size have changed.
+    """
+    __slots__ = ("path", "stamp", "values")
+
+    def __init__(self,
+                 path: Path) -> None:
+        """
+        Register the *dotenv* file at *path*.
+
+        :param path: path to the *dotenv* file
+        """
+        self.path: Path = path
+        self.stamp: tuple[int, int] | None = None
+        self.values: dict[str, str] = {}
+
+    def get(self,
+            key: str) -> str | None:
+        """
+        Retrieve the value defined for *key* in the *dotenv* file.
+
+        :param key: the key which the value is associated with
+        :return: the value associated with the key, or *None* if it is not defined
+        """
+        stamp: tuple[int, int] | None = _env_file_stamp(path=self.path)
+        if stamp != self.stamp:
+            values: dict[str, str] = {}
+            if stamp:
+                with suppress(OSError, UnicodeDecodeError):
+                    values = _env_parse_dotenv(content=self.path.read_text(encoding="utf-8"))
+            # replace the values at once, for the sake of concurrent readers
+            self.values = values
+            self.stamp = stamp
+
+        return self.values.get(key)
+
+
+class _SecretsSource:
+    """
+    A secrets directory (as mounted by *Docker* or *Kubernetes*), as a source of values for the environment.
+
+    Each file in the directory holds the value for the key given by its name. A file is read again
+    only if its modification time or size have changed.
+    """
+    __slots__ = ("path", "values")
+
+    def __init__(self,
+                 path: Path) -> None:
+        """
+        Register the secrets directory at *path*.
+
+        :param path: path to the secrets directory
+        """
+        self.path: Path = path
+        self.values: dict[str, tuple[tuple[int, int], str]] = {}
+
+    def get(self,
+            key: str) -> str | None:
+        """
+        Retrieve the value defined for *key* in the secrets directory.
+
+        :param key: the key which the value is associated with
+        :return: the value associated with the key, or *None* if it is not defined
+        """
+        # initialize the return variable
+        result: str | None = None
+
+        # the key must name a file within the directory
+        if isinstance(key, str) and key not in [".", ".."] and Path(key).name == key:
+            file_path: Path = self.path / key
+            stamp: tuple[int, int] | None = _env_file_stamp(path=file_path)
+            cached: tuple[tuple[int, int], str] | None = self.values.get(key)
+            if cached and cached[0] == stamp:
+                result = cached[1]
+            elif stamp:
+                with suppress(OSError, UnicodeDecodeError):
+                    # the trailing line break is not part of the value
+                    result = file_path.read_text(encoding="utf-8").rstrip("\r\n")
+                    self.values[key] = (stamp, result)
+
+        return result
+
+
+class _Environ:
+    """
+    The current operating environment, extended with the registered file-backed sources.
+
+    A key is looked up in the process environment first, and then in the sources, in the order they were registered.
+    """
+    __slots__ = ()
+
+    def __getitem__(self,
+                    key: str) -> str:
+        """
+        Retrieve the value defined for *key*.
+
+        :param key: the key which the value is associated with
+        :return: the value associated with the key
+        :raises KeyError: *key* is not defined
+        :raises TypeError: *key* is not a string
+        """
+        result: str | None = self.get(key)
+        if result is None:
+            raise KeyError(key)
+
+        return result
+
+    def get(self,
+            key: str,
+            default: str = None) -> str | None:
+        """
+        Retrieve the value defined for *key*.
+
+        :param key: the key which the value is associated with
+        :param default: the value to return, if *key* is not defined (defaults to *None*)
+        :return: the value associated with the key, or *default* if it is not defined
+        :raises TypeError: *key* is not a string
+        """
+        result: str | None = os.environ.get(key)
+        if result is None:
+            for source in _ENV_SOURCES:
+                result = source.get(key)
+                if result is not None:
+                    break
+            else:
+                result = default
+
+        return result
+
+
+# the registered file-backed sources, in precedence order
+_ENV_SOURCES: Final[list[_DotenvSource | _SecretsSource]] = []
+
+# the environment, as consulted by the 'env_get_*()' functions
+_ENVIRON: Final[_Environ] = _Environ()
+
+
+class EnvConfig:
+    r"""
+    A declarative set of settings, loaded at once from the current operating environment.
+
+    Each key in the specification is associated with one of the *env_get_\*()* functions in this module,
+    along with its parameters (*key* excluded), such as in:
+      - {
+      -   f"{APP_PREFIX}_TZ_LOCAL": (env_get_str, {"def_value": "America/Sao_Paulo"}),
+      -   f"{APP_PREFIX}_MAX_RETRIES": (env_get_int, {"def_value": 3}),
+      -   f"{APP_PREFIX}_DEBUG": env_get_bool
+      - }
+
+    The values are obtained when the configuration is built, and held in a read-only mapping, so that
+    accessing them does not read and parse the environment again. The environment is read again only
+    on *refresh()*, which parses again only the values whose string representations have changed.
+    """
+    __slots__ = ("lock", "raws", "specs", "values")
+
+    def __init__(self,
+                 specs: dict[str, Callable | tuple[Callable, dict[str, Any]]]) -> None:
+        r"""
+        Load the values of the keys in *specs*.
+
+        :param specs: the keys, mapped to their *env_get_\*()* functions and the functions' parameters
+        """
+        self.specs: dict[str, tuple[Callable, dict[str, Any]]] = {
+            key: spec if isinstance(spec, tuple) else (spec, {})
+            for key, spec in specs.items()
+        }
+        self.lock: threading.Lock = threading.Lock()
+        self.raws: MappingProxyType[str, str | None] = MappingProxyType({})
+        self.values: MappingProxyType[str, Any] = MappingProxyType({})
+        self.refresh()
+
+    def __getitem__(self,
+                    key: str) -> Any:
+        """
+        Retrieve the value loaded for *key*.
+
+        :param key: the key which the value is associated with
+        :return: the value associated with the key
+        :raises KeyError: *key* is not in the specification
+        """
+        return self.values[key]
+
+    def get(self,
+            key: str,
+            def_value: Any = None) -> Any:
+        """
+        Retrieve the value loaded for *key*.
+
+        :param key: the key which the value is associated with
+        :param def_value: the value to return, if *key* is not in the specification (defaults to *None*)
+        :return: the value associated with the key, or *def_value* if *key* is not in the specification
+        """
+        return self.values.get(key, def_value)
+
+    def refresh(self) -> list[str]:
+        """
+        Read the environment again, and reload the values whose string representations have changed.
+
+        The values are replaced at once, so that concurrent readers never see a partially refreshed configuration.
+
+        :return: the keys whose values have changed
+        """
+        # initialize the return variable
+        result: list[str] = []
+
+        with self.lock:
+            raws: dict[str, str | None] = {key: _ENVIRON.get(key) for key in self.specs}
+            values: dict[str, Any] = dict(self.values)
+            for key, (func, params) in self.specs.items():
+                if key not in self.values or raws[key] != self.raws.get(key):
+                    value: Any = func(key=key,
+                                      **params)
+                    if key in self.values and value != self.values[key]:
+                        result.append(key)
+                    values[key] = value
+            self.raws = MappingProxyType(raws)
+            self.values = MappingProxyType(values)
+
+        return result
 
 
 def env_get_str(key: str,
@@ -32,7 +255,7 @@ def env_get_str(key: str,
     # initialize the return variable
     result: str | None = None
 
-    value: str = os.getenv(key)
+    value: str = _ENVIRON.get(key)
     # allow for value to be defined as an empty string
     if value is None:
         result = def_value
@@ -67,7 +290,7 @@ def env_get_strs(key: str,
     # initialize the return variable
     result: list[str] | None = None
 
-    vals: str = os.getenv(key)
+    vals: str = _ENVIRON.get(key)
     if vals:
         result = vals.split(",")
         if values:
@@ -96,7 +319,7 @@ def env_get_int(key: str,
     """
     result: int | None
     try:
-        result = int(os.environ[key])
+        result = int(_ENVIRON[key])
         if values and result not in values:
             result = None
     except (AttributeError, KeyError, TypeError):
@@ -121,7 +344,7 @@ def env_get_ints(key: str,
     result: list[int] | None = None
     # noinspection PyUnusedLocal
     with suppress(Exception):
-        vals: list[str] = os.environ[key].split(",")
+        vals: list[str] = _ENVIRON[key].split(",")
         if vals:
             result = [int(val) for val in vals]
             if values:
@@ -147,7 +370,7 @@ def env_get_float(key: str,
     """
     result: float | None
     try:
-        result = float(os.environ[key])
+        result = float(_ENVIRON[key])
         if values and result not in values:
             result = None
     except (AttributeError, KeyError, TypeError):
@@ -172,7 +395,7 @@ def env_get_floats(key: str,
     result: list[float] | None = None
     # noinspection PyUnusedLocal
     with suppress(Exception):
-        vals: list[str] = os.environ[key].split(",")
+        vals: list[str] = _ENVIRON[key].split(",")
         if vals:
             result = [float(val) for val in vals]
             if values:
@@ -201,25 +424,24 @@ def env_get_enum(key: str,
     :param def_value: the value to return, if obtaining the value for *key* fails (defaults to *None*)
     :return: the value associated with the key, or *def_value* if error
     """
-    from .obj_pomes import IntEnumUseName, StrEnumUseName
+    from .obj_pomes import IntEnumUseName, StrEnumUseName, _EnumIndex, _enum_index
 
     # initialize the return variable
     result: Any = None
 
+    # noinspection PyProtectedMember
+    index: _EnumIndex = _enum_index(enum_class=enum_class)
     if issubclass(enum_class, IntEnumUseName | StrEnumUseName):
         # noinspection PyUnresolvedReferences
         name: str = env_get_str(key=key,
-                                values=[e.name for e in (values or enum_class)],
+                                values=[e.name for e in values] if values else index.names,
                                 ignore_case=True,
                                 def_value=def_value.name if def_value else None)
-        if isinstance(name, str):
-            for e in enum_class:
-                if e.name.lower() == name.lower():
-                    result = e
-                    break
+        if isinstance(name, str) and name.lower() in index.by_name:
+            result = enum_class[index.by_name[name.lower()]]
     else:
         value: Any = None
-        vals: list = [e.value for e in (values or enum_class)]
+        vals: list = [e.value for e in values] if values else index.values
         if issubclass(enum_class, StrEnum):
             value: str = env_get_str(key=key,
                                      values=vals,
@@ -229,7 +451,7 @@ def env_get_enum(key: str,
                                      values=vals,
                                      def_value=def_value)
         if value:
-            result = enum_class(value)
+            result = enum_class[index.by_value[value]] if value in index.by_value else enum_class(value)
 
     return result
 
@@ -247,36 +469,32 @@ def env_get_enums(key: str,
     :param enum_class: the *enum* class to consider (must be a subclass of *IntEnum* or *StrEnum*)
     :return: the values associated with the key, or *def_value* if error
     """
-    from .obj_pomes import IntEnumUseName, StrEnumUseName
+    from .obj_pomes import IntEnumUseName, StrEnumUseName, _EnumIndex, _enum_index
 
     # initialize the return variable
     result: list | None = None
 
     enums: list = []
-    values: str = os.getenv(key)
+    values: str = _ENVIRON.get(key)
     if values:
+        # noinspection PyProtectedMember
+        index: _EnumIndex = _enum_index(enum_class=enum_class)
+        use_name: bool = issubclass(enum_class, IntEnumUseName | StrEnumUseName)
         found: bool = False
         names: list[str] = values.split(",")
         for name in names:
-            found = False
-            if issubclass(enum_class, IntEnumUseName | StrEnumUseName):
-                for e in enum_class:
-                    if e.name.lower() == name.lower():
-                        enums.append(e)
-                        found = True
-                        break
+            member_name: str | None
+            if use_name:
+                member_name = index.by_name.get(name.lower())
+            elif issubclass(enum_class, IntEnum) and name.isdigit():
+                member_name = index.by_value.get(int(name))
             else:
-                if issubclass(enum_class, IntEnum) and name.isdigit():
-                    value: int = int(name)
-                else:
-                    value: str = name
-                if value in enum_class:
-                    # noinspection PyCallingNonCallable
-                    enums.append(enum_class(value))
-                    found = True
+                member_name = index.by_value.get(name)
+            found = member_name is not None
             # break on the first failure
             if not found:
                 break
+            enums.append(enum_class[member_name])
         if found:
             result = enums
 
@@ -300,9 +518,9 @@ def env_get_bool(key: str,
     """
     result: bool | None
     try:
-        if os.environ[key].lower() in ["1", "t", "true"]:
+        if _ENVIRON[key].lower() in ["1", "t", "true"]:
             result = True
-        elif os.environ[key].lower() in ["0", "f", "false"]:
+        elif _ENVIRON[key].lower() in ["0", "f", "false"]:
             result = False
         else:
             result = None
@@ -331,7 +549,7 @@ def env_get_bytes(key: str,
     """
     result: bytes | None = None
     try:
-        value: str = os.environ[key]
+        value: str = _ENVIRON[key]
         match encoding:
             case "hex":
                 result = bytes.fromhex(value)
@@ -360,7 +578,7 @@ def env_get_date(key: str,
     """
     result: date
     try:
-        result = parser.parse(os.environ[key]).date()
+        result = parser.parse(_ENVIRON[key]).date()
     except (AttributeError, KeyError, TypeError, ParserError, OverflowError):
         result = def_value
 
@@ -378,7 +596,7 @@ def env_get_path(key: str,
     """
     result: Path
     try:
-        result = Path(os.environ[key]).resolve()
+        result = Path(_ENVIRON[key]).resolve()
     except (AttributeError, KeyError, TypeError):
         result = def_value
 
@@ -404,7 +622,7 @@ def env_get_obj(key: str,
     """
     result: Any
     try:
-        result = ast.literal_eval(node_or_string=os.environ[key])
+        result = ast.literal_eval(node_or_string=_ENVIRON[key])
     except (AttributeError, KeyError, TypeError):
         result = def_value
 
@@ -426,3 +644,104 @@ def env_is_docker() -> bool:
             result = "docker" in f.read()
 
     return result
+
+
+def env_add_source(path: Path | str,
+                   kind: Literal["dotenv", "secrets"] = "dotenv") -> None:
+    r"""
+    Register the file-backed source at *path*, to be consulted by the *env_get_\*()* functions.
+
+    The source may be:
+        - *dotenv*: a file holding *KEY=value* lines (blank lines, comments starting with *#*,
+          the prefix *export*, and quoted values are accepted)
+        - *secrets*: a directory holding a file for each key, named after the key, as mounted
+          by *Docker* or *Kubernetes* (a trailing line break in the file is not part of the value)
+    A key is looked up in the process environment first, and then in the sources, in the order
+    they were registered. The sources are read as needed, and read again only if their files are modified.
+    A source not found is consulted nevertheless, as it might be created later.
+
+    Note that the settings of this package (*APP_PREFIX*, *TEMP_FOLDER*, *TZ_LOCAL*, and the like)
+    are read once, when their modules are imported, and thus ignore the sources registered afterwards.
+    For these to be taken from file-backed sources, the environment variables *PYPOMES_SECRETS_DIR*
+    and *PYPOMES_ENV_FILE* may name a secrets directory and a *dotenv* file, respectively, which are
+    then registered, in this order, as this module is imported.
+
+    :param path: path to the *dotenv* file, or to the secrets directory
+    :param kind: the kind of source
+    :raises ValueError: *kind* is not a known kind of source
+    """
+    match kind:
+        case "dotenv":
+            _ENV_SOURCES.append(_DotenvSource(path=Path(path)))
+        case "secrets":
+            _ENV_SOURCES.append(_SecretsSource(path=Path(path)))
+        case _:
+            err_msg: str = f"Invalid source kind: '{kind}'"
+            raise ValueError(err_msg)
+
+
+def env_clear_sources() -> None:
+    """
+    Unregister all file-backed sources, leaving the process environment as the only source of values.
+    """
+    _ENV_SOURCES.clear()
+
+
+def _env_file_stamp(path: Path) -> tuple[int, int] | None:
+    """
+    Obtain the modification time and the size of the file at *path*.
+
+    :param path: path to the file
+    :return: the modification time, in nanoseconds, and the size of the file, or *None* if it does not exist
+    """
+    # initialize the return variable
+    result: tuple[int, int] | None = None
+
+    with suppress(OSError):
+        stat: os.stat_result = path.stat()
+        result = (stat.st_mtime_ns, stat.st_size)
+
+    return result
+
+
+def _env_parse_dotenv(content: str) -> dict[str, str]:
+    """
+    Parse the *KEY=value* lines in *content*, the content of a *dotenv* file.
+
+    :param content: the content of the *dotenv* file
+    :return: the values in *content*, keyed by their keys
+    """
+    # initialize the return variable
+    result: dict[str, str] = {}
+
+    for line in content.splitlines():
+        entry: str = line.strip()
+        if entry.startswith("export "):
+            entry = entry[7:]
+        key, sep, value = entry.partition("=")
+        key = key.strip()
+        if sep and key and not key.startswith("#"):
+            value = value.strip()
+            # a quoted value ends at its closing quote, and may be followed by a comment
+            end: int = value.find(value[0], 1) if value[:1] in ['"', "'"] else -1
+            if end > 0:
+                value = value[1:end]
+            else:
+                # unquoted value, possibly followed by a comment
+                value = value.split(" #", 1)[0].rstrip()
+            result[key] = value
+
+    return result
+
+
+# register the file-backed sources named in the process environment, ahead of reading any setting
+if os.getenv(key="PYPOMES_SECRETS_DIR"):
+    env_add_source(path=os.environ["PYPOMES_SECRETS_DIR"],
+                   kind="secrets")
+if os.getenv(key="PYPOMES_ENV_FILE"):
+    env_add_source(path=os.environ["PYPOMES_ENV_FILE"],
+                   kind="dotenv")
+
+# the prefix for the names of the environment variables
+APP_PREFIX: Final[str] = _ENVIRON.get(key="PYPOMES_APP_PREFIX",
+                                      default="")
@@ -1,18 +1,70 @@
+import atexit
+import codecs
 import filetype
+import fnmatch
+import hashlib
+import json
 import puremagic
 import mimetypes
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+)
 from contextlib import suppress
 from enum import StrEnum
 from io import BytesIO, StringIO
 from pathlib import Path
 from tempfile import gettempdir
-from typing import Final
+from typing import BinaryIO, Final, Literal
 
-from .env_pomes import APP_PREFIX, env_get_path
+from .env_pomes import APP_PREFIX, env_get_bool, env_get_int, env_get_path
 
 TEMP_FOLDER: Final[Path] = env_get_path(key=f"{APP_PREFIX}_TEMP_FOLDER",
                                         def_value=Path(gettempdir()))
 
+# the lengths of the header and of the trailer of the data inspected in determining its mimetype
+# (the signatures known to 'puremagic' extend to about 36 KB into the header, and 516 bytes into the trailer;
+#  the header is at least 4 KB long, as required by the text/binary heuristics, and the trailer may be empty)
+FILE_SNIFF_HEAD: Final[int] = max(4096, env_get_int(key=f"{APP_PREFIX}_FILE_SNIFF_HEAD",
+                                                    def_value=64 * 1024))
+FILE_SNIFF_TAIL: Final[int] = max(0, env_get_int(key=f"{APP_PREFIX}_FILE_SNIFF_TAIL",
+                                                 def_value=1024))
+
+# the chars normally present in text files:
+#    7: \a (bell)
+#    8: \b (backspace)
+#    9: \t (horizontal tab)
+#   10: \n (newline)
+#   12: \f (form feed)
+#   13: \r (carriage return)
+#   27: \x1b (escape)
+#   0x20 - 0x100, less 0x7f: 32-255 char range, less 127 (the DEL control char)
+_TEXT_CHARS: Final[bytes] = bytes({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7f})
+
+# the maximum number of entries in the mimetype cache (the cache is disabled, unless this is positive)
+FILE_MIMETYPE_CACHE_SIZE: Final[int] = env_get_int(key=f"{APP_PREFIX}_FILE_MIMETYPE_CACHE_SIZE",
+                                                   def_value=0)
+# whether the mimetype cache is persisted in a folder within 'TEMP_FOLDER', across executions
+FILE_MIMETYPE_CACHE_PERSIST: Final[bool] = env_get_bool(key=f"{APP_PREFIX}_FILE_MIMETYPE_CACHE_PERSIST",
+                                                        def_value=False)
+
+# the mimetype cache, keyed by file identity or by content hash, the most recently used entries coming last
+_MIMETYPE_CACHE: Final[OrderedDict[tuple, str]] = OrderedDict()
+_MIMETYPE_CACHE_STATS: Final[dict[str, int]] = {
+    "hits": 0,
+    "misses": 0,
+    "evictions": 0
+}
+_MIMETYPE_CACHE_LOCK: Final[threading.Lock] = threading.Lock()
+# the mimetype cache is persisted in a folder private to the current user
+# (on Windows, the temporary folder is normally private to the user already)
+_MIMETYPE_CACHE_FILE: Final[Path] = TEMP_FOLDER / (f"pypomes-{os.getuid()}" if hasattr(os, "getuid")
+                                                   else "pypomes") / "mimetypes.json"
+
 
 # see https://mimetype.io/all-types
 class Mimetype(StrEnum):
@@ -80,7 +132,8 @@ class Mimetype(StrEnum):
 
 def file_get_data(file_data: BytesIO | StringIO | Path | str | bytes,
                   max_len: int = None,
-                  chunk_size: int = None) -> bytes | None:
+                  chunk_size: int = None,
+                  mode: Literal["bytes", "memoryview", "mmap"] = "bytes") -> bytes | memoryview | mmap.mmap | None:
     """
     Retrieve the data in *file_data*, as implicitly defined by its data type.
 
@@ -91,13 +144,24 @@ def file_get_data(file_data: BytesIO | StringIO | Path | str | bytes,
         - type *str*: *file_data* holds the data (returned as utf8-encoded)
         - type *bytes*: *file_data* holds the data (returned as is)
 
+    The form of the data returned is determined by *mode*:
+        - *bytes*: the data is returned as *bytes*
+        - *memoryview*: the data is returned as a read-only *memoryview*, with no copies made for
+          *bytes* and *BytesIO* (the buffer of *BytesIO* is then exported, and it cannot be resized
+          while the view is held), and a file is read at once into a buffer sized from its length
+        - *mmap*: as *memoryview*, except that a file is memory-mapped for read-only access,
+          and returned as a *mmap* object (an empty file is returned as an empty *memoryview*)
+    Files are read in chunks of *chunk_size* bytes only if their length cannot be determined
+    (e.g., pipes and special files).
+
     :param file_data: the data as implicitly defined by its data type
     :param max_len: optional maximum length of the data to return, defaults to all data
     :param chunk_size: optional chunk size to use in reading the data, defaults to 128 KB
+    :param mode: the form of the data to return (an unknown form defaults to *bytes*)
     :return: the data, or *None* if the file data could not be obtained
     """
     # initialize the return variable
-    result: bytes | None = None
+    result: bytes | memoryview | mmap.mmap | None = None
 
     # normalize the maximum length parameter
     if isinstance(max_len, bool) or \
@@ -109,6 +173,10 @@ def file_get_data(file_data: BytesIO | StringIO | Path | str | bytes,
        not isinstance(chunk_size, int) or chunk_size <= 0:
         chunk_size = 128 * 1024
 
+    # normalize the form of the data to return
+    if mode not in ["bytes", "memoryview", "mmap"]:
+        mode = "bytes"
+
     # what is the argument type ?
     if isinstance(file_data, bytes):
         # argument is type 'bytes'
@@ -118,31 +186,27 @@ def file_get_data(file_data: BytesIO | StringIO | Path | str | bytes,
         # argument is type 'str'
         result = file_data.encode(encoding="utf-8")
 
+    elif isinstance(file_data, BytesIO) and mode != "bytes":
+        # argument is type 'BytesIO', and its buffer is to be exported
+        result = file_data.getbuffer().toreadonly()
+
     elif isinstance(file_data, BytesIO | StringIO):
         # argument is type 'stream'
         file_data.seek(0)
-        result = file_data.read()
+        result = file_data.read(max_len or -1)
         if isinstance(result, str):
             result = result.encode(encoding="utf-8")
 
     elif isinstance(file_data, Path):
         # argument is a file path
-        file_bytes: bytearray = bytearray()
-        file_path: Path = Path(file_data)
-        # get the data
-        with file_path.open(mode="rb") as f:
-            buf_size: int = min(max_len, chunk_size) if max_len else chunk_size
-            in_bytes: bytes = f.read(buf_size)
-            while in_bytes:
-                file_bytes += in_bytes
-                if max_len:
-                    if max_len <= len(file_bytes):
-                        break
-                    buf_size = min(max_len - len(file_bytes), chunk_size)
-                else:
-                    buf_size = chunk_size
-                in_bytes = f.read(buf_size)
-        result = bytes(file_bytes)
+        result = _file_read(file_path=file_data,
+                            max_len=max_len,
+                            chunk_size=chunk_size,
+                            mode=mode)
+
+    if isinstance(result, bytes) and mode != "bytes":
+        # 'memoryview' on 'bytes' is read-only, and makes no copies
+        result = memoryview(result)
 
     if result and max_len and len(result) > max_len:
         result = result[:max_len]
@@ -150,6 +214,163 @@ def file_get_data(file_data: BytesIO | StringIO | Path | str | bytes,
     return result
 
 
+def _file_read(file_path: Path,
+               max_len: int,
+               chunk_size: int,
+               mode: Literal["bytes", "memoryview", "mmap"]) -> bytes | memoryview | mmap.mmap:
+    """
+    Read up to *max_len* bytes of the file at *file_path*, in the form determined by *mode*.
+
+    :param file_path: path to the file
+    :param max_len: maximum length of the data to read (0 for all data)
+    :param chunk_size: chunk size to use in reading a file of unknown length
+    :param mode: the form of the data to return
+    :return: the data in the file
+    """
+    # declare the return variable
+    result: bytes | memoryview | mmap.mmap
+
+    with file_path.open(mode="rb") as f:
+        # size the data up front (special files report a zero length)
+        size: int = os.fstat(f.fileno()).st_size
+        if max_len:
+            size = min(size, max_len)
+        if not size:
+            # empty file, or file of unknown length
+            file_bytes: bytearray = bytearray()
+            for chunk in _file_chunks(stream=f,
+                                      chunk_size=chunk_size,
+                                      max_len=max_len):
+                file_bytes += chunk
+            result = bytes(file_bytes)
+        elif mode == "mmap":
+            result = mmap.mmap(f.fileno(),
+                               length=size,
+                               access=mmap.ACCESS_READ)
+        elif mode == "memoryview":
+            buffer: bytearray = bytearray(size)
+            count: int = f.readinto(buffer)
+            result = memoryview(buffer)[:count].toreadonly()
+        else:
+            result = f.read(size)
+
+    return result
+
+
+def file_iter_chunks(file_data: BytesIO | StringIO | Path | str | bytes,
+                     chunk_size: int = None,
+                     max_len: int = None) -> Iterator[memoryview]:
+    """
+    Iterate on the data in *file_data*, as implicitly defined by its data type, in chunks of up to *chunk_size* bytes.
+
+    The distinction is made with the parameter's type, as done by *file_get_data()*:
+        - type *BytesIO*: *file_data* is a stream of bytes (read from its start)
+        - type *StringIO*: *file_data* is a stream of characters (read from its start, and utf8-encoded incrementally)
+        - type *Path*: *file_data* is a path to a file holding the data
+        - type *str*: *file_data* holds the data (utf8-encoded incrementally)
+        - type *bytes*: *file_data* holds the data
+
+    The chunks are yielded as read-only *memoryview* slices. For *BytesIO* and *Path*, a single buffer
+    is reused for all chunks, so each chunk must be consumed (or copied) before the next one is requested.
+    For *bytes*, the chunks are slices of *file_data* itself, and no copies are made.
+
+    :param file_data: the data as implicitly defined by its data type
+    :param chunk_size: optional maximum size of the chunks, defaults to 128 KB
+    :param max_len: optional maximum length of the data to iterate on, defaults to all data
+    :return: an iterator on the chunks of data
+    """
+    # normalize the maximum length parameter
+    if isinstance(max_len, bool) or \
+       not isinstance(max_len, int) or max_len < 0:
+        max_len = 0
+
+    # normalize the chunk size
+    if isinstance(chunk_size, bool) or \
+       not isinstance(chunk_size, int) or chunk_size <= 0:
+        chunk_size = 128 * 1024
+
+    # what is the argument type ?
+    if isinstance(file_data, bytes):
+        # argument is type 'bytes'
+        view: memoryview = memoryview(file_data)[:max_len or None]
+        for pos in range(0, len(view), chunk_size):
+            yield view[pos:pos + chunk_size]
+
+    elif isinstance(file_data, str):
+        # argument is type 'str'
+        yield from _file_encode_chunks(texts=(file_data[pos:pos + chunk_size]
+                                              for pos in range(0, len(file_data), chunk_size)),
+                                       chunk_size=chunk_size,
+                                       max_len=max_len)
+
+    elif isinstance(file_data, StringIO):
+        # argument is a stream of characters
+        file_data.seek(0)
+        yield from _file_encode_chunks(texts=iter(lambda: file_data.read(chunk_size), ""),
+                                       chunk_size=chunk_size,
+                                       max_len=max_len)
+
+    elif isinstance(file_data, BytesIO):
+        # argument is a stream of bytes
+        file_data.seek(0)
+        yield from _file_chunks(stream=file_data,
+                                chunk_size=chunk_size,
+                                max_len=max_len)
+
+    elif isinstance(file_data, Path):
+        # argument is a file path (the file is read unbuffered, straight into the chunk buffer)
+        with file_data.open(mode="rb",
+                            buffering=0) as f:
+            yield from _file_chunks(stream=f,
+                                    chunk_size=chunk_size,
+                                    max_len=max_len)
+
+
+def _file_chunks(stream: BinaryIO,
+                 chunk_size: int,
+                 max_len: int) -> Iterator[memoryview]:
+    """
+    Iterate on the data read from *stream*, in chunks of up to *chunk_size* bytes, reusing a single buffer.
+
+    :param stream: the binary stream to read from
+    :param chunk_size: maximum size of the chunks
+    :param max_len: maximum length of the data to read (0 for all data)
+    :return: an iterator on the chunks of data, as read-only *memoryview* slices of the buffer
+    """
+    view: memoryview = memoryview(bytearray(min(chunk_size, max_len) if max_len else chunk_size))
+    total: int = 0
+    while not max_len or total < max_len:
+        count: int = stream.readinto(view[:max_len - total] if max_len else view)
+        if not count:
+            break
+        total += count
+        yield view[:count].toreadonly()
+
+
+def _file_encode_chunks(texts: Iterator[str],
+                        chunk_size: int,
+                        max_len: int) -> Iterator[memoryview]:
+    """
+    Iterate on the utf8-encoding of the pieces of text in *texts*, in chunks of up to *chunk_size* bytes.
+
+    :param texts: the pieces of text to encode
+    :param chunk_size: maximum size of the chunks
+    :param max_len: maximum length of the encoded data (0 for all data)
+    :return: an iterator on the chunks of encoded data, as read-only *memoryview* objects
+    """
+    encoder: codecs.IncrementalEncoder = codecs.getincrementalencoder(encoding="utf-8")()
+    total: int = 0
+    for text in texts:
+        data: memoryview = memoryview(encoder.encode(text))
+        if max_len:
+            data = data[:max_len - total]
+        for pos in range(0, len(data), chunk_size):
+            yield data[pos:pos + chunk_size]
+        total += len(data)
+        if max_len and total >= max_len:
+            break
+
+
 def file_get_extension(mimetype: Mimetype | str) -> str | None:
     """
     Obtain and return the file extension best associated with mime type *mimetype*.
@@ -182,6 +403,15 @@ def file_get_mimetype(file_data: Path | str | bytes) -> Mimetype | str:
         - type *str*: *file_data* holds the data as utf8-encoded
         - type *Path*: *file_data* is a path to a file holding the data
 
+    Only the header of the content (its first *FILE_SNIFF_HEAD* bytes) and its trailer (its last
+    *FILE_SNIFF_TAIL* bytes) are retrieved, and they are retrieved only once, for all the heuristics.
+
+    If *FILE_MIMETYPE_CACHE_SIZE* is positive, the mimetypes determined are cached, keyed by the device,
+    inode, size, and modification time of the file, and by the extension in its name, for *Path*, and by
+    a hash of the header and trailer of the content, otherwise. Determining the mimetype of an unchanged
+    file then takes a *stat* call. The extension is part of the key as it is used as a hint by the heuristics,
+    so that hard links and renamed files with different extensions do not share their cached mimetypes.
+
     The heuristics used, as heuristics go, provides an educated guess, not an accurate result.
     If a mimetype is found, and it is not in *Mimetype* (which is a small subset of known mimetypes),
     then its identifying string is returned.
@@ -189,27 +419,200 @@ def file_get_mimetype(file_data: Path | str | bytes) -> Mimetype | str:
     :param file_data: file data, or the path to locate the file
     :return: the probable mimetype, as a *Mimetype* object or as a string
     """
+    # initialize the return variable
+    result: Mimetype | str | None = None
+
+    sample: bytes | None = None
+    key: tuple | None = None
+    if FILE_MIMETYPE_CACHE_SIZE > 0:
+        if isinstance(file_data, Path):
+            with suppress(OSError):
+                stat: os.stat_result = file_data.stat()
+                # the last two suffixes, lowercased, cover the extension hint (e.g. '.tar.gz') given to 'puremagic'
+                key = (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns,
+                       "".join(file_data.suffixes[-2:]).lower())
+        else:
+            sample = _file_sample(file_data=file_data)
+            key = (hashlib.sha1(sample, usedforsecurity=False).hexdigest(),)
+        if key:
+            result = _file_mimetype_cache_get(key=key)
+
+    if result is None:
+        result = _file_sniff_mimetype(file_data=file_data,
+                                      sample=_file_sample(file_data=file_data) if sample is None else sample)
+        if key:
+            _file_mimetype_cache_put(key=key,
+                                     mimetype=result)
+
+    return result
+
+
+def file_mimetype_cache_stats(reset: bool = False) -> dict[str, int]:
+    """
+    Retrieve the statistics of the mimetype cache.
+
+    The mimetype cache is enabled by setting the environment variable *<APP_PREFIX>_FILE_MIMETYPE_CACHE_SIZE*
+    to the maximum number of entries it may hold. The statistics returned are:
+        - *size*: the maximum number of entries
+        - *entries*: the current number of entries
+        - *hits*: the number of mimetypes obtained from the cache
+        - *misses*: the number of mimetypes not obtained from the cache
+        - *evictions*: the number of least recently used entries discarded to make room for new ones
+
+    :param reset: whether to reset the *hits*, *misses*, and *evictions* counters, after retrieving them
+    :return: the statistics of the mimetype cache
+    """
+    with _MIMETYPE_CACHE_LOCK:
+        result: dict[str, int] = {"size": FILE_MIMETYPE_CACHE_SIZE,
+                                  "entries": len(_MIMETYPE_CACHE)} | _MIMETYPE_CACHE_STATS
+        if reset:
+            for key in _MIMETYPE_CACHE_STATS:
+                _MIMETYPE_CACHE_STATS[key] = 0
+
+    return result
+
+
+def file_mimetype_cache_clear() -> None:
+    """
+    Discard all entries in the mimetype cache.
+    """
+    with _MIMETYPE_CACHE_LOCK:
+        _MIMETYPE_CACHE.clear()
+
+
+def file_mimetype_cache_save() -> bool:
+    """
+    Persist the mimetype cache in *TEMP_FOLDER*, to be restored in subsequent executions.
+
+    The cache is written to a folder private to the current user, and it is not persisted
+    if that folder is owned by, or is writable by, other users.
+
+    If *FILE_MIMETYPE_CACHE_PERSIST* is set, the cache is restored when this module is imported,
+    and it is persisted when the application exits.
+
+    :return: *True* if the cache was persisted, *False* otherwise
+    """
+    # initialize the return variable
+    result: bool = False
+
+    with _MIMETYPE_CACHE_LOCK:
+        entries: list[list] = [[list(key), mimetype] for key, mimetype in _MIMETYPE_CACHE.items()]
+    with suppress(OSError):
+        _MIMETYPE_CACHE_FILE.parent.mkdir(mode=0o700,
+                                          exist_ok=True)
+        if _file_is_private(path=_MIMETYPE_CACHE_FILE.parent):
+            # write to a temporary file, and replace the cache file at once
+            temp_file: Path = _MIMETYPE_CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
+            temp_file.write_text(json.dumps(entries),
+                                 encoding="utf-8")
+            temp_file.replace(_MIMETYPE_CACHE_FILE)
+            result = True
+
+    return result
+
+
+def _file_mimetype_cache_get(key: tuple) -> Mimetype | str | None:
+    """
+    Retrieve the mimetype cached for *key*.
+
+    :param key: the identity of the file, or the hash of the content
+    :return: the cached mimetype, or *None* if it is not in the cache
+    """
+    with _MIMETYPE_CACHE_LOCK:
+        result: Mimetype | str | None = _MIMETYPE_CACHE.get(key)
+        if result is None:
+            _MIMETYPE_CACHE_STATS["misses"] += 1
+        else:
+            _MIMETYPE_CACHE_STATS["hits"] += 1
+            _MIMETYPE_CACHE.move_to_end(key)
+
+    return result
+
+
+def _file_mimetype_cache_put(key: tuple,
+                             mimetype: Mimetype | str) -> None:
+    """
+    Cache *mimetype* for *key*, discarding the least recently used entries in excess.
+
+    :param key: the identity of the file, or the hash of the content
+    :param mimetype: the mimetype to cache
+    """
+    with _MIMETYPE_CACHE_LOCK:
+        _MIMETYPE_CACHE[key] = mimetype
+        _MIMETYPE_CACHE.move_to_end(key)
+        while len(_MIMETYPE_CACHE) > FILE_MIMETYPE_CACHE_SIZE:
+            _MIMETYPE_CACHE.popitem(last=False)
+            _MIMETYPE_CACHE_STATS["evictions"] += 1
+
+
+def _file_mimetype_cache_load() -> None:
+    """
+    Restore the mimetype cache persisted in *TEMP_FOLDER*.
+
+    Nothing is restored if the cache file, or its folder, are owned by, or are writable by, other users.
+    Entries not made up of a list of integers and strings, and of a mimetype string, are skipped.
+    """
+    if _file_is_private(path=_MIMETYPE_CACHE_FILE.parent) and \
+       _file_is_private(path=_MIMETYPE_CACHE_FILE):
+        with suppress(Exception):
+            entries: list = json.loads(_MIMETYPE_CACHE_FILE.read_text(encoding="utf-8"))
+            if isinstance(entries, list):
+                for entry in entries[-FILE_MIMETYPE_CACHE_SIZE:]:
+                    if isinstance(entry, list) and len(entry) == 2 and \
+                       isinstance(entry[0], list) and isinstance(entry[1], str) and \
+                       all(isinstance(item, int | str) and not isinstance(item, bool) for item in entry[0]):
+                        key, mimetype = entry
+                        _file_mimetype_cache_put(key=tuple(key),
+                                                 mimetype=Mimetype(mimetype) if mimetype in Mimetype else mimetype)
+
+
+def _file_is_private(path: Path) -> bool:
+    """
+    Determine whether *path* is owned by the current user, and is not writable by other users.
+
+    Where file ownership is not available (as in Windows), *path* need only exist.
+
+    :param path: path to the file or folder
+    :return: *True* if *path* is private to the current user, *False* otherwise
+    """
+    # initialize the return variable
+    result: bool = False
+
+    with suppress(OSError):
+        stat: os.stat_result = path.lstat()
+        result = not hasattr(os, "getuid") or \
+            (stat.st_uid == os.getuid() and not stat.st_mode & 0o022)
+
+    return result
+
+
+def _file_sniff_mimetype(file_data: Path | str | bytes,
+                         sample: bytes) -> Mimetype | str:
+    """
+    Heuristics to determine the mimetype for *file_data*, from the header and trailer of its content in *sample*.
+
+    :param file_data: file data, or the path to locate the file
+    :param sample: the header and trailer of the content
+    :return: the probable mimetype, as a *Mimetype* object or as a string
+    """
     mimetype: str | None = None
-    if isinstance(file_data, str):
-        file_data = file_data.encode()
     with suppress(TypeError):
-        kind: filetype.Type = filetype.guess(obj=file_data)
+        kind: filetype.Type = filetype.guess(obj=sample)
         if kind:
             mimetype = kind.mime
 
     if not mimetype:
-        with suppress(puremagic.PureError):
-            if isinstance(file_data, Path):
-                mimetype = puremagic.from_file(filename=file_data,
-                                               mime=True)
-            else:
-                mimetype = puremagic.from_string(string=file_data,
-                                                 mime=True)
+        # 'puremagic' raises 'ValueError' on empty content
+        with suppress(puremagic.PureError, ValueError):
+            # for files, the extension in the file name is used as a hint
+            mimetype = puremagic.from_string(string=sample,
+                                             mime=True,
+                                             filename=file_data if isinstance(file_data, Path) else None)
     result: Mimetype | str
     if mimetype:
         # for unknown mimetypes, return its identifying string
         result = Mimetype(mimetype) if mimetype in Mimetype else mimetype
-    elif file_is_binary(file_data=file_data):
+    elif _file_is_binary_chunk(chunk=sample[:min(4096, FILE_SNIFF_HEAD)]):
         result = Mimetype.BINARY
     else:
         result = Mimetype.TEXT
@@ -217,6 +620,173 @@ def file_get_mimetype(file_data: Path | str | bytes) -> Mimetype | str:
     return result
 
 
+def _file_sample(file_data: Path | str | bytes) -> bytes:
+    """
+    Obtain the header of the content of *file_data*, followed by its trailer, if the content is longer.
+
+    :param file_data: file data, or the path to locate the file
+    :return: the header and trailer of the content
+    """
+    # initialize the return variable
+    result: bytes = b""
+
+    if isinstance(file_data, Path):
+        with file_data.open(mode="rb") as f:
+            result = f.read(FILE_SNIFF_HEAD)
+            size: int = os.fstat(f.fileno()).st_size
+            if size > FILE_SNIFF_HEAD:
+                f.seek(max(FILE_SNIFF_HEAD, size - FILE_SNIFF_TAIL))
+                result += f.read(FILE_SNIFF_TAIL)
+    elif isinstance(file_data, str):
+        if len(file_data) > FILE_SNIFF_HEAD + FILE_SNIFF_TAIL:
+            # encode only the characters making up the header and the trailer
+            result = file_data[:FILE_SNIFF_HEAD].encode(encoding="utf-8")[:FILE_SNIFF_HEAD] + \
+                     file_data[len(file_data) - FILE_SNIFF_TAIL:].encode(encoding="utf-8")[-FILE_SNIFF_TAIL:]
+        else:
+            result = file_data.encode(encoding="utf-8")
+    elif isinstance(file_data, bytes):
+        # slicing from the length, as a trailer of length 0 would have '[-0:]' take the whole content
+        result = file_data[:FILE_SNIFF_HEAD] + file_data[len(file_data) - FILE_SNIFF_TAIL:] \
+                 if len(file_data) > FILE_SNIFF_HEAD + FILE_SNIFF_TAIL else file_data
+
+    return result
+
+
+def file_classify_tree(root: Path | str,
+                       pattern: str = "*",
+                       workers: int = None,
+                       processes: bool = False,
+                       max_pending: int = None) -> Iterator[tuple[Path, Mimetype | str | None, bool | None]]:
+    """
+    Classify the files in the directory tree at *root*, as to their mimetypes and whether their contents are binary.
+
+    The tree is walked with *os.scandir()*, descending into subdirectories but not following symbolic links
+    to directories, and the files whose names match *pattern* (as per *fnmatch*) are classified by a pool of
+    *workers* threads, as reading the files is I/O-bound. If *processes* is set, a pool of *workers* processes
+    is used instead, for when the heuristics (notably *puremagic*'s) are the bottleneck. Each file is read once,
+    and only its header and trailer are read, as done by *file_get_mimetype()*.
+
+    The classifications are yielded as they complete, as tuples *(<path>, <mimetype>, <is-binary>)*,
+    with *None* for the mimetype and binary indication of files which could not be read. At most
+    *max_pending* files are submitted to the pool and not yet yielded at any time.
+
+    :param root: path to the root of the directory tree
+    :param pattern: optional pattern the file names must match, defaults to all files
+    :param workers: optional number of workers in the pool, defaults to the number of CPUs (plus 4, for threads)
+    :param processes: whether to use a pool of processes, rather than a pool of threads (defaults to *False*)
+    :param max_pending: optional maximum number of files being classified at any time, defaults to 4 per worker
+    :return: an iterator on the classifications of the files
+    :raises FileNotFoundError: *root* does not exist
+    :raises NotADirectoryError: *root* is not a directory
+    """
+    # the root must be a directory (subdirectories which cannot be read are skipped)
+    root_path: Path = Path(root)
+    if not root_path.exists():
+        err_msg: str = f"No such directory: '{root_path}'"
+        raise FileNotFoundError(err_msg)
+    if not root_path.is_dir():
+        err_msg = f"Not a directory: '{root_path}'"
+        raise NotADirectoryError(err_msg)
+
+    # normalize the number of workers (defaulting as the pools do)
+    if isinstance(workers, bool) or \
+       not isinstance(workers, int) or workers <= 0:
+        workers = (os.cpu_count() or 1) if processes else min(32, (os.cpu_count() or 1) + 4)
+
+    # normalize the maximum number of pending files
+    if isinstance(max_pending, bool) or \
+       not isinstance(max_pending, int) or max_pending <= 0:
+        max_pending = 4 * workers
+
+    return _file_classify_pool(root=root_path,
+                               pattern=pattern,
+                               workers=workers,
+                               processes=processes,
+                               max_pending=max_pending)
+
+
+def _file_classify_pool(root: Path,
+                        pattern: str,
+                        workers: int,
+                        processes: bool,
+                        max_pending: int) -> Iterator[tuple[Path, Mimetype | str | None, bool | None]]:
+    """
+    Classify the files in the directory tree at *root* with a pool of *workers* threads or processes.
+
+    :param root: path to the root of the directory tree
+    :param pattern: the pattern the file names must match
+    :param workers: the number of workers in the pool
+    :param processes: whether to use a pool of processes, rather than a pool of threads
+    :param max_pending: the maximum number of files being classified at any time
+    :return: an iterator on the classifications of the files
+    """
+    # create the pool
+    executor: Executor = ProcessPoolExecutor(max_workers=workers) if processes \
+        else ThreadPoolExecutor(max_workers=workers)
+    pending: set[Future] = set()
+    try:
+        for file_path in _file_walk(root=root,
+                                    pattern=pattern):
+            pending.add(executor.submit(_file_classify, file_path))
+            if len(pending) >= max_pending:
+                # wait for room in the pool
+                done, pending = wait(fs=pending,
+                                     return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        # drain the pool
+        while pending:
+            done, pending = wait(fs=pending,
+                                 return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        # discard the work not yet started, if the iteration is abandoned
+        executor.shutdown(cancel_futures=True)
+
+
+def _file_walk(root: Path,
+               pattern: str) -> Iterator[Path]:
+    """
+    Iterate on the files in the directory tree at *root* whose names match *pattern*.
+
+    Symbolic links to directories are not followed, and directories which cannot be read are skipped.
+
+    :param root: path to the root of the directory tree
+    :param pattern: the pattern the file names must match
+    :return: an iterator on the paths to the files
+    """
+    folders: list[Path] = [root]
+    while folders:
+        with suppress(OSError), os.scandir(folders.pop()) as entries:
+            for entry in entries:
+                with suppress(OSError):
+                    if entry.is_dir(follow_symlinks=False):
+                        folders.append(Path(entry.path))
+                    elif entry.is_file() and fnmatch.fnmatch(entry.name, pattern):
+                        yield Path(entry.path)
+
+
+def _file_classify(file_path: Path) -> tuple[Path, Mimetype | str | None, bool | None]:
+    """
+    Classify the file at *file_path*, as to its mimetype and whether its content is binary.
+
+    :param file_path: path to the file
+    :return: the path to the file, its mimetype, and whether its content is binary (*None* if it could not be read)
+    """
+    # initialize the return variable
+    result: tuple[Path, Mimetype | str | None, bool | None] = (file_path, None, None)
+
+    with suppress(OSError):
+        sample: bytes = _file_sample(file_data=file_path)
+        result = (file_path,
+                  _file_sniff_mimetype(file_data=file_path,
+                                       sample=sample),
+                  _file_is_binary_chunk(chunk=sample[:min(4096, FILE_SNIFF_HEAD)]))
+
+    return result
+
+
 def file_is_binary(file_data: Path | str | bytes) -> bool:
     """
     Heuristics to determine whether the content of *file_data* is binary.
@@ -239,23 +809,31 @@ def file_is_binary(file_data: Path | str | bytes) -> bool:
     # obtain up to 1024 bytes of content for analysis
     chunk: bytes = file_get_data(file_data=file_data,
                                  max_len=4096) or b""
+
+    return _file_is_binary_chunk(chunk=chunk)
+
+
+def _file_is_binary_chunk(chunk: bytes) -> bool:
+    """
+    Heuristics to determine whether *chunk*, the initial content of some data, is binary.
+
+    :param chunk: the initial content of the data
+    :return: *True* if the determination resulted positive, *False* otherwise
+    """
     # check for null byte
     result: bool = b"\0" in chunk
 
     # check for non-printable characters
     if not result:
-        # remove the chars listed below - chars remaining indicates content is binary
-        #    7: \a (bell)
-        #    8: \b (backspace)
-        #    9: \t (horizontal tab)
-        #   10: \n (newline)
-        #   12: \f (form feed)
-        #   13: \r (carriage return)
-        #   27: \x1b (escape)
-        #   0x20 - 0x100, less 0x7f: 32-255 char range, less 127 (the DEL control char)
-        text_characters = bytearray({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7f})
+        # remove the text chars - chars remaining indicates content is binary
         translation: bytes = chunk.translate(None,
-                                             delete=text_characters)
+                                             delete=_TEXT_CHARS)
         result = bool(translation)
 
     return result
+
+
+# restore the persisted mimetype cache, and persist it on exit
+if FILE_MIMETYPE_CACHE_SIZE > 0 and FILE_MIMETYPE_CACHE_PERSIST:
+    _file_mimetype_cache_load()
+    atexit.register(file_mimetype_cache_save)
@@ -13,6 +13,75 @@ func_defaulted_params: ContextVar[list[str]] = ContextVar("defaulted_params")
 func_specified_params: ContextVar[list[str]] = ContextVar("specified_params")
 
 
+class _FuncSpec:
+    """
+    The signature analysis of a decorated function, computed once, on its first call.
+
+    Deferring the analysis past decoration time keeps annotations holding forward references
+    from being evaluated at import time.
+
+    Calls passing at most as many positional arguments as there are positional parameters,
+    and only keyword arguments naming parameters, are bound directly. Other calls (such as those supplying
+    variable positional or keyword arguments, or invalid ones) are bound by *Signature.bind()*.
+    """
+    __slots__ = ("defaults", "keywords", "names", "positionals", "required", "signature")
+
+    def __init__(self,
+                 func: Callable) -> None:
+        """
+        Analyze the signature of *func*.
+
+        :param func: the function being decorated
+        """
+        self.signature: inspect.Signature = inspect.signature(func)
+        params: list[inspect.Parameter] = list(self.signature.parameters.values())
+        # all parameters, less '*args' and '**kwargs', in declaration order
+        self.names: tuple[str, ...] = tuple(param.name for param in params
+                                            if param.kind not in [inspect.Parameter.VAR_POSITIONAL,
+                                                                  inspect.Parameter.VAR_KEYWORD])
+        # the parameters which may be passed positionally
+        self.positionals: tuple[str, ...] = tuple(param.name for param in params
+                                                  if param.kind in [inspect.Parameter.POSITIONAL_ONLY,
+                                                                    inspect.Parameter.POSITIONAL_OR_KEYWORD])
+        # the parameters which may be passed by keyword
+        self.keywords: frozenset[str] = frozenset(param.name for param in params
+                                                  if param.kind in [inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                                                                    inspect.Parameter.KEYWORD_ONLY])
+        # the parameters with defaults, and the parameters which must be passed
+        self.defaults: dict[str, Any] = {param.name: param.default for param in params
+                                         if param.name in self.names and param.default is not param.empty}
+        self.required: frozenset[str] = frozenset(self.names) - self.defaults.keys()
+
+    def bind(self,
+             args: tuple,
+             kwargs: dict[str, Any]) -> dict[str, Any]:
+        """
+        Bind the arguments in *args* and *kwargs* to the parameters they were explicitly passed to.
+
+        :param args: the positional arguments in the call
+        :param kwargs: the keyword arguments in the call
+        :return: the explicitly passed arguments, keyed by parameter, in declaration order
+        :raises TypeError: the arguments do not match the signature
+        """
+        # bind the positional arguments
+        result: dict[str, Any] = dict(zip(self.positionals, args, strict=False))
+        if len(args) > len(self.positionals) or \
+           (kwargs and (not kwargs.keys() <= self.keywords or
+                        not kwargs.keys().isdisjoint(result))):
+            # not a simple call (or an invalid one)
+            result = dict(self.signature.bind(*args, **kwargs).arguments)
+        else:
+            if kwargs:
+                # bind the keyword arguments, preserving the declaration order
+                result.update(kwargs)
+                result = {name: result[name] for name in self.names if name in result}
+            if not self.required <= result.keys():
+                # missing arguments (let 'Signature.bind()' raise the appropriate error)
+                self.signature.bind(*args, **kwargs)
+
+        return result
+
+
 def func_capture_args(func: Callable) -> Callable:
     """
     Create a decorator to identify arguments in a function which were defaulted, and which were explicitly passed.
@@ -30,33 +99,23 @@ def func_capture_args(func: Callable) -> Callable:
     :param func: the function being decorated
     :return: the return from the call to *func*
     """
+    # the signature analysis of 'func', performed once, on its first call
+    specs: list[_FuncSpec] = []
+
     @wraps(func)
     # ruff: noqa: ANN003 - Missing type annotation for *{name}
     def wrapper(*args, **kwargs) -> Any:
-
-        sig = inspect.signature(func)
-
-        # bind only explicitly passed arguments
-        bound_explicit = sig.bind(*args, **kwargs)
-        bound_explicit.apply_defaults()
-
-        # bind all arguments (with defaults applied)
-        bound_all = sig.bind(*args, **kwargs)
-        bound_all.apply_defaults()
-
-        # All parameters with defaults
-        with_defaults = {
-            name for name, param in sig.parameters.items()
-            if param.default is not inspect.Parameter.empty
-        }
+        if not specs:
+            specs.append(_FuncSpec(func=func))
+        spec: _FuncSpec = specs[0]
 
         # explicitly passed arguments
-        explicitly_passed: dict[str, Any] = dict(bound_explicit.arguments)
+        explicitly_passed: dict[str, Any] = spec.bind(args=args,
+                                                      kwargs=kwargs)
 
         # arguments that used default values
         used_defaults: dict[str, Any] = {
-            name: bound_all.arguments[name]
-            for name in with_defaults
+            name: value for name, value in spec.defaults.items()
             if name not in explicitly_passed
         }
 
@@ -90,29 +149,27 @@ def func_capture_params(func: Callable) -> Callable:
     :param func: the function being decorated
     :return: the return from the call to *func*
     """
+    # the signature analysis of 'func', performed once, on its first call
+    specs: list[_FuncSpec] = []
+
     @wraps(func)
     # ruff: noqa: ANN003 - Missing type annotation for *{name}
     def wrapper(*args, **kwargs) -> Any:
+        if not specs:
+            specs.append(_FuncSpec(func=func))
+        spec: _FuncSpec = specs[0]
 
-        sig = inspect.signature(func)
-        bound = sig.bind(*args, **kwargs)
-        bound.apply_defaults()
-
-        # all parameters with defaults
-        with_defaults: set[str] = {
-            name for name, param in sig.parameters.items()
-            if param.default is not inspect.Parameter.empty
-        }
-
-        # explicitly passed parameters (from bind, before defaults applied)
-        explicitly_passed: set[str] = set(sig.bind(*args, **kwargs).arguments.keys())
+        # explicitly passed parameters
+        explicitly_passed: dict[str, Any] = spec.bind(args=args,
+                                                      kwargs=kwargs)
 
         # parameters that used default values
-        used_defaults: set[str] = with_defaults - explicitly_passed
+        used_defaults: list[str] = [name for name in spec.defaults
+                                    if name not in explicitly_passed]
 
         # store in context variables
         func_specified_params.set(list(explicitly_passed))
-        func_defaulted_params.set(list(used_defaults))
+        func_defaulted_params.set(used_defaults)
 
         # proceed executing the decorated function
         return func(*args, **kwargs)
@@ -1,50 +1,204 @@
 import contextlib
-from collections import defaultdict
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable, Iterator
 from datetime import date
 from enum import Enum
+from itertools import chain
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
+
+from .dict_pomes import TransformPlan, dict_transform
+
+
+class _ListMembership:
+    """
+    Membership verification for the items in a *list*, backed by a *set* for its hashable items.
+
+    The unhashable items, if any, are kept in a *list*, which is scanned only for unhashable candidates,
+    or when the candidate is not found among the hashable items.
+    """
+    __slots__ = ("hashables", "unhashables")
+
+    def __init__(self,
+                 source: list = None) -> None:
+        """
+        Index the items in *source*.
+
+        :param source: the list whose items are to be indexed (defaults to no items)
+        """
+        self.hashables: set = set()
+        self.unhashables: list = []
+        try:
+            self.hashables.update(source or [])
+        except TypeError:
+            # 'source' contains unhashable items, segregate them
+            for item in source:
+                self.add(item=item)
+
+    def add(self,
+            item: Any) -> None:
+        """
+        Add *item* to the indexed items.
+
+        :param item: the item to add
+        """
+        try:
+            self.hashables.add(item)
+        except TypeError:
+            # 'item' is unhashable
+            self.unhashables.append(item)
+
+    def contains(self,
+                 item: Any) -> bool:
+        """
+        Indicate whether *item* is in the indexed list.
+
+        :param item: the item to verify
+        :return: *True* if *item* is in the indexed list, *False* otherwise
+        """
+        # declare the return variable
+        result: bool
+
+        try:
+            result = item in self.hashables or (bool(self.unhashables) and item in self.unhashables)
+        except TypeError:
+            # 'item' is unhashable
+            result = item in self.unhashables
+
+        return result
 
 
 def list_compare(list1: list,
-                 list2: list) -> bool:
+                 list2: list,
+                 differences: list[tuple[Any, int, int]] = None) -> bool:
     """
     Compare the contents of the two lists *list1* e *list2*.
 
     Return *True* if all the elements in *list1* are also in *list2*, and vice versa, with the same cardinality.
     The input list need not be sorted.
 
+    The elements are counted with hashing, and the comparison is abandoned on the first mismatch found.
+    If the lists contain unhashable elements, they are compared by sorting, if possible, or else by counting
+    each of their elements. If *differences* is provided, the comparison is carried out to the end, and
+    a tuple *(element, count in list1, count in list2)* is added to it for each element whose counts differ.
+
     :param list1: the first list
     :param list2: the second list
+    :param differences: optional list to collect the elements whose counts differ, along with their counts
     :return: True if the two lists contain the same elements, in the same quantity, in any order
     """
     # initialize the return variable
-    result: bool = True
-
-    # are the input parameters lists containing the same number of elements ?
-    if isinstance(list1, list) and \
-       isinstance(list2, list) and \
-       len(list1) == len(list2):
-        # yes, verify whether all elements in 'list1' are also in 'list2', in the same quantity
-        for elem in list1:
-            # is 'elem' in both lists, in the same quantity ?
-            if list1.count(elem) != list2.count(elem):
-                # no, the lists are not equal
-                result = False
-                break
-    else:
-        # no, the lists are not equal
-        result = False
-
+    result: bool = False
+
+    # are the input parameters lists ?
+    if isinstance(list1, list) and isinstance(list2, list):
+        # yes, proceed
+        if isinstance(differences, list):
+            # tally the elements in both lists and report those with different counts
+            result = _list_tally_differences(tally1=_list_tally(source=list1),
+                                             tally2=_list_tally(source=list2),
+                                             differences=differences) == 0
+
+        # do the lists contain the same number of elements ?
+        elif len(list1) == len(list2):
+            # yes, verify whether all elements in 'list1' are also in 'list2', in the same quantity
+            counts: Counter | None = None
+            with contextlib.suppress(TypeError):
+                counts = Counter(list1)
+            if counts is not None:
+                result = True
+                try:
+                    for elem in list2:
+                        elem_count: int = counts.get(elem, 0)
+                        # is 'elem' in 'list1' at least as many times as it has been found in 'list2' so far ?
+                        if elem_count == 0:
+                            # no, the lists are not equal
+                            result = False
+                            break
+                        counts[elem] = elem_count - 1
+                except TypeError:
+                    # 'list2' has an unhashable element, which is not in 'list1'
+                    result = False
+            else:
+                # 'list1' has unhashable elements, compare the sorted lists, if possible
+                try:
+                    result = sorted(list1) == sorted(list2)
+                except TypeError:
+                    # the elements are not comparable, compare their counts
+                    result = _list_tally_differences(tally1=_list_tally(source=list1),
+                                                     tally2=_list_tally(source=list2),
+                                                     differences=[]) == 0
     return result
 
 
+def _list_tally(source: list) -> tuple[Counter, list[list]]:
+    """
+    Count the occurrences of the elements in *source*.
+
+    The hashable elements are counted with a *Counter*, and the unhashable ones in *[element, count]* pairs.
+
+    :param source: the list whose elements are to be counted
+    :return: the counts of the hashable elements, and of the unhashable elements
+    """
+    hashables: Counter = Counter()
+    unhashables: list[list] = []
+    for elem in source:
+        try:
+            hashables[elem] += 1
+        except TypeError:
+            # 'elem' is unhashable
+            found: bool = False
+            for pair in unhashables:
+                if pair[0] == elem:
+                    pair[1] += 1
+                    found = True
+                    break
+            if not found:
+                unhashables.append([elem, 1])
+
+    return hashables, unhashables
+
+
+def _list_tally_differences(tally1: tuple[Counter, list[list]],
+                            tally2: tuple[Counter, list[list]],
+                            differences: list[tuple[Any, int, int]]) -> int:
+    """
+    Add to *differences* a tuple *(element, count in tally1, count in tally2)* for each element whose counts differ.
+
+    :param tally1: the element counts for the first list
+    :param tally2: the element counts for the second list
+    :param differences: the list to collect the elements whose counts differ, along with their counts
+    :return: the number of elements whose counts differ
+    """
+    count: int = len(differences)
+
+    # compare the counts of the hashable elements
+    counts1, pairs1 = tally1
+    counts2, pairs2 = tally2
+    differences.extend((elem, elem_count, counts2[elem])
+                       for elem, elem_count in counts1.items() if elem_count != counts2[elem])
+    differences.extend((elem, 0, elem_count)
+                       for elem, elem_count in counts2.items() if elem not in counts1)
+
+    # compare the counts of the unhashable elements
+    for elem, elem_count in pairs1:
+        other_count: int = next((pair[1] for pair in pairs2 if pair[0] == elem), 0)
+        if elem_count != other_count:
+            differences.append((elem, elem_count, other_count))
+    for elem, elem_count in pairs2:
+        if not any(pair[0] == elem for pair in pairs1):
+            differences.append((elem, 0, elem_count))
+
+    return len(differences) - count
+
+
 def list_correlate(list_first: list,
                    list_second: list,
                    only_in_first: bool = False,
                    only_in_second: bool = False,
                    in_both: bool = False,
-                   is_sorted: bool = False) -> tuple:
+                   is_sorted: bool = False,
+                   engine: Literal["auto", "hash", "sorted", "scan"] = "auto") -> tuple:
     """
     Correlate *list_first* and *list_second* by computing their differences.
 
@@ -55,10 +209,18 @@ def list_correlate(list_first: list,
     If none of these parameters have been specified, no correlation is carried out and an empty tuple is returned.
 
     The parameter *is_sorted* indicates that both *list_first* and *list_second* are ascendingly or
-    descendingly sorted, and binary search is used in the correlation process.
+    descendingly sorted, and a single-pass merge is used in the correlation process.
 
-    Note that, depending on the context, a returning list might be the same object as *list_first*
-    or *list_second*. The input lists need not be sorted.
+    The parameter *engine* specifies how the correlation is carried out:
+      - *hash*: membership is verified with *sets* built from the lists (unhashable items are scanned for)
+      - *sorted*: the lists are merged in a single pass (both lists must be sorted, and may be any iterables)
+      - *scan*: membership is verified by scanning the lists (fit for small lists, only)
+      - *auto*: *sorted*, if *is_sorted* has been specified, otherwise *hash* (the default,
+        also assumed for unknown engines)
+
+    In all cases, the items in the returned lists keep the order and the multiplicity they have
+    in the input lists. Note that, depending on the context, a returning list might be the same
+    object as *list_first* or *list_second*. The input lists need not be sorted.
 
     :param list_first: the first list to consider
     :param list_second: the second list to consider
@@ -66,6 +228,7 @@ def list_correlate(list_first: list,
     :param only_in_second: include list of items existing in *list_second* but not in *list_first*
     :param in_both: include list of items existing in both lists
     :param is_sorted: *list_first* and *list_second* are both ascendingly or descendingly sorted
+    :param engine: the correlation engine to use (defaults to *auto*)
     :return: a tuple containing up to three lists, resulting from correlating the input lists
     """
     # initialize the return variable
@@ -76,20 +239,38 @@ def list_correlate(list_first: list,
         result_second: list = []
         result_both: list = []
 
+        # normalize the correlation engine
+        if engine not in ["auto", "hash", "sorted", "scan"]:
+            engine = "auto"
+        if engine == "auto":
+            engine = "sorted" if is_sorted else "hash"
+
         if list_first and list_second:
-            if is_sorted:
+            if engine == "sorted":
+                # merge the sorted lists in a single pass
+                for item, is_in_first, is_in_second in list_correlate_sorted(iter_first=list_first,
+                                                                             iter_second=list_second):
+                    if not is_in_second:
+                        if only_in_first:
+                            result_first.append(item)
+                    elif not is_in_first:
+                        if only_in_second:
+                            result_second.append(item)
+                    elif in_both:
+                        result_both.append(item)
+            elif engine == "hash":
                 if in_both or only_in_first:
+                    in_second: _ListMembership = _ListMembership(source=list_second)
                     for item in list_first:
-                        if list_bin_search(source=list_second,
-                                           item=item) < 0:
-                            if only_in_first:
-                                result_first.append(item)
-                        elif in_both:
-                            result_both.append(item)
+                        if in_second.contains(item=item):
+                            if in_both:
+                                result_both.append(item)
+                        elif only_in_first:
+                            result_first.append(item)
                 if only_in_second:
-                    result_second = [item for item in list_second if list_bin_search(source=list_first,
-                                                                                     item=item) < 0]
-            else:
+                    in_first: _ListMembership = _ListMembership(source=list_first)
+                    result_second = [item for item in list_second if not in_first.contains(item=item)]
+            elif engine == "scan":
                 if in_both or only_in_first:
                     for item in list_first:
                         if item in list_second:
@@ -117,6 +298,87 @@ def list_correlate(list_first: list,
     return result
 
 
+def list_correlate_sorted(iter_first: Iterable,
+                          iter_second: Iterable,
+                          descending: bool = None) -> Iterator[tuple[Any, bool, bool]]:
+    """
+    Correlate the sorted iterables *iter_first* and *iter_second*, by merging them in a single pass.
+
+    For each item, a tuple *(item, is_in_first, is_in_second)* is yielded, in merge order:
+      - *(item, True, False)*: *item* exists in *iter_first* but not in *iter_second*
+      - *(item, False, True)*: *item* exists in *iter_second* but not in *iter_first*
+      - *(item, True, True)*: *item* exists in both iterables (the instance in *iter_first* is yielded)
+    Items repeated in *iter_first* are yielded as many times as they occur therein. Items in *iter_second*
+    which also exist in *iter_first* are not yielded on their own.
+
+    Both iterables must be sorted in the same direction, which is inferred from the first
+    distinct items found, unless specified in *descending*. As the iterables are consumed as the merge
+    progresses, they may be generators or database cursors too large to be loaded into memory.
+
+    :param iter_first: the first sorted iterable to consider
+    :param iter_second: the second sorted iterable to consider
+    :param descending: whether the iterables are descendingly sorted (defaults to inferring it)
+    :return: an iterator over the tuples correlating the items in the iterables
+    """
+    items_first: Iterator = iter(iter_first)
+    items_second: Iterator = iter(iter_second)
+
+    # infer the sorting direction, if necessary
+    if descending is None:
+        head_first, descending = _list_sort_direction(items=items_first)
+        items_first = chain(head_first, items_first)
+        if descending is None:
+            head_second, descending = _list_sort_direction(items=items_second)
+            items_second = chain(head_second, items_second)
+
+    end: object = object()
+    item_first: Any = next(items_first, end)
+    item_second: Any = next(items_second, end)
+    while item_first is not end and item_second is not end:
+        if item_first == item_second:
+            # yield the matching items in 'iter_first', and skip those in 'iter_second'
+            value: Any = item_first
+            while item_first is not end and item_first == value:
+                yield item_first, True, True
+                item_first = next(items_first, end)
+            while item_second is not end and item_second == value:
+                item_second = next(items_second, end)
+        elif (item_first > item_second) if descending else (item_first < item_second):
+            yield item_first, True, False
+            item_first = next(items_first, end)
+        else:
+            yield item_second, False, True
+            item_second = next(items_second, end)
+
+    # yield the remaining items
+    while item_first is not end:
+        yield item_first, True, False
+        item_first = next(items_first, end)
+    while item_second is not end:
+        yield item_second, False, True
+        item_second = next(items_second, end)
+
+
+def _list_sort_direction(items: Iterator) -> tuple[list, bool | None]:
+    """
+    Infer the sorting direction of *items*, by consuming it up to its first item distinct from the initial one.
+
+    :param items: the sorted items
+    :return: the items consumed, and whether they are descendingly sorted (*None* if it could not be inferred)
+    """
+    # initialize the return variables
+    head: list = []
+    descending: bool | None = None
+
+    for item in items:
+        head.append(item)
+        if item != head[0]:
+            descending = item < head[0]
+            break
+
+    return head, descending
+
+
 def list_bin_search(source: list,
                     item: Any) -> int:
     """
@@ -236,7 +498,7 @@ def list_get_coupled(coupled_elements: list[tuple[str, Any]],
 
 
 def list_transform(source: list,
-                   from_to_keys: list[tuple[str, Any]],
+                   from_to_keys: list[tuple[str, Any]] | TransformPlan,
                    prefix_from: str = None,
                    prefix_to: str = None,
                    add_missing: bool = False) -> list:
@@ -251,42 +513,52 @@ def list_transform(source: list,
     If *add_missing* is *True*, the entries in *source* whose keys are missing in *from_to_keys*
     are added to the new *list*.
 
+    If *from_to_keys* is a *TransformPlan* (see *dict_compile_transform()*), it is used to carry out
+    the transformation, and *add_missing* is the one the plan was compiled with.
+
     :param source: the source *dict* of the values
-    :param from_to_keys: the list of tuples containing the source and destination key sequences
+    :param from_to_keys: the list of tuples containing the source and destination key sequences, or its compiled plan
     :param prefix_from: prefix to be added to the source keys
     :param prefix_to: prefix to be removed from the target keys
     :param add_missing: whether to add entries in *source* missing in *from_to_keys* (defaults to *False*)
     :return: the new list
     """
-    from .dict_pomes import dict_transform
-
     # initialize the return variable
-    result: list = []
-
-    # traverse the source list
-    for inx, value in enumerate(source):
-        from_keys: str | None = None
-        if prefix_from:
-            from_keys: str = f"{prefix_from}[{inx}]"
-
-        # obtain the target value
-        if isinstance(value, dict):
-            to_value: dict = dict_transform(source=value,
-                                            from_to_keys=from_to_keys,
-                                            prefix_from=from_keys,
-                                            prefix_to=prefix_to,
-                                            add_missing=add_missing)
-        elif isinstance(value, list):
-            to_value: list = list_transform(source=value,
-                                            from_to_keys=from_to_keys,
-                                            prefix_from=from_keys,
-                                            prefix_to=prefix_to,
-                                            add_missing=add_missing)
-        else:
-            to_value: Any = value
+    result: list
+
+    # has a compiled plan been provided ?
+    if isinstance(from_to_keys, TransformPlan):
+        # yes, use it
+        result = from_to_keys.transform(source=source,
+                                        prefix_from=prefix_from,
+                                        prefix_to=prefix_to)
+    else:
+        result = []
+
+        # traverse the source list
+        for inx, value in enumerate(source):
+            from_keys: str | None = None
+            if prefix_from:
+                from_keys: str = f"{prefix_from}[{inx}]"
+
+            # obtain the target value
+            if isinstance(value, dict):
+                to_value: dict = dict_transform(source=value,
+                                                from_to_keys=from_to_keys,
+                                                prefix_from=from_keys,
+                                                prefix_to=prefix_to,
+                                                add_missing=add_missing)
+            elif isinstance(value, list):
+                to_value: list = list_transform(source=value,
+                                                from_to_keys=from_to_keys,
+                                                prefix_from=from_keys,
+                                                prefix_to=prefix_to,
+                                                add_missing=add_missing)
+            else:
+                to_value: Any = value
 
-        # added the value transformed to 'result'
-        result.append(to_value)
+            # added the value transformed to 'result'
+            result.append(to_value)
 
     return result
 
@@ -349,37 +621,47 @@ def list_elem_starting_with(source: list[str | bytes],
 
 
 def list_prune_duplicates(target: list,
-                          is_sorted: bool = False) -> list:
+                          is_sorted: bool = False,
+                          key: Callable[[Any], Any] = None) -> list:
     """
     Remove duplicate elements from *target*.
 
     The parameter *is_sorted* indicates that *target* is ascendingly or descendingly sorted.
     In both cases, the original order of the elements in *target* is maintained.
+    If *key* is provided, the elements are considered duplicates if *key* yields the same value for them
+    (e.g., *key=lambda rec: rec["id"]* to remove records with the same *id* field), and the first of them is kept.
     For convenience, the pruned input list is returned.
 
     :param target: the target list
     :param is_sorted: *target* is ascendingly or descendingly sorted
+    :param key: optional function yielding the value to compare the elements by
     :return: *target* with its duplicate elements removed
     """
     # mark the boundary of the unique segment in the list
-    write_index: int = 1
+    write_index: int = 0
 
     # traverse the list
     if is_sorted:
         # remove duplicates by comparing each element with the last unique one
-        for read_index in range(1, len(target)):
-            if target[read_index] != target[write_index - 1]:
+        last: Any = None
+        for read_index, item in enumerate(target):
+            mark: Any = key(item) if key else item
+            if read_index == 0 or mark != last:
                 # add this element to the unique segment in the list
                 if write_index != read_index:
-                    target[write_index] = target[read_index]
+                    target[write_index] = item
                 write_index += 1
+                last = mark
     else:
-        # remove duplicates by verifying if each element is in the unique segment in the list
-        for read_index in range(1, len(target)):
-            if target[read_index] not in target[:write_index]:
+        # remove duplicates by verifying if each element has already been seen
+        seen: _ListMembership = _ListMembership()
+        for read_index, item in enumerate(target):
+            mark: Any = key(item) if key else item
+            if not seen.contains(item=mark):
                 # add this element to the unique segment in the list
+                seen.add(item=mark)
                 if write_index != read_index:
-                    target[write_index] = target[read_index]
+                    target[write_index] = item
                 write_index += 1
 
     # delete the remaining tail of the list
@@ -390,45 +672,74 @@ def list_prune_duplicates(target: list,
 
 
 def list_prune_in(target: list,
-                  ref: list) -> list:
+                  ref: list,
+                  key: Callable[[Any], Any] = None) -> list:
     """
     Remove from *target* all its elements that are also in *ref*.
 
-    The pruned input list is returned, for convenience.
+    If *key* is provided, the elements of *target* are looked up in *ref* by the value it yields for them
+    (e.g., *key=lambda rec: rec["id"]*, with *ref* holding the *ids* of the records to remove).
+    The order of the remaining elements is maintained. The pruned input list is returned, for convenience.
 
     :param target: the target list
     :param ref: the reference list
+    :param key: optional function yielding the value to look up the elements by
     :return: the target list without the elements also in the reference list
     """
-    # initialize the return variable
-    result: list = target
-
-    removals: list = [item for item in result if item in ref]
-    for item in removals:
-        result.remove(item)
-
-    return result
+    return _list_prune(target=target,
+                       ref=ref,
+                       key=key,
+                       keep_in=False)
 
 
 def list_prune_not_in(target: list,
-                      ref: list) -> list:
+                      ref: list,
+                      key: Callable[[Any], Any] = None) -> list:
     """
     Remove from *target* all of its elements that are not also in *ref*.
 
-    The pruned input list is returned, for convenience.
+    If *key* is provided, the elements of *target* are looked up in *ref* by the value it yields for them
+    (e.g., *key=lambda rec: rec["id"]*, with *ref* holding the *ids* of the records to keep).
+    The order of the remaining elements is maintained. The pruned input list is returned, for convenience.
 
     :param target: the target list
     :param ref: the reference list
+    :param key: optional function yielding the value to look up the elements by
     :return: the target list without the elements not in the reference list
     """
-    # initialize the return variable
-    result: list = target
+    return _list_prune(target=target,
+                       ref=ref,
+                       key=key,
+                       keep_in=True)
 
-    removals: list = [item for item in result if item not in ref]
-    for item in removals:
-        result.remove(item)
 
-    return result
+def _list_prune(target: list,
+                ref: list,
+                key: Callable[[Any], Any] | None,
+                keep_in: bool) -> list:
+    """
+    Remove from *target*, in place, its elements that are in *ref*, or that are not in *ref*, as per *keep_in*.
+
+    :param target: the target list
+    :param ref: the reference list
+    :param key: optional function yielding the value to look up the elements by
+    :param keep_in: whether to keep the elements in *ref* (or else, those not in *ref*)
+    :return: the pruned target list
+    """
+    in_ref: _ListMembership = _ListMembership(source=ref)
+
+    # compact the elements to keep at the head of the list
+    write_index: int = 0
+    for read_index, item in enumerate(target):
+        if in_ref.contains(item=key(item) if key else item) == keep_in:
+            if write_index != read_index:
+                target[write_index] = item
+            write_index += 1
+
+    # delete the remaining tail of the list
+    del target[write_index:]
+
+    return target
 
 
 def list_jsonify(source: list) -> list:
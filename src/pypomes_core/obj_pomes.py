@@ -1,8 +1,9 @@
 import json
 import os
-from enum import IntEnum, StrEnum
+from enum import Enum, IntEnum, StrEnum
 from types import TracebackType
-from typing import Any
+from typing import Any, Final
+from weakref import WeakKeyDictionary
 
 
 class IntEnumUseName(IntEnum):
@@ -20,6 +21,56 @@ class StrEnumUseName(StrEnum):
     """
 
 
+class _EnumIndex:
+    """
+    The lookup maps for the members of an *enum* class.
+
+    Lowercase names and values are mapped to the names of the members, the first member found prevailing
+    for names differing only in case. Members are then obtained with *enum_class[name]*. Holding no reference
+    to the members, and thus to their class, the maps do not prevent the class from being garbage-collected.
+    """
+    __slots__ = ("by_name", "by_value", "names", "values")
+
+    def __init__(self,
+                 enum_class: type[Enum]) -> None:
+        """
+        Build the lookup maps for the members of *enum_class*.
+
+        :param enum_class: the *enum* class
+        """
+        self.by_name: dict[str, str] = {}
+        self.by_value: dict[Any, str] = {}
+        self.names: list[str] = []
+        self.values: list[Any] = []
+        for e in enum_class:
+            self.by_name.setdefault(e.name.lower(), e.name)
+            self.by_value.setdefault(e.value, e.name)
+            self.names.append(e.name)
+            self.values.append(e.value)
+
+
+# the lookup maps, built on demand and held for as long as their enum classes exist
+_ENUM_INDEXES: Final[WeakKeyDictionary[type[Enum], _EnumIndex]] = WeakKeyDictionary()
+
+
+def _enum_index(enum_class: type[Enum]) -> _EnumIndex:
+    """
+    Retrieve the lookup maps for the members of *enum_class*, building them if necessary.
+
+    These maps are shared by all functions resolving names and values into *enum* members.
+    Their lists of names and values must not be modified.
+
+    :param enum_class: the *enum* class
+    :return: the lookup maps
+    """
+    result: _EnumIndex | None = _ENUM_INDEXES.get(enum_class)
+    if result is None:
+        result = _EnumIndex(enum_class=enum_class)
+        _ENUM_INDEXES[enum_class] = result
+
+    return result
+
+
 def obj_is_serializable(obj: Any) -> bool:
     """
     Determine if *obj* is serializable.
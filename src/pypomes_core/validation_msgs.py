@@ -256,6 +256,27 @@ _ERR_MSGS_PT: dict[int, str] = {}
 for key, value in __ERR_MSGS.items():
     _ERR_MSGS_PT[key] = value["pt"]
 
+# the messages split at their placeholders '{}', keyed by error id and language
+_ERR_SEGMENTS: dict[tuple[int, str], tuple[str, ...]] = {}
+
+
+def _compile_msgs(msgs: dict[int, str],
+                  lang: Literal["en", "pt"]) -> None:
+    """
+    Split the coded messages in *msgs* at their placeholders, for language *lang*.
+
+    :param msgs: the coded messages to split
+    :param lang: the reference language
+    """
+    for error_id, msg in msgs.items():
+        _ERR_SEGMENTS[(error_id, lang)] = tuple(msg.split("{}"))
+
+
+_compile_msgs(msgs=_ERR_MSGS_EN,
+              lang="en")
+_compile_msgs(msgs=_ERR_MSGS_PT,
+              lang="pt")
+
 
 def validate_set_msgs(msgs: dict[int, str],
                       lang: Literal["en", "pt"] = "en") -> None:
@@ -265,16 +286,28 @@ def validate_set_msgs(msgs: dict[int, str],
     If applicable, this operation should be performed at the start of the application importing this module,
     before any attempt to read from *_ERR_MSGS_EN* or *_ERR_MSGS_PT*.
 
+    A copy of *msgs* is kept, as the messages are split at their placeholders only once. Thus, later changes
+    to *msgs* itself have no effect, and the messages should be changed through *validate_update_msgs()*.
+
     :param msgs: list of coded messages to set the standard validation messages to
     :param lang: the reference language
     """
     global _ERR_MSGS_EN, _ERR_MSGS_PT
 
+    msgs = dict(msgs)
     match lang:
         case "en":
             _ERR_MSGS_EN = msgs
         case "pt":
             _ERR_MSGS_PT = msgs
+        case _:
+            msgs = {}
+
+    # discard the obsolete split messages, and split the new ones
+    for key in [key for key in _ERR_SEGMENTS if key[1] == lang]:
+        _ERR_SEGMENTS.pop(key)
+    _compile_msgs(msgs=msgs,
+                  lang=lang)
 
 
 def validate_update_msgs(msgs: dict[int, str],
@@ -293,3 +326,9 @@ def validate_update_msgs(msgs: dict[int, str],
             _ERR_MSGS_EN.update(msgs)
         case "pt":
             _ERR_MSGS_PT.update(msgs)
+        case _:
+            msgs = {}
+
+    # split the updated messages
+    _compile_msgs(msgs=msgs,
+                  lang=lang)
@@ -1,5 +1,7 @@
 import re
 import string
+from collections.abc import Callable, Iterable
+from contextlib import suppress
 from datetime import date, datetime, time
 from decimal import Decimal
 from enum import Enum, IntEnum, StrEnum, auto
@@ -7,7 +9,8 @@ from logging import Logger
 from typing import Any, Final, TypeVar
 
 from .datetime_pomes import TZ_LOCAL
-from .env_pomes import APP_PREFIX, env_get_str, env_get_enum
+from .env_pomes import APP_PREFIX, env_get_bool, env_get_str, env_get_enum
+from .validation_msgs import _ERR_SEGMENTS
 from .str_pomes import (
     str_as_list, str_sanitize, str_find_char, str_find_whitespace
 )
@@ -28,6 +31,8 @@ VALIDATION_MSG_LANGUAGE: Final[MsgLang] = env_get_enum(key=f"{APP_PREFIX}_VALIDA
                                                        def_value=MsgLang.EN)
 VALIDATION_MSG_PREFIX: Final[str] = env_get_str(key=f"{APP_PREFIX}_VALIDATION_MSG_PREFIX",
                                                 def_value=APP_PREFIX)
+VALIDATION_LAZY_ERRORS: Final[bool] = env_get_bool(key=f"{APP_PREFIX}_VALIDATION_LAZY_ERRORS",
+                                                   def_value=False)
 CRON_REGEX: Final[re.Pattern] = re.compile(
      r"^"                                                                                   # start of string
      r"((\*|([0-5]?\d)(-([0-5]?\d))?(/\d+)?)(,(\*|([0-5]?\d)(-([0-5]?\d))?(/\d+)?))*)\s+"   # minute
@@ -43,13 +48,75 @@ CRON_REGEX: Final[re.Pattern] = re.compile(
 CRON_EMAIL: Final[re.Pattern] = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
 
 
+class ValidationError:
+    """
+    A validation error, rendered to text only on demand.
+
+    The error is defined by the identification of its message element in the standard messages list,
+    the arguments to format the message with, and the name of the offending attribute, if applicable.
+    Rendering it with *str()* yields the same text as *validate_format_error()* would have.
+
+    If *VALIDATION_LAZY_ERRORS* is set, the validating functions in this module report their errors
+    as instances of this class, instead of as formatted error messages. Either way, the lists of errors
+    may be passed on to *validate_format_errors()*. As *VALIDATION_LAZY_ERRORS* is not set by default,
+    errors are formatted as they are found, unless deferring their rendering is explicitly opted into.
+    """
+    __slots__ = ("args", "attr", "code")
+
+    def __init__(self,
+                 code: int,
+                 args: tuple = (),
+                 attr: str = None) -> None:
+        """
+        Initialize the validation error.
+
+        :param code: the identification of the message element
+        :param args: the arguments to format the error message with
+        :param attr: the name of the offending attribute
+        """
+        self.code: int = code
+        self.args: tuple = args
+        self.attr: str | None = attr
+
+    def render(self,
+               **kwargs: dict[str, Any]) -> str:
+        """
+        Format and return the error message, as done by *validate_format_error()*.
+
+        Optional custom language and prefix may be provided in *kwargs*, as done for *validate_format_error()*.
+
+        :param kwargs: optional keyworded arguments to define language and prefix
+        :return: the formatted error message
+        """
+        return validate_format_error(self.code,
+                                     *self.args,
+                                     *((f"@{self.attr}",) if self.attr is not None else ()),
+                                     **kwargs)
+
+    def __str__(self) -> str:
+        """
+        Format and return the error message, with the default language and prefix.
+
+        :return: the formatted error message
+        """
+        return self.render()
+
+    def __repr__(self) -> str:
+        """
+        Return the representation of the validation error.
+
+        :return: the representation
+        """
+        return f"ValidationError(code={self.code!r}, args={self.args!r}, attr={self.attr!r})"
+
+
 def validate_value(attr: str,
                    value: str | float | Decimal,
                    min_value: int = None,
                    max_value: int = None,
                    values: list = None,
                    ignore_case: bool = False,
-                   required: bool = False) -> str | None:
+                   required: bool = False) -> str | ValidationError | None:
     """
     Validate *value* according to value, range, or membership in *values*, as specified.
 
@@ -60,16 +127,16 @@ def validate_value(attr: str,
     :param values: if provided, requires *val* to be contained therein
     :param ignore_case: specifies whether to ignore capitalization when handling string values
     :param required:  requires *value* to be specified
-    :return: *None* if *value* passes validation, or the corresponding error message otherwise
+    :return: *None* if *value* passes validation, or the corresponding error otherwise
     """
     # initialize the return variable
-    result: str | None = None
+    result: str | ValidationError | None = None
 
     if value is None or value == "":
         if isinstance(required, bool) and required:
             # 121: Required attribute
-            result = validate_format_error(121,
-                                           f"@{attr}")
+            result = _validation_error(121,
+                                       f"@{attr}")
     elif isinstance(values, list):
         val: str | float | Decimal = value
         vals: list = values
@@ -80,56 +147,56 @@ def validate_value(attr: str,
             length: int = len(values)
             if length == 1:
                 # 149: Invalid value {}: must be {}
-                result = validate_format_error(149,
-                                               value,
-                                               values[0],
-                                               f"@{attr}")
+                result = _validation_error(149,
+                                           value,
+                                           values[0],
+                                           f"@{attr}")
             else:
                 # 150: Invalid value {}: must be one of {}
-                result = validate_format_error(150,
-                                               value,
-                                               values[:length],
-                                               f"@{attr}")
+                result = _validation_error(150,
+                                           value,
+                                           values[:length],
+                                           f"@{attr}")
     elif isinstance(value, str):
         length: int = len(value)
         if min_value is not None and max_value == min_value and length != min_value:
             # 146: Invalid value {}: length must be {}
-            result = validate_format_error(146,
-                                           value,
-                                           min_value,
-                                           f"@{attr}")
+            result = _validation_error(146,
+                                       value,
+                                       min_value,
+                                       f"@{attr}")
         elif min_value is not None and length < min_value:
             # 147: Invalid value {}: length shorter than {}
-            result = validate_format_error(147,
-                                           value,
-                                           min_value,
-                                           f"@{attr}")
+            result = _validation_error(147,
+                                       value,
+                                       min_value,
+                                       f"@{attr}")
         elif max_value is not None and max_value < length:
             # 148: Invalid value {}: length longer than {}
-            result = validate_format_error(148,
-                                           value,
-                                           max_value,
-                                           f"@{attr}")
+            result = _validation_error(148,
+                                       value,
+                                       max_value,
+                                       f"@{attr}")
     elif ((min_value is not None and value < min_value) or
           (max_value is not None and value > max_value)):
         if min_value is not None and max_value is not None:
             # 151: Invalid value {}: must be in the range {}
-            result = validate_format_error(151,
-                                           value,
-                                           [min_value, max_value],
-                                           f"@{attr}")
+            result = _validation_error(151,
+                                       value,
+                                       [min_value, max_value],
+                                       f"@{attr}")
         elif min_value is not None:
             # 144: Invalid value {}: must be greater than {}
-            result = validate_format_error(144,
-                                           value,
-                                           min_value,
-                                           f"@{attr}")
+            result = _validation_error(144,
+                                       value,
+                                       min_value,
+                                       f"@{attr}")
         else:
             # 143: Invalid value {}: must be less than {}
-            result = validate_format_error(143,
-                                           value,
-                                           max_value,
-                                           f"@{attr}")
+            result = _validation_error(143,
+                                       value,
+                                       max_value,
+                                       f"@{attr}")
     return result
 
 
@@ -159,7 +226,7 @@ def validate_bool(source: dict[str, Any],
     # initialize the return variable
     result: bool | None = None
 
-    stat: str | None = None
+    stat: str | ValidationError | None = None
     pos: int = attr.rfind(".") + 1
     suffix: str = attr[pos:]
 
@@ -172,8 +239,8 @@ def validate_bool(source: dict[str, Any],
             value = default
         elif required:
             # 121: Required attribute
-            stat = validate_format_error(121,
-                                         f"@{attr}")
+            stat = _validation_error(121,
+                                     f"@{attr}")
     elif isinstance(value, str):
         if value.lower() in ["1", "t", "true"]:
             value = True
@@ -181,10 +248,10 @@ def validate_bool(source: dict[str, Any],
             value = False
         else:
             # 152: Invalid value {}: must be type {}
-            stat = validate_format_error(152,
-                                         value,
-                                         "bool",
-                                         f"@{attr}")
+            stat = _validation_error(152,
+                                     value,
+                                     "bool",
+                                     f"@{attr}")
     # bool is subtype of int
     elif isinstance(value, int) and not isinstance(value, bool):
         if value == 1:
@@ -193,16 +260,16 @@ def validate_bool(source: dict[str, Any],
             value = False
         else:
             # 152: Invalid value {}: must be type {}
-            stat = validate_format_error(152,
-                                         value,
-                                         "bool",
-                                         f"@{attr}")
-    elif not isinstance(value, bool):
-        # 152: Invalid value {}: must be type {}
-        stat = validate_format_error(152,
+            stat = _validation_error(152,
                                      value,
                                      "bool",
                                      f"@{attr}")
+    elif not isinstance(value, bool):
+        # 152: Invalid value {}: must be type {}
+        stat = _validation_error(152,
+                                 value,
+                                 "bool",
+                                 f"@{attr}")
     if stat:
         if logger:
             logger.error(msg=stat)
@@ -242,7 +309,7 @@ def validate_int(source: dict[str, Any],
     # initialize the return variable
     result: int | None = None
 
-    stat: str | None = None
+    stat: str | ValidationError | None = None
     pos: int = attr.rfind(".") + 1
     suffix: str = attr[pos:]
 
@@ -257,10 +324,10 @@ def validate_int(source: dict[str, Any],
     elif value is not None and \
             (isinstance(value, bool) or not isinstance(value, int)):
         # 152: Invalid value {}: must be type {}
-        stat = validate_format_error(152,
-                                     value,
-                                     "int",
-                                     f"@{attr}")
+        stat = _validation_error(152,
+                                 value,
+                                 "int",
+                                 f"@{attr}")
     if not stat:
         stat = validate_value(attr=attr,
                               value=value,
@@ -307,7 +374,7 @@ def validate_decimal(source: dict[str, Any],
     # initialize the return variable
     result: Decimal | None = None
 
-    stat: str | None = None
+    stat: str | ValidationError | None = None
     pos: int = attr.rfind(".") + 1
     suffix: str = attr[pos:]
 
@@ -324,10 +391,10 @@ def validate_decimal(source: dict[str, Any],
     elif isinstance(value, bool) or \
             (value is not None and not isinstance(value, int | float | Decimal)):
         # 152: Invalid value {}: must be type {}
-        stat = validate_format_error(152,
-                                     value,
-                                     "decimal",
-                                     f"@{attr}")
+        stat = _validation_error(152,
+                                 value,
+                                 "decimal",
+                                 f"@{attr}")
     if not stat:
         stat = validate_value(attr=attr,
                               value=value,
@@ -376,7 +443,7 @@ def validate_str(source: dict[str, Any],
     # initialize the return variable
     result: str | None = None
 
-    stat: str | None = None
+    stat: str | ValidationError | None = None
     pos: int = attr.rfind(".") + 1
     suffix: str = attr[pos:]
 
@@ -388,10 +455,10 @@ def validate_str(source: dict[str, Any],
         value = default
     elif value is not None and not isinstance(value, str):
         # 152: Invalid value {}: must be type {}
-        stat = validate_format_error(152,
-                                     value,
-                                     "str",
-                                     f"@{attr}")
+        stat = _validation_error(152,
+                                 value,
+                                 "str",
+                                 f"@{attr}")
     else:
         stat = validate_value(attr=attr,
                               value=value,
@@ -440,7 +507,7 @@ def validate_date(source: dict[str, Any],
     # initialize the return variable
     result: date | None = None
 
-    stat: str | None = None
+    stat: str | ValidationError | None = None
     pos: int = attr.rfind(".") + 1
     suffix: str = attr[pos:]
 
@@ -460,20 +527,20 @@ def validate_date(source: dict[str, Any],
                                 dayfirst=day_first)
         if not result:
             # 141: Invalid value {}
-            stat = validate_format_error(141,
-                                         value,
-                                         f"@{attr}")
+            stat = _validation_error(141,
+                                     value,
+                                     f"@{attr}")
         elif result > datetime.now(tz=TZ_LOCAL).date():
             # 153: Invalid value {}: date is later than the current date
-            stat = validate_format_error(153,
-                                         value,
-                                         f"@{attr}")
+            stat = _validation_error(153,
+                                     value,
+                                     f"@{attr}")
     elif isinstance(default, date):
         result = default
     elif isinstance(required, bool) and required:
         # 121: Required attribute
-        stat = validate_format_error(121,
-                                     f"@{attr}")
+        stat = _validation_error(121,
+                                 f"@{attr}")
     if stat:
         result = None
         if logger:
@@ -513,7 +580,7 @@ def validate_datetime(source: dict[str, Any],
     # initialize the return variable
     result: datetime | None = None
 
-    stat: str | None = None
+    stat: str | ValidationError | None = None
     pos: int = attr.rfind(".") + 1
     suffix: str = attr[pos:]
 
@@ -531,20 +598,20 @@ def validate_datetime(source: dict[str, Any],
                                     dayfirst=day_first)
         if not result:
             # 141: Invalid value {}
-            stat = validate_format_error(141,
-                                         value,
-                                         f"@{attr}")
+            stat = _validation_error(141,
+                                     value,
+                                     f"@{attr}")
         elif result > datetime.now(tz=TZ_LOCAL):
             # 153: Invalid value {}: date is later than the current date
-            stat = validate_format_error(153,
-                                         value,
-                                         f"@{attr}")
+            stat = _validation_error(153,
+                                     value,
+                                     f"@{attr}")
     elif isinstance(default, datetime):
         result = default
     elif isinstance(required, bool) and required:
         # 121: Required attribute
-        stat = validate_format_error(121,
-                                     f"@{attr}")
+        stat = _validation_error(121,
+                                 f"@{attr}")
     if stat:
         if logger:
             logger.error(msg=stat)
@@ -579,10 +646,12 @@ def validate_enum(source: dict[str, Any],
     :param logger: optional logger
     :return: the validated value as an instance of *enum_class*, or *None* if validation failed
     """
-    from .obj_pomes import StrEnumUseName
+    from .obj_pomes import StrEnumUseName, _EnumIndex, _enum_index
     # initialize the return variable
     result: IntEnum | StrEnum | None = None
 
+    # noinspection PyProtectedMember
+    index: _EnumIndex = _enum_index(enum_class=enum_class)
     if issubclass(enum_class, StrEnumUseName):
         pos: int = attr.rfind(".") + 1
         suffix: str = attr[pos:]
@@ -590,9 +659,8 @@ def validate_enum(source: dict[str, Any],
         if isinstance(value, Enum):
             source = source.copy()
             source[attr] = value.name
-        # noinspection PyProtectedMember
         vals: list[str | int | Decimal] = [v.name if isinstance(v, Enum) else v
-                                           for v in (values or enum_class._member_names_)]
+                                           for v in values] if values else index.names
         name: str = validate_str(source=source,
                                  attr=attr,
                                  values=vals,
@@ -601,15 +669,12 @@ def validate_enum(source: dict[str, Any],
                                  required=required,
                                  errors=errors,
                                  logger=logger)
-        if name:
-            for e in enum_class:
-                if e.name.lower() == name.lower():
-                    result = e
-                    break
+        if name and name.lower() in index.by_name:
+            result = enum_class[index.by_name[name.lower()]]
     else:
         value: Any = None
         vals: list[str | int | Decimal] = [v.value if isinstance(v, Enum) else v
-                                           for v in (values or enum_class)]
+                                           for v in values] if values else index.values
         if issubclass(enum_class, StrEnum):
             value: str = validate_str(source=source,
                                       attr=attr,
@@ -627,7 +692,7 @@ def validate_enum(source: dict[str, Any],
                                       errors=errors,
                                       logger=logger)
         if value:
-            result = enum_class(value)
+            result = enum_class[index.by_value[value]] if value in index.by_value else enum_class(value)
 
     return result
 
@@ -665,13 +730,13 @@ def validate_email(source: dict[str, Any],
             result = value
         elif isinstance(errors, list):
             # 141: Invalid value {}
-            errors.append(validate_format_error(141,
-                                                value,
-                                                f"@{attr}"))
+            errors.append(_validation_error(141,
+                                            value,
+                                            f"@{attr}"))
     elif isinstance(required, bool) and required and isinstance(errors, list):
         # 121: Required attribute
-        errors.append(validate_format_error(121,
-                                            f"@{attr}"))
+        errors.append(_validation_error(121,
+                                        f"@{attr}"))
     return result
 
 
@@ -718,13 +783,13 @@ def validate_pwd(source: dict[str, Any],
             result = value
         elif isinstance(errors, list):
             # 237: Value {} does not meet the formation rules
-            errors.append(validate_format_error(237,
-                                                value,
-                                                f"@{attr}"))
+            errors.append(_validation_error(237,
+                                            value,
+                                            f"@{attr}"))
     elif isinstance(required, bool) and required and isinstance(errors, list):
         # 121: Required attribute
-        errors.append(validate_format_error(121,
-                                            f"@{attr}"))
+        errors.append(_validation_error(121,
+                                        f"@{attr}"))
     return result
 
 
@@ -787,13 +852,13 @@ def validate_cron(source: dict[str, Any],
                     result = expr
                 elif isinstance(errors, list):
                     # 213: Invalid CRON expression {}
-                    errors.append(validate_format_error(238,
-                                                        expr,
-                                                        f"@{attr}"))
+                    errors.append(_validation_error(238,
+                                                    expr,
+                                                    f"@{attr}"))
     elif isinstance(required, bool) and required and isinstance(errors, list):
         # 121: Required attribute
-        errors.append(validate_format_error(121,
-                                            f"@{attr}"))
+        errors.append(_validation_error(121,
+                                        f"@{attr}"))
     return result
 
 
@@ -825,7 +890,7 @@ def validate_ints(source: dict[str, Any],
     # initialize the return variable
     result: list[int] | None = None
 
-    stat: str | None = None
+    stat: str | ValidationError | None = None
     pos: int = attr.rfind(".") + 1
     suffix: str = attr[pos:]
 
@@ -842,31 +907,31 @@ def validate_ints(source: dict[str, Any],
                     if (isinstance(value, str) and value.isdigit()) or \
                             (isinstance(value, int) and not isinstance(value, bool)):
                         ints.append(int(value))
-                        stat = validate_value(attr=f"@{attr}[{inx+1}]",
+                        stat = validate_value(attr=f"{attr}[{inx+1}]",
                                               value=int(value),
                                               min_value=min_val,
                                               max_value=max_val)
                     else:
                         # 152: Invalid value {}: must be type {}
-                        stat = validate_format_error(152,
-                                                     value,
-                                                     "int",
-                                                     f"@{attr}[{inx+1}]")
+                        stat = _validation_error(152,
+                                                 value,
+                                                 "int",
+                                                 f"@{attr}[{inx+1}]")
                     if stat:
                         break
             if not stat:
                 result = ints
         else:
             # 152: Invalid value {}: must be type {}
-            stat = validate_format_error(152,
-                                         values,
-                                         "list",
-                                         f"@{attr}")
+            stat = _validation_error(152,
+                                     values,
+                                     "list",
+                                     f"@{attr}")
 
     if isinstance(required, bool) and required and not stat and result is None:
         # 121: Required attribute
-        stat = validate_format_error(121,
-                                     f"@{attr}")
+        stat = _validation_error(121,
+                                 f"@{attr}")
     if stat:
         if logger:
             logger.error(msg=stat)
@@ -903,7 +968,7 @@ def validate_strs(source: dict[str, Any],
     # initialize the return variable
     result: list[str] | None = None
 
-    stat: str | None = None
+    stat: str | ValidationError | None = None
     pos: int = attr.rfind(".") + 1
     suffix: str = attr[pos:]
 
@@ -919,31 +984,31 @@ def validate_strs(source: dict[str, Any],
                 for inx, value in enumerate(values):
                     strs.append(value)
                     if isinstance(value, str):
-                        stat = validate_value(attr=f"@{attr}[{inx+1}]",
+                        stat = validate_value(attr=f"{attr}[{inx+1}]",
                                               value=value,
                                               min_value=min_length,
                                               max_value=max_length)
                     else:
                         # 152: Invalid value {}: must be type {}
-                        stat = validate_format_error(152,
-                                                     value,
-                                                     "str",
-                                                     f"@{attr}[{inx+1}]")
+                        stat = _validation_error(152,
+                                                 value,
+                                                 "str",
+                                                 f"@{attr}[{inx+1}]")
                     if stat:
                         break
             if not stat:
                 result = strs
         else:
             # 152: Invalid value {}: must be type {}
-            stat = validate_format_error(152,
-                                         values,
-                                         "list",
-                                         f"@{attr}")
+            stat = _validation_error(152,
+                                     values,
+                                     "list",
+                                     f"@{attr}")
 
     if required and not stat and result is None:
         # 121: Required attribute
-        stat = validate_format_error(121,
-                                     f"@{attr}")
+        stat = _validation_error(121,
+                                 f"@{attr}")
     if stat:
         if logger:
             logger.error(msg=stat)
@@ -953,6 +1018,311 @@ def validate_strs(source: dict[str, Any],
     return result
 
 
+def validate_bool_column(column: list,
+                         default: bool = None,
+                         required: bool = False) -> tuple[list[bool | None], list[tuple[int, int, tuple]]]:
+    """
+    Validate the boolean values in *column*, as done by *validate_bool()* for each value.
+
+    The errors are reported as tuples *(<row>, <error-id>, <args>)*, where *<row>* is the 0-based position
+    of the offending value in *column*, and *<error-id>* and *<args>* are suitable for formatting the
+    error message with *validate_format_error()* (the attribute's name is not included in *<args>*).
+
+    :param column: the values to be validated
+    :param default: default value, overrides *required*
+    :param required: specifies whether a value must be provided
+    :return: the validated values (*None* for the values failing validation), and the errors
+    """
+    # initialize the return variables
+    result: list[bool | None] = []
+    errors: list[tuple[int, int, tuple]] = []
+
+    for row, value in enumerate(column):
+        error: tuple[int, tuple] | None = None
+        if value is None or value == "":
+            if default is not None:
+                value = default
+            elif required:
+                # 121: Required attribute
+                error = (121, ())
+        elif isinstance(value, str) and value.lower() in _BOOL_STRS:
+            value = _BOOL_STRS[value.lower()]
+        elif isinstance(value, int) and not isinstance(value, bool) and value in (0, 1):
+            value = value == 1
+        elif not isinstance(value, bool):
+            # 152: Invalid value {}: must be type {}
+            error = (152, (value, "bool"))
+        if error:
+            errors.append((row, *error))
+            value = None
+        result.append(value)
+
+    return result, errors
+
+
+def validate_int_column(column: list,
+                        min_val: int = None,
+                        max_val: int = None,
+                        values: list[int] = None,
+                        default: int = None,
+                        required: bool = False) -> tuple[list[int | None], list[tuple[int, int, tuple]]]:
+    """
+    Validate the *int* values in *column*, as done by *validate_int()* for each value.
+
+    The errors are reported as tuples *(<row>, <error-id>, <args>)*, where *<row>* is the 0-based position
+    of the offending value in *column*, and *<error-id>* and *<args>* are suitable for formatting the
+    error message with *validate_format_error()* (the attribute's name is not included in *<args>*).
+
+    :param column: the values to be validated
+    :param min_val: the minimum value accepted
+    :param max_val:  the maximum value accepted
+    :param values: optional list of allowed values
+    :param default: optional default value, overrides *required*
+    :param required: specifies whether a value must be provided
+    :return: the validated values (*None* for the values failing validation), and the errors
+    """
+    # initialize the return variables
+    result: list[int | None] = []
+    errors: list[tuple[int, int, tuple]] = []
+
+    # 'bool' is subtype of 'int'
+    if isinstance(default, bool) or not isinstance(default, int):
+        default = None
+    check: Callable[[Any], tuple[int, tuple] | None] = _column_check(min_value=min_val,
+                                                                     max_value=max_val,
+                                                                     values=values,
+                                                                     ignore_case=False,
+                                                                     required=required)
+    for row, value in enumerate(column):
+        error: tuple[int, tuple] | None = None
+        if value is None:
+            value = default
+        elif isinstance(value, str) and value.isnumeric():
+            value = int(value)
+        elif isinstance(value, bool) or not isinstance(value, int):
+            # 152: Invalid value {}: must be type {}
+            error = (152, (value, "int"))
+        if not error:
+            error = check(value)
+        if error:
+            errors.append((row, *error))
+            value = None
+        result.append(value)
+
+    return result, errors
+
+
+def validate_decimal_column(column: list,
+                            min_val: float = None,
+                            max_val: float = None,
+                            values: list[float | int] = None,
+                            default: float = None,
+                            required: bool = False) -> tuple[list[Decimal | None], list[tuple[int, int, tuple]]]:
+    """
+    Validate the *float* values in *column*, as done by *validate_decimal()* for each value.
+
+    The errors are reported as tuples *(<row>, <error-id>, <args>)*, where *<row>* is the 0-based position
+    of the offending value in *column*, and *<error-id>* and *<args>* are suitable for formatting the
+    error message with *validate_format_error()* (the attribute's name is not included in *<args>*).
+
+    :param column: the values to be validated
+    :param min_val: the minimum value accepted
+    :param max_val:  the maximum value accepted
+    :param values: optional list of allowed values
+    :param default: optional default value, overrides *required*
+    :param required: specifies whether a value must be provided
+    :return: the validated values (*None* for the values failing validation), and the errors
+    """
+    # initialize the return variables
+    result: list[Decimal | None] = []
+    errors: list[tuple[int, int, tuple]] = []
+
+    if isinstance(default, int | float | Decimal):
+        default = Decimal(value=default)
+    else:
+        default = None
+    check: Callable[[Any], tuple[int, tuple] | None] = _column_check(min_value=min_val,
+                                                                     max_value=max_val,
+                                                                     values=values,
+                                                                     ignore_case=False,
+                                                                     required=required)
+    for row, value in enumerate(column):
+        error: tuple[int, tuple] | None = None
+        if value is None:
+            value = default
+        elif (isinstance(value, float) or
+              (isinstance(value, int) and not isinstance(value, bool)) or
+              (isinstance(value, str) and value.replace(".", "", 1).isnumeric())):
+            value = Decimal(value=value)
+        elif not isinstance(value, Decimal):
+            # 152: Invalid value {}: must be type {}
+            error = (152, (value, "decimal"))
+        if not error:
+            error = check(value)
+        if error:
+            errors.append((row, *error))
+            value = None
+        result.append(value)
+
+    return result, errors
+
+
+def validate_str_column(column: list,
+                        min_length: int = None,
+                        max_length: int = None,
+                        values: list[str] = None,
+                        default: str = None,
+                        ignore_case: bool = False,
+                        required: bool = False) -> tuple[list[str | None], list[tuple[int, int, tuple]]]:
+    """
+    Validate the *str* values in *column*, as done by *validate_str()* for each value.
+
+    The errors are reported as tuples *(<row>, <error-id>, <args>)*, where *<row>* is the 0-based position
+    of the offending value in *column*, and *<error-id>* and *<args>* are suitable for formatting the
+    error message with *validate_format_error()* (the attribute's name is not included in *<args>*).
+
+    :param column: the values to be validated
+    :param min_length: optional minimum length accepted
+    :param max_length:  optional maximum length accepted
+    :param values: optional list of allowed values
+    :param default: optional default value, overrides *required*
+    :param ignore_case: specifies whether to ignore capitalization
+    :param required: specifies whether a value must be provided
+    :return: the validated values (*None* for the values failing validation), and the errors
+    """
+    # initialize the return variables
+    result: list[str | None] = []
+    errors: list[tuple[int, int, tuple]] = []
+
+    check: Callable[[Any], tuple[int, tuple] | None] = _column_check(min_value=min_length,
+                                                                     max_value=max_length,
+                                                                     values=values,
+                                                                     ignore_case=ignore_case,
+                                                                     required=required)
+    has_default: bool = isinstance(default, str)
+    for row, value in enumerate(column):
+        error: tuple[int, tuple] | None = None
+        if value is None and has_default:
+            value = default
+        elif value is not None and not isinstance(value, str):
+            # 152: Invalid value {}: must be type {}
+            error = (152, (value, "str"))
+        else:
+            error = check(value)
+        if error:
+            errors.append((row, *error))
+            value = None
+        result.append(value)
+
+    return result, errors
+
+
+def _column_check(min_value: Any,
+                  max_value: Any,
+                  values: list | None,
+                  ignore_case: bool,
+                  required: bool) -> Callable[[Any], tuple[int, tuple] | None]:
+    """
+    Build the check of a value according to value, range, or membership, as done by *validate_value()*.
+
+    All decisions not depending on the value itself are made here, once for the whole column.
+
+    :param min_value: if the value is a string, specifies its minimum length; otherwise, specifies its minimum value
+    :param max_value: if the value is a string, specifies its maximum length; otherwise, specifies its maximum value
+    :param values: if provided, requires the value to be contained therein
+    :param ignore_case: specifies whether to ignore capitalization when handling string values
+    :param required:  requires the value to be specified
+    :return: the check, yielding *None* if the value passes it, or the tuple *(<error-id>, <args>)* otherwise
+    """
+    # 121: Required attribute
+    missing: tuple[int, tuple] | None = (121, ()) if isinstance(required, bool) and required else None
+
+    # select the range check for non-string values
+    if min_value is not None and max_value is not None:
+        # 151: Invalid value {}: must be in the range {}
+        def out_of_range(value: Any) -> tuple[int, tuple] | None:
+            return (151, (value, [min_value, max_value])) if value < min_value or value > max_value else None
+    elif min_value is not None:
+        # 144: Invalid value {}: must be greater than {}
+        def out_of_range(value: Any) -> tuple[int, tuple] | None:
+            return (144, (value, min_value)) if value < min_value else None
+    elif max_value is not None:
+        # 143: Invalid value {}: must be less than {}
+        def out_of_range(value: Any) -> tuple[int, tuple] | None:
+            return (143, (value, max_value)) if value > max_value else None
+    else:
+        def out_of_range(value: Any) -> tuple[int, tuple] | None:  # noqa: ARG001
+            return None
+
+    # select the check
+    if isinstance(values, list):
+        members: set | list = _schema_values(values=values,
+                                             ignore_case=ignore_case)
+        # 149: Invalid value {}: must be {} - 150: Invalid value {}: must be one of {}
+        not_member: tuple[int, Any] = (149, values[0]) if len(values) == 1 else (150, values[:])
+
+        def check(value: Any) -> tuple[int, tuple] | None:
+            # initialize the return variable
+            result: tuple[int, tuple] | None = None
+            if value is None or value == "":
+                result = missing
+            elif (value.lower() if ignore_case and isinstance(value, str) else value) not in members:
+                result = (not_member[0], (value, not_member[1]))
+            return result
+    else:
+        def check(value: Any) -> tuple[int, tuple] | None:
+            # initialize the return variable
+            result: tuple[int, tuple] | None = None
+            if value is None or value == "":
+                result = missing
+            elif isinstance(value, str):
+                length: int = len(value)
+                if min_value is not None and max_value == min_value and length != min_value:
+                    # 146: Invalid value {}: length must be {}
+                    result = (146, (value, min_value))
+                elif min_value is not None and length < min_value:
+                    # 147: Invalid value {}: length shorter than {}
+                    result = (147, (value, min_value))
+                elif max_value is not None and max_value < length:
+                    # 148: Invalid value {}: length longer than {}
+                    result = (148, (value, max_value))
+            else:
+                result = out_of_range(value)
+            return result
+
+    return check
+
+
+def _validation_error(error_id: int,
+                      /,
+                      *args: Any) -> str | ValidationError:
+    """
+    Build the error identified by *error_id*, as a *ValidationError* or as a formatted error message.
+
+    The element in *args* prefixed with *@*, if present as the last element, is taken as the name of the
+    offending attribute. *VALIDATION_LAZY_ERRORS* determines the kind of the error built.
+
+    :param error_id: the identification of the message element
+    :param args: optional arguments to format the error message with
+    :return: the error
+    """
+    # initialize the return variable
+    result: str | ValidationError
+
+    if VALIDATION_LAZY_ERRORS:
+        if args and isinstance(args[-1], str) and args[-1].startswith("@"):
+            result = ValidationError(code=error_id,
+                                     args=args[:-1],
+                                     attr=args[-1][1:])
+        else:
+            result = ValidationError(code=error_id,
+                                     args=args)
+    else:
+        result = validate_format_error(error_id,
+                                       *args)
+    return result
+
+
 def validate_format_error(error_id: int,
                           /,
                           *args: Any,
@@ -984,29 +1354,32 @@ def validate_format_error(error_id: int,
     """
     # obtain definitions for prefix and language
     msg_prefix: str = kwargs.get("msg_prefix") if "msg_prefix" in kwargs else VALIDATION_MSG_PREFIX
-    msg_lang: MsgLang = validate_enum(source=kwargs or {},
-                                      attr="msg_lang",
-                                      enum_class=MsgLang,
-                                      default=VALIDATION_MSG_LANGUAGE)
-    # retrieve the messages list
-    match msg_lang:
-        case MsgLang.EN:
-            from .validation_msgs import _ERR_MSGS_EN
-            err_msgs = _ERR_MSGS_EN
-        case MsgLang.PT:
-            from .validation_msgs import _ERR_MSGS_PT
-            err_msgs = _ERR_MSGS_PT
-        case _:
-            err_msgs = {}
+    msg_lang: MsgLang = VALIDATION_MSG_LANGUAGE
+    if kwargs.get("msg_lang") is not None:
+        msg_lang = validate_enum(source=kwargs,
+                                 attr="msg_lang",
+                                 enum_class=MsgLang,
+                                 default=VALIDATION_MSG_LANGUAGE)
+    # retrieve the message, split at its placeholders
+    segments: tuple[str, ...] = _ERR_SEGMENTS.get((error_id, msg_lang), ("",))
 
     # initialize the return variable
     result: str = ""
     if error_id != 100:
         if msg_prefix:
             result += msg_prefix + str(error_id) + ": "
-        result += err_msgs.get(error_id, "")
 
-    # apply the provided arguments
+        # fill in the placeholders in a single pass, if possible
+        filled: str | None = _fill_segments(head=result,
+                                            segments=segments,
+                                            args=args)
+        if filled is None:
+            result += "{}".join(segments)
+        else:
+            result = filled
+            args = ()
+
+    # apply the remaining arguments
     for arg in args:
         if arg is None:
             pos1: int = result.find(": {}")
@@ -1025,13 +1398,54 @@ def validate_format_error(error_id: int,
     return result
 
 
-def validate_format_errors(errors: list[str],
+def _fill_segments(head: str,
+                   segments: tuple[str, ...],
+                   args: tuple) -> str | None:
+    """
+    Build the error message from *head* and *segments*, as done by *validate_format_error()*.
+
+    The placeholders between *segments* are filled in with *args*, and the elements in *args* prefixed
+    with *@* are appended to the end of the message, all in a single pass. This is not possible if an element
+    in *args* is *None*, if *head* or the text of an element in *args* contains braces, or if the message
+    would be empty.
+
+    :param head: the message prefix and error identification
+    :param segments: the message element, split at its placeholders
+    :param args: the arguments to format the error message with
+    :return: the formatted error message, or *None* if the single pass is not possible
+    """
+    # initialize the return variable
+    result: str | None = None
+
+    if (head or segments != ("",)) and "{" not in head and "}" not in head and \
+       all(arg is not None for arg in args):
+        texts: list[str] = []
+        tail: list[str] = []
+        for arg in args:
+            if isinstance(arg, str) and arg.startswith("@"):
+                tail.append(" " + arg)
+            elif len(texts) < len(segments) - 1:
+                # fill in the next placeholder (surplus arguments are discarded)
+                texts.append(arg if isinstance(arg, str) and arg.find(" ") > 0 else f"'{arg}'")
+        if not any("{" in text or "}" in text for text in texts + tail):
+            parts: list[str] = [head, segments[0]]
+            for text, segment in zip(texts, segments[1:], strict=False):
+                parts.append(text)
+                parts.append(segment)
+            parts.extend("{}" + segment for segment in segments[len(texts) + 1:])
+            result = "".join(parts + tail)
+
+    return result
+
+
+def validate_format_errors(errors: list[str | ValidationError],
                            **kwargs: dict) -> list[dict[str, str]]:
     """
     Build and return a list of *dicts* from the list of errors in *errors*.
 
     Each element in *errors* is encoded as a *dict*.
     This list is typically used in a returning *JSON* string.
+    The components of a *ValidationError* are taken as they are, with no need to parse its formatted text.
 
     Optional custom language and prefix, replacing those defined respectively by the environment variables
     *VALIDATION_MSG_LANGUAGE* and *VALIDATION_MSG_PREFIX*, may be provided in *kwargs*, with the corresponding
@@ -1059,35 +1473,57 @@ def validate_format_errors(errors: list[str],
     # initialize the return variable
     result: list[dict[str, str]] = []
 
-    # extract error code, description, and attribute from text
+    # extract error code, description, and attribute
     for error in errors:
-
-        # locate the last indicator for the attribute
-        pos = error.rfind("@")
-
-        # is there a whitespace in the attribute's name ?
-        if pos > 0 and str_find_whitespace(error[pos:]) > 0:
-            # yes, disregard the attribute
-            pos = -1
-
-        # was the attribute's name found ?
-        if pos == -1:
-            # no
+        # is the error a 'ValidationError' with no whitespace in the attribute's name ?
+        if isinstance(error, ValidationError) and str_find_whitespace(error.attr or "") < 0:
+            # yes, take its components as they are
             out_error: dict[str, str] = {}
-            desc: str = error
+            if error.attr is not None:
+                term: str = "attribute" if msg_lang == MsgLang.EN else "atributo"
+                out_error[term] = error.attr
+            if msg_prefix and error.code != 100:
+                term: str = "code" if msg_lang == MsgLang.EN else "codigo"
+                out_error[term] = f"{msg_prefix}{error.code}"
+            # format the description in the given language
+            desc: str = validate_format_error(error.code,
+                                              *error.args,
+                                              msg_prefix=msg_prefix,
+                                              msg_lang=msg_lang)
+            if msg_prefix and error.code != 100:
+                desc = desc[len(f"{msg_prefix}{error.code}: "):]
         else:
-            # yes
-            term: str = "attribute" if msg_lang == MsgLang.EN else "atributo"
-            out_error: dict[str, str] = {term: error[pos + 1:]}
-            desc: str = error[:pos - 1]
-
-        # does the text contain an error code ?
-        if msg_prefix and desc.startswith(msg_prefix):
-            # yes
-            term: str = "code" if msg_lang == MsgLang.EN else "codigo"
-            pos: int = desc.find(":")
-            out_error[term] = desc[0:pos]
-            desc = desc[pos+2:]
+            # no, extract the components from the text
+            if isinstance(error, ValidationError):
+                error = error.render(msg_prefix=msg_prefix,
+                                     msg_lang=msg_lang)
+
+            # locate the last indicator for the attribute
+            pos = error.rfind("@")
+
+            # is there a whitespace in the attribute's name ?
+            if pos > 0 and str_find_whitespace(error[pos:]) > 0:
+                # yes, disregard the attribute
+                pos = -1
+
+            # was the attribute's name found ?
+            if pos == -1:
+                # no
+                out_error: dict[str, str] = {}
+                desc: str = error
+            else:
+                # yes
+                term: str = "attribute" if msg_lang == MsgLang.EN else "atributo"
+                out_error: dict[str, str] = {term: error[pos + 1:]}
+                desc: str = error[:pos - 1]
+
+            # does the text contain an error code ?
+            if msg_prefix and desc.startswith(msg_prefix):
+                # yes
+                term: str = "code" if msg_lang == MsgLang.EN else "codigo"
+                pos: int = desc.find(":")
+                out_error[term] = desc[0:pos]
+                desc = desc[pos+2:]
 
         term: str = "description" if msg_lang == MsgLang.EN else "descricao"
         out_error[term] = desc
@@ -1096,7 +1532,7 @@ def validate_format_errors(errors: list[str],
     return result
 
 
-def validate_unformat_errors(errors: list[dict[str, str] | str],
+def validate_unformat_errors(errors: list[dict[str, str] | str | ValidationError],
                              **kwargs: dict) -> list[str]:
     """
     Extract and return the list of errors used to build the list of dicts *errors*.
@@ -1125,7 +1561,396 @@ def validate_unformat_errors(errors: list[dict[str, str] | str],
         if isinstance(error, dict):
             desc: str = str_sanitize(error.get(desc) or "''")
             result.append(f"{error.get(name)}: {desc}")
+        elif isinstance(error, ValidationError):
+            result.append(str(error))
         else:
             result.append(error)
 
     return result
+
+
+class ValidationSchema:
+    """
+    A declarative set of validations, compiled once and applied to records (*dicts*) in batch.
+
+    Each attribute in the schema is associated with one of the validating functions in this module,
+    along with its parameters (*source*, *attr*, *errors*, and *logger* excluded), such as in:
+      - {
+      -   "id": (validate_int, {"min_val": 1, "required": True}),
+      -   "name": (validate_str, {"max_length": 60}),
+      -   "birth": validate_date
+      - }
+
+    The attribute suffixes, the sets of allowed values, and the *enum* maps are computed only once,
+    when the schema is built. For *validate_bool()*, *validate_int()*, *validate_decimal()*, *validate_str()*,
+    and *validate_enum()*, values are then checked without invoking the validator, which is invoked only
+    if the check fails, to report the error exactly as it would otherwise. The remaining validators are
+    always invoked.
+    """
+    __slots__ = ("fields",)
+
+    def __init__(self,
+                 fields: dict[str, Callable | tuple[Callable, dict[str, Any]]]) -> None:
+        """
+        Compile the validations in *fields*.
+
+        :param fields: the attributes, mapped to their validators and the validators' parameters
+        """
+        self.fields: tuple[_SchemaField, ...] = tuple(
+            _SchemaField(attr=attr,
+                         validator=spec[0] if isinstance(spec, tuple) else spec,
+                         params=spec[1] if isinstance(spec, tuple) else {})
+            for attr, spec in fields.items()
+        )
+
+    def validate(self,
+                 source: dict[str, Any],
+                 errors: list[str] = None,
+                 logger: Logger = None) -> dict[str, Any]:
+        """
+        Validate the values in *source*, according to the schema.
+
+        :param source: *dict* containing the values to be validated
+        :param errors: incidental error messages (might be a non-empty list)
+        :param logger: optional logger
+        :return: the validated values, keyed by attribute (*None* for the values failing validation)
+        """
+        # initialize the return variable
+        result: dict[str, Any] = {}
+
+        for field in self.fields:
+            value: Any = field.check(source.get(field.suffix))
+            if value is _FALLBACK:
+                # the check failed, or it is not supported for the validator
+                value = field.validator(source=source,
+                                        attr=field.attr,
+                                        errors=errors,
+                                        logger=logger,
+                                        **field.params)
+            result[field.attr] = value
+
+        return result
+
+    def validate_many(self,
+                      sources: Iterable[dict[str, Any]],
+                      errors: list[tuple[int, list[str]]] = None,
+                      logger: Logger = None) -> list[dict[str, Any]]:
+        """
+        Validate the values in each *dict* in *sources*, according to the schema.
+
+        The errors are collected per *dict*, and added to *errors* as tuples *(<row>, <error-messages>)*,
+        where *<row>* is the 0-based position of the offending *dict* in *sources*.
+
+        :param sources: the *dicts* containing the values to be validated
+        :param errors: incidental error messages (might be a non-empty list)
+        :param logger: optional logger
+        :return: the validated values, for each *dict* in *sources*
+        """
+        # initialize the return variable
+        result: list[dict[str, Any]] = []
+
+        row_errors: list[str] = []
+        for row, source in enumerate(sources):
+            result.append(self.validate(source=source,
+                                        errors=row_errors,
+                                        logger=logger))
+            if row_errors:
+                if isinstance(errors, list):
+                    errors.append((row, row_errors))
+                row_errors = []
+
+        return result
+
+
+# marks a value whose validation must be carried out by the validator itself
+_FALLBACK: Final[object] = object()
+
+
+class _SchemaField:
+    """
+    The compiled validation of an attribute in a *ValidationSchema*.
+    """
+    __slots__ = ("attr", "check", "default", "enum_map", "ignore_case", "max_val",
+                 "min_val", "params", "required", "suffix", "validator", "values")
+
+    def __init__(self,
+                 attr: str,
+                 validator: Callable,
+                 params: dict[str, Any]) -> None:
+        """
+        Compile the validation of *attr* with *validator*.
+
+        :param attr: the attribute associated with the value to be validated
+        :param validator: the validating function
+        :param params: the validator's parameters
+        """
+        self.attr: str = attr
+        self.suffix: str = attr[attr.rfind(".") + 1:]
+        self.validator: Callable = validator
+        self.params: dict[str, Any] = params
+        self.default: Any = params.get("default")
+        self.required: Any = params.get("required")
+        self.ignore_case: bool = bool(params.get("ignore_case"))
+        self.min_val: Any = params.get("min_length" if validator is validate_str else "min_val")
+        self.max_val: Any = params.get("max_length" if validator is validate_str else "max_val")
+        self.values: set | list | None = _schema_values(values=params.get("values"),
+                                                        ignore_case=self.ignore_case)
+        self.enum_map: dict[Any, Enum] | None = None
+        self.check: Callable[[Any], Any] = self._check_none
+
+        if validator is validate_bool:
+            self.check = self._check_bool
+        elif validator is validate_int:
+            self.check = self._check_int
+        elif validator is validate_decimal:
+            self.check = self._check_decimal
+        elif validator is validate_str:
+            self.check = self._check_str
+        elif validator is validate_enum:
+            self._compile_enum(enum_class=params.get("enum_class"))
+
+    def _compile_enum(self,
+                      enum_class: type[IntEnum | StrEnum]) -> None:
+        """
+        Compile the validation of an *enum* value as an instance of *enum_class*.
+
+        :param enum_class: the *enum* class to consider
+        """
+        from .obj_pomes import StrEnumUseName, _enum_index
+        values: list | None = self.params.get("values")
+        if not isinstance(self.default, Enum | str | int | None) or \
+           not isinstance(enum_class, type) or not issubclass(enum_class, IntEnum | StrEnum):
+            # not supported
+            pass
+        elif issubclass(enum_class, StrEnumUseName):
+            if isinstance(self.default, Enum):
+                self.default = self.default.name
+            if isinstance(self.default, str | None):
+                self.ignore_case = True
+                # noinspection PyProtectedMember
+                self.values = _schema_values(values=[v.name if isinstance(v, Enum) else v
+                                                     for v in (values or enum_class._member_names_)],
+                                             ignore_case=True)
+                # noinspection PyProtectedMember
+                self.enum_map = {key: enum_class[name]
+                                 for key, name in _enum_index(enum_class=enum_class).by_name.items()}
+                self.check = self._check_enum_name
+        else:
+            if isinstance(self.default, Enum):
+                self.default = self.default.value
+            self.values = _schema_values(values=[v.value if isinstance(v, Enum) else v
+                                                 for v in (values or enum_class)],
+                                         ignore_case=False)
+            # noinspection PyProtectedMember
+            self.enum_map = {key: enum_class[name]
+                             for key, name in _enum_index(enum_class=enum_class).by_value.items()}
+            self.check = self._check_enum_value_str \
+                if issubclass(enum_class, StrEnum) else self._check_enum_value_int
+
+    def _check_none(self,
+                    value: Any) -> Any:  # noqa: ARG002
+        """
+        Defer the validation of *value* to the validator.
+
+        :param value: the value to be validated
+        :return: *_FALLBACK*
+        """
+        return _FALLBACK
+
+    def _check_value(self,
+                     value: Any) -> bool:
+        """
+        Check *value* according to value, range, or membership, as done by *validate_value()*.
+
+        :param value: the value to be checked
+        :return: *True* if *value* passes the check, *False* otherwise
+        """
+        # initialize the return variable
+        result: bool
+
+        if value is None or value == "":
+            result = not self.required
+        elif self.values is not None:
+            result = (value.lower() if self.ignore_case and isinstance(value, str) else value) in self.values
+        elif isinstance(value, str):
+            length: int = len(value)
+            result = not ((self.min_val is not None and length < self.min_val) or
+                          (self.min_val is not None and self.max_val == self.min_val and length != self.min_val) or
+                          (self.max_val is not None and self.max_val < length))
+        else:
+            result = not ((self.min_val is not None and value < self.min_val) or
+                          (self.max_val is not None and value > self.max_val))
+        return result
+
+    def _check_bool(self,
+                    value: Any) -> Any:
+        """
+        Check *value* as done by *validate_bool()*.
+
+        :param value: the value to be validated
+        :return: the validated value, or *_FALLBACK* if the check failed
+        """
+        # initialize the return variable
+        result: Any = _FALLBACK
+
+        if value is None or value == "":
+            if self.default is not None:
+                result = self.default
+            elif not self.required:
+                result = value
+        elif isinstance(value, bool):
+            result = value
+        elif isinstance(value, str):
+            result = _BOOL_STRS.get(value.lower(), _FALLBACK)
+        elif isinstance(value, int) and value in (0, 1):
+            result = value == 1
+
+        return result
+
+    def _check_int(self,
+                   value: Any) -> Any:
+        """
+        Check *value* as done by *validate_int()*.
+
+        :param value: the value to be validated
+        :return: the validated value, or *_FALLBACK* if the check failed
+        """
+        # initialize the return variable
+        result: Any = _FALLBACK
+
+        if value is None and isinstance(self.default, int) and not isinstance(self.default, bool):
+            value = self.default
+        elif isinstance(value, str) and value.isnumeric():
+            value = int(value)
+        if (value is None or (isinstance(value, int) and not isinstance(value, bool))) and \
+           self._check_value(value=value):
+            result = value
+
+        return result
+
+    def _check_decimal(self,
+                       value: Any) -> Any:
+        """
+        Check *value* as done by *validate_decimal()*.
+
+        :param value: the value to be validated
+        :return: the validated value, or *_FALLBACK* if the check failed
+        """
+        # initialize the return variable
+        result: Any = _FALLBACK
+
+        if value is None and isinstance(self.default, int | float | Decimal):
+            value = Decimal(value=self.default)
+        elif (isinstance(value, float) or
+              (isinstance(value, int) and not isinstance(value, bool)) or
+              (isinstance(value, str) and value.replace(".", "", 1).isnumeric())):
+            value = Decimal(value=value)
+        if isinstance(value, Decimal | None) and self._check_value(value=value):
+            result = value
+
+        return result
+
+    def _check_str(self,
+                   value: Any) -> Any:
+        """
+        Check *value* as done by *validate_str()*.
+
+        :param value: the value to be validated
+        :return: the validated value, or *_FALLBACK* if the check failed
+        """
+        # initialize the return variable
+        result: Any = _FALLBACK
+
+        if value is None and isinstance(self.default, str):
+            result = self.default
+        elif isinstance(value, str | None) and self._check_value(value=value):
+            result = value
+
+        return result
+
+    def _check_enum_name(self,
+                         value: Any) -> Any:
+        """
+        Check *value* as done by *validate_enum()*, for *StrEnumUseName* subclasses.
+
+        :param value: the value to be validated
+        :return: the validated value, or *_FALLBACK* if the check failed
+        """
+        # initialize the return variable
+        result: Any = _FALLBACK
+
+        # an 'Enum' instance is validated by its name
+        if not isinstance(value, Enum):
+            name: Any = self._check_str(value=value)
+            if not name:
+                result = None
+            elif name is not _FALLBACK:
+                result = self.enum_map.get(name.lower())
+
+        return result
+
+    def _check_enum_value_str(self,
+                              value: Any) -> Any:
+        """
+        Check *value* as done by *validate_enum()*, for *StrEnum* subclasses.
+
+        :param value: the value to be validated
+        :return: the validated value, or *_FALLBACK* if the check failed
+        """
+        return self._enum_member(value=self._check_str(value=value))
+
+    def _check_enum_value_int(self,
+                              value: Any) -> Any:
+        """
+        Check *value* as done by *validate_enum()*, for *IntEnum* subclasses.
+
+        :param value: the value to be validated
+        :return: the validated value, or *_FALLBACK* if the check failed
+        """
+        return self._enum_member(value=self._check_int(value=value))
+
+    def _enum_member(self,
+                     value: Any) -> Any:
+        """
+        Obtain the *enum* member whose value is *value*.
+
+        :param value: the checked value
+        :return: the *enum* member, *None* if *value* is empty, or *_FALLBACK* if the check failed
+        """
+        # initialize the return variable
+        result: Any = _FALLBACK
+
+        if not value:
+            result = None
+        elif value is not _FALLBACK:
+            result = self.enum_map.get(value, _FALLBACK)
+
+        return result
+
+
+# the string representations of boolean values
+_BOOL_STRS: Final[dict[str, bool]] = {
+    "1": True, "t": True, "true": True,
+    "0": False, "f": False, "false": False
+}
+
+
+def _schema_values(values: list | None,
+                   ignore_case: bool) -> set | list | None:
+    """
+    Prepare the list of allowed values in *values* for membership checks.
+
+    :param values: the list of allowed values
+    :param ignore_case: specifies whether to ignore capitalization
+    :return: the prepared values as a *set*, or as a *list* if they are not hashable, or *None* if not applicable
+    """
+    # initialize the return variable
+    result: set | list | None = None
+
+    if isinstance(values, list):
+        result = [v.lower() if ignore_case and isinstance(v, str) else v for v in values]
+        # some values might not be hashable
+        with suppress(TypeError):
+            result = set(result)
+
+    return result